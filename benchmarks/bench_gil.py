@@ -0,0 +1,186 @@
+# bench_gil.py
+
+"""Measure the cost of releasing the GIL around calls which cannot block.
+
+Usage
+-----
+    python benchmarks/bench_gil.py [--calls N] [--threads T]
+                                   [--host HOST] [--port PORT]
+
+Each case is run by one thread, then by 'T' threads concurrently, and the
+wall clock time per call, in nanoseconds, is printed.  With several threads,
+releasing the GIL around each call also lets the threads take it from each
+other on every call.
+
+    ctypes release  'labs' of the C library called through 'ctypes.CDLL',
+                    which releases the GIL around each call
+    ctypes keep     the same function called through 'ctypes.PyDLL', which
+                    keeps it; the difference is the cost of the release
+                    itself, and needs no 'blpapi' build
+    names           'str()', 'len()' and '==' of a 'Name'
+    options         accessors of a 'SessionOptions'
+    elements        'datatype()', 'numValues()' and 'getValueAsString()' of
+                    the 'securities' of a 'ReferenceDataRequest', which
+                    needs a connection to '--host'
+
+The 'blpapi' cases compare the two builds of the extension:
+
+    python setup.py build_ext --inplace --force
+    python benchmarks/bench_gil.py > keep.txt
+    BLPAPI_RELEASE_GIL_IN_ACCESSORS=1 python setup.py build_ext --inplace \\
+        --force
+    python benchmarks/bench_gil.py > release.txt
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import argparse
+import ctypes
+import os
+import threading
+import time
+
+try:
+    import blpapi
+except ImportError:
+    blpapi = None
+
+
+def run(operation, callsPerOperation, calls, threads):
+    """Return the wall clock time per call, in nanoseconds, of about 'calls'
+    calls made by the specified 'operation', which makes
+    'callsPerOperation' calls, spread over the specified number of
+    'threads'."""
+    iterations = max(1, calls // (callsPerOperation * threads))
+    start = threading.Event()
+
+    def loop():
+        start.wait()
+        for _ in range(iterations):
+            operation()
+
+    workers = [threading.Thread(target=loop) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    begin = time.time()
+    start.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.time() - begin
+    return 1e9 * elapsed / (iterations * callsPerOperation * threads)
+
+
+def ctypesCases():
+    """Return the cases calling the C library through 'ctypes'."""
+    library = "msvcrt" if os.name == "nt" else None
+    released = ctypes.CDLL(library).labs
+    kept = ctypes.PyDLL(library).labs
+    for function in (released, kept):
+        function.argtypes = [ctypes.c_long]
+        function.restype = ctypes.c_long
+    return [("ctypes release", lambda: released(-1), 1),
+            ("ctypes keep", lambda: kept(-1), 1)]
+
+
+def nameCases():
+    """Return the cases calling the accessors of 'Name' and
+    'SessionOptions'."""
+    name = blpapi.Name("lastPrice")
+    options = blpapi.SessionOptions()
+
+    def names():
+        str(name)
+        len(name)
+        return name == "lastPrice"
+
+    def accessors():
+        options.serverHost()
+        options.numStartAttempts()
+        return options.autoRestartOnDisconnection()
+
+    return [("names", names, 3), ("options", accessors, 3)]
+
+
+def elementCases(host, port):
+    """Return the session used by the element cases, and the cases."""
+    options = blpapi.SessionOptions()
+    options.setServerHost(host)
+    options.setServerPort(port)
+    session = blpapi.Session(options)
+    if not session.start() or not session.openService("//blp/refdata"):
+        raise SystemExit("Failed to open //blp/refdata on {0}:{1}".format(
+            host, port))
+    request = session.getService("//blp/refdata").createRequest(
+        "ReferenceDataRequest")
+    count = 100
+    for index in range(count):
+        request.append("securities", "TICKER{0} US Equity".format(index))
+    securities = request.asElement().getElement("securities")
+
+    def elements():
+        securities.datatype()
+        for index in range(securities.numValues()):
+            securities.getValueAsString(index)
+
+    return session, [("elements", elements, count + 2)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=1000000,
+                        help="number of calls per case and thread count")
+    parser.add_argument("--threads", type=int, default=4,
+                        help="number of threads of the concurrent runs")
+    parser.add_argument("--host", help="server of the 'elements' case")
+    parser.add_argument("--port", type=int, default=8194)
+    options = parser.parse_args()
+
+    session = None
+    cases = ctypesCases()
+    if blpapi is None:
+        print("# blpapi is not built, only the ctypes cases are run")
+    else:
+        cases.extend(nameCases())
+        if options.host:
+            session, elements = elementCases(options.host, options.port)
+            cases.extend(elements)
+
+    print("{0:<16} {1:>12} {2:>12}".format(
+        "case", "1 thread", "{0} threads".format(options.threads)))
+    try:
+        for name, operation, callsPerOperation in cases:
+            run(operation, callsPerOperation, options.calls // 10, 1)
+            print("{0:<16} {1:>12.1f} {2:>12.1f}".format(
+                name,
+                run(operation, callsPerOperation, options.calls, 1),
+                run(operation, callsPerOperation, options.calls,
+                    options.threads)))
+    finally:
+        if session is not None:
+            session.stop()
+
+
+if __name__ == "__main__":
+    main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,91 @@
+# bench_import.py
+
+"""Measure the time taken by 'import blpapi' in a new interpreter.
+
+Usage
+-----
+    python benchmarks/bench_import.py [--runs N]
+
+Each case runs in 'N' new interpreters, and the median and minimum wall
+clock times are printed, in milliseconds:
+
+    interpreter   'pass', the start up cost of the interpreter itself
+    import        'import blpapi', which loads the SWIG proxy, the
+                  exceptions and the version only
+    first class   'import blpapi' and the first access of 'blpapi.Session'
+    all names     'import blpapi' and the access of every public name, which
+                  is what 'import blpapi' cost when it imported every module
+
+The difference between 'import' and 'all names' is the time saved by a
+short-lived process which only uses a few classes of the package.  For a
+breakdown by module, run 'python -X importtime -c "import blpapi"'.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import argparse
+import subprocess
+import sys
+import time
+
+CASES = (
+    ("interpreter", "pass"),
+    ("import", "import blpapi"),
+    ("first class", "import blpapi; blpapi.Session"),
+    ("all names", "import blpapi\n"
+                  "for name in dir(blpapi):\n"
+                  "    getattr(blpapi, name)"),
+)
+
+
+def measure(code, runs):
+    """Return the wall clock times, in seconds, of the specified 'runs' of
+    the specified 'code' in a new interpreter."""
+    times = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, "-c", code])
+        times.append(time.time() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=20,
+                        help="number of interpreters per case")
+    options = parser.parse_args()
+
+    # Warm up the file system cache and the bytecode caches.
+    measure(CASES[-1][1], 2)
+
+    print("{0:<12} {1:>10} {2:>10}".format("case", "median ms", "min ms"))
+    for name, code in CASES:
+        times = sorted(measure(code, options.runs))
+        print("{0:<12} {1:>10.1f} {2:>10.1f}".format(
+            name, 1000 * times[len(times) // 2], 1000 * times[0]))
+
+
+if __name__ == "__main__":
+    main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
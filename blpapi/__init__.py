@@ -2,6 +2,9 @@
 
 # pylint: disable=missing-docstring,redefined-builtin,wildcard-import
 
+import importlib as _importlib
+import sys as _sys
+
 try:
     from .internals import CorrelationId
 except ImportError as error:
@@ -10,32 +13,93 @@ except ImportError as error:
     from .debug import debug_load_error
     raise debug_load_error(error)
 
-from .abstractsession import AbstractSession
-from .constant import Constant, ConstantList
-from .datatype import DataType
-from .datetime import FixedOffset
-from .element import Element
-from .event import Event, EventQueue
-from .eventdispatcher import EventDispatcher
-from .eventformatter import EventFormatter
 from .exception import *
-from .identity import Identity
-from .message import Message
-from .name import Name
-from .providersession import ProviderSession, ServiceRegistrationOptions
-from .request import Request
-from .requesttemplate import RequestTemplate
-from .resolutionlist import ResolutionList
-from .schema import SchemaElementDefinition, SchemaStatus, SchemaTypeDefinition
-from .service import Service, Operation
-from .session import Session
-from .sessionoptions import SessionOptions, TlsOptions
-from .subscriptionlist import SubscriptionList
-from .topic import Topic
-from .topiclist import TopicList
-from .zfputil import ZfpUtil
 from .version import __version__, version, cpp_sdk_version, print_version
 
+# The public classes are imported from their modules on first access (PEP
+# 562), so that 'import blpapi' only loads the modules an application uses.
+_LAZY_IMPORTS = {
+    "abstractsession": ("AbstractSession",),
+    "arrowconvert": ("ArrowTableBuilder",),
+    "compiledschema": ("CompiledSchema", "CompiledOperation",
+                       "CompiledElementDefinition", "CompiledTypeDefinition"),
+    "constant": ("Constant", "ConstantList"),
+    "correlationregistry": ("CorrelationRegistry",),
+    "datatype": ("DataType",),
+    "datetime": ("FixedOffset",),
+    "element": ("Element",),
+    "entitlementcache": ("EntitlementCache",),
+    "entitlementfanout": ("EntitlementFanout",),
+    "event": ("Event", "EventQueue"),
+    "eventdispatcher": ("EventDispatcher",),
+    "eventexporter": ("EventExporter",),
+    "eventformatter": ("EventFormatter", "PublishPlan"),
+    "identity": ("Identity",),
+    "intradaybarcache": ("IntradayBarCache",),
+    "memorysampler": ("MemorySampler", "MemorySample"),
+    "message": ("Message",),
+    "metricexporter": ("PrometheusTextfileExporter", "StatsdExporter"),
+    "name": ("Name",),
+    "providersession": ("ProviderSession", "ServiceRegistrationOptions"),
+    "referencedatacache": ("ReferenceDataCache",),
+    "request": ("Request",),
+    "requesttemplate": ("RequestTemplate",),
+    "requesttracer": ("RequestTracer", "RequestTrace"),
+    "resolutionlist": ("ResolutionList",),
+    "schema": ("SchemaElementDefinition", "SchemaStatus",
+               "SchemaTypeDefinition"),
+    "service": ("Service", "Operation"),
+    "session": ("Session",),
+    "sessionmetrics": ("SessionMetrics",),
+    "sessionoptions": ("SessionOptions", "TlsOptions"),
+    "subscriptionlist": ("SubscriptionList",),
+    "subscriptionmanager": ("SubscriptionManager", "SubscriptionChanges"),
+    "subscriptiontracker": ("SubscriptionTracker",),
+    "topic": ("Topic",),
+    "topiclist": ("TopicList",),
+    "topicregistry": ("TopicRegistry",),
+    "zfputil": ("ZfpUtil",),
+}
+
+# The submodules reachable as attributes of the package, which are also
+# imported on first access.
+_SUBMODULES = frozenset(_LAZY_IMPORTS) | frozenset((
+    "compat", "debug", "debug_environment", "diagnosticsutil", "exception",
+    "highresclock", "internals", "logging", "testtools", "utils", "version",
+    "versionhelper"))
+
+_MODULES = dict((name, module)
+                for module, names in _LAZY_IMPORTS.items()
+                for name in names)
+
+__all__ = sorted(set(name for name in globals() if not name.startswith("_"))
+                 | set(_MODULES))
+
+
+def __getattr__(name):
+    """Import and return the public class with the specified 'name', or the
+    submodule with that name.  An 'ImportError' raised by the module is
+    propagated."""
+    module = _MODULES.get(name)
+    if module is not None:
+        value = getattr(_importlib.import_module("." + module, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return _importlib.import_module("." + name, __name__)
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+
+
+if _sys.version_info < (3, 7):
+    # Module level '__getattr__' is not supported, import everything now.
+    for _name in sorted(_MODULES):
+        __getattr__(_name)
+
 __copyright__ = """
 Copyright 2012. Bloomberg Finance L.P.
 
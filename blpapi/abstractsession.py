@@ -22,6 +22,7 @@ from . import exception
 from .exception import _ExceptionUtil
 from .identity import Identity
 from .service import Service
+from .sessionmetrics import SessionMetrics
 from . import internals
 from .internals import CorrelationId
 from . import utils
@@ -84,6 +85,8 @@ class AbstractSession(object):
     ``nextEvent()``.
     """
 
+    __metrics = None
+
     def __init__(self, handle=None):
         """Instantiate an :class:`AbstractSession` with the specified handle.
 
@@ -333,6 +336,34 @@ class AbstractSession(object):
             internals.blpapi_AbstractSession_createIdentity(self.__handle),
             self)
 
+    def enableMetrics(self, name=""):
+        """Start recording the activity of this session.
+
+        Args:
+            name (str): Name of this session in the exported metrics
+
+        Returns:
+            SessionMetrics: The metrics of this session, also returned by
+            :meth:`metrics()`.
+
+        If metrics are already enabled, they are returned unchanged.
+        """
+        if self.__metrics is None:
+            self.__metrics = SessionMetrics(name)
+        return self.__metrics
+
+    def disableMetrics(self):
+        """Stop recording the activity of this session."""
+        self.__metrics = None
+
+    def metrics(self):
+        """
+        Returns:
+            SessionMetrics: The metrics of this session, or ``None`` if they
+            are not enabled.
+        """
+        return self.__metrics
+
     # Protect enumeration constant(s) defined in this class and in classes
     # derived from this class from changes:
 
@@ -0,0 +1,481 @@
+# arrowconvert.py
+
+"""Provide a conversion of response messages to Apache Arrow record batches.
+
+This file defines the function 'elementToRecordBatch', used by
+'Element.toArrow' and 'Message.toArrow', which converts the rows of an array
+of sequences, such as the bars of an 'IntradayBarResponse', to a
+'pyarrow.RecordBatch' with one column per field, and a class
+'ArrowTableBuilder' which collects the record batches of the partial and
+final responses to a request into a chunked 'pyarrow.Table'.
+
+Usage
+-----
+The following snippet shows how the ticks of an 'IntradayTickRequest' are
+collected into a table for an Arrow or Polars based analysis.
+
+    builder = blpapi.ArrowTableBuilder()
+    session.sendRequest(request, eventQueue=eventQueue)
+    while True:
+        event = eventQueue.nextEvent()
+        builder.appendEvent(event)
+        if event.eventType() == blpapi.Event.RESPONSE:
+            break
+    table = builder.table()
+
+The columns are taken from the service schema of the rows, completed by the
+fields found in the rows, such as the fields of a 'HistoricalDataResponse'.
+The values of the numeric, date and time columns are written to typed
+buffers which are handed over to Arrow without being copied, so that a
+response is held in memory once, as its record batch, in addition to the
+message being converted.
+"""
+
+from __future__ import absolute_import
+
+import array
+import datetime as _dt
+import threading
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from .datatype import DataType
+from .event import Event
+from .exception import UnsupportedOperationException
+
+# pylint: disable=useless-object-inheritance,too-many-locals
+
+_EPOCH = _dt.datetime(1970, 1, 1)
+_EPOCH_DATE = _EPOCH.date()
+
+_ROW_PATHS = {
+    "HistoricalDataResponse": (("securityData", "fieldData"),
+                               (("security", ("securityData", "security")),)),
+    "IntradayTickResponse": (("tickData", "tickData"), ()),
+    "IntradayBarResponse": (("barData", "barTickData"), ()),
+}
+"""Path of the array of rows of the known responses, keyed by message type,
+with the name and path of the columns holding a value of the response
+repeated for each row"""
+
+_RESPONSE_EVENT_TYPES = (Event.PARTIAL_RESPONSE, Event.RESPONSE)
+
+
+def _assertAvailable():
+    """Raise 'UnsupportedOperationException' if 'pyarrow' is not
+    available."""
+    if pyarrow is None:
+        raise UnsupportedOperationException(
+            "The 'pyarrow' module is not available.", 0)
+
+
+def _arrowType(datatype):
+    """Return the Arrow type of the values of the specified 'datatype', or
+    'None' if they are not converted."""
+    if datatype in (DataType.FLOAT64, DataType.DECIMAL):
+        return pyarrow.float64()
+    if datatype == DataType.FLOAT32:
+        return pyarrow.float32()
+    if datatype == DataType.INT64:
+        return pyarrow.int64()
+    if datatype in (DataType.INT32, DataType.BYTE):
+        return pyarrow.int32()
+    if datatype == DataType.BOOL:
+        return pyarrow.bool_()
+    if datatype in (DataType.STRING, DataType.ENUMERATION, DataType.CHAR):
+        return pyarrow.string()
+    if datatype == DataType.DATETIME:
+        return pyarrow.timestamp("us", tz="UTC")
+    if datatype == DataType.DATE:
+        return pyarrow.date32()
+    if datatype == DataType.TIME:
+        return pyarrow.time64("us")
+    return None
+
+
+def _timestampValue(element):
+    """Return the number of microseconds since the epoch of the datetime
+    value of the specified 'element'. Values without an offset are in GMT,
+    and values without a date are on the epoch date."""
+    value = element.getValueAsDatetime()
+    if isinstance(value, _dt.datetime):
+        offset = value.utcoffset()
+        value = value.replace(tzinfo=None)
+        if offset:
+            value -= offset
+    elif isinstance(value, _dt.date):
+        value = _dt.datetime(value.year, value.month, value.day)
+    else:
+        value = _dt.datetime.combine(_EPOCH_DATE, value.replace(tzinfo=None))
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _dateValue(element):
+    """Return the number of days since the epoch of the date value of the
+    specified 'element'."""
+    value = element.getValueAsDatetime()
+    if isinstance(value, _dt.datetime):
+        value = value.date()
+    return (value - _EPOCH_DATE).days
+
+
+def _timeValue(element):
+    """Return the number of microseconds since midnight of the time value of
+    the specified 'element'."""
+    value = element.getValueAsDatetime()
+    if isinstance(value, _dt.datetime):
+        value = value.time()
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 \
+        + value.microsecond
+
+
+def _columnKind(arrowType):
+    """Return the 'array' type code of the buffer of the values of the
+    specified 'arrowType', or 'None' if they are kept in a list, and the
+    function returning the value of an element."""
+    # pylint: disable=too-many-return-statements
+    types = pyarrow.types
+    if types.is_float64(arrowType):
+        return "d", lambda element: element.getValueAsFloat()
+    if types.is_float32(arrowType):
+        return "f", lambda element: element.getValueAsFloat()
+    if types.is_int64(arrowType):
+        return "q", lambda element: element.getValueAsInteger()
+    if types.is_int32(arrowType):
+        return "i", lambda element: element.getValueAsInteger()
+    if types.is_timestamp(arrowType) and arrowType.unit == "us":
+        return "q", _timestampValue
+    if types.is_date32(arrowType):
+        return "i", _dateValue
+    if types.is_time64(arrowType) and arrowType.unit == "us":
+        return "q", _timeValue
+    if types.is_boolean(arrowType):
+        return None, lambda element: element.getValueAsBool()
+    if types.is_string(arrowType):
+        return None, lambda element: element.getValueAsString()
+    raise ValueError("unsupported Arrow type: {0}".format(arrowType))
+
+
+class _Column(object):
+    """The values of one column of a record batch being built."""
+
+    def __init__(self, name, arrowType):
+        """Create an empty column with the specified 'name' and
+        'arrowType'."""
+        self.name = name
+        self.type = arrowType
+        self.length = 0
+        self.__typecode, self.__getter = _columnKind(arrowType)
+        self.__values = array.array(self.__typecode) \
+            if self.__typecode else []
+        self.__nulls = []
+
+    def append(self, row, element):
+        """Set the value of the specified 'row', after the rows already
+        appended, to the value of the specified 'element'."""
+        if row < self.length:
+            return
+        if row > self.length:
+            self.appendNulls(row - self.length)
+        self.__values.append(self.__getter(element))
+        self.length += 1
+
+    def fill(self, length, element):
+        """Set the value of the rows after the rows already appended, up to
+        the specified 'length', to the value of the specified 'element'."""
+        count = length - self.length
+        if count > 0:
+            self.__values.extend([self.__getter(element)] * count)
+            self.length = length
+
+    def appendNulls(self, count):
+        """Append the specified 'count' null values."""
+        self.__nulls.extend(range(self.length, self.length + count))
+        self.__values.extend([0 if self.__typecode else None] * count)
+        self.length += count
+
+    def finish(self, length):
+        """Return the Arrow array of the values of this column, padded with
+        nulls to the specified 'length'."""
+        if length > self.length:
+            self.appendNulls(length - self.length)
+        if not self.__typecode:
+            return pyarrow.array(self.__values, type=self.type)
+        validity = None
+        if self.__nulls:
+            bitmap = bytearray(b"\xff" * ((length + 7) // 8))
+            for row in self.__nulls:
+                bitmap[row >> 3] &= ~(1 << (row & 7)) & 0xff
+            validity = pyarrow.py_buffer(bitmap)
+        return pyarrow.Array.from_buffers(
+            self.type,
+            length,
+            [validity, pyarrow.py_buffer(self.__values)],
+            len(self.__nulls))
+
+
+def _path(element, path):
+    """Return the sub-element of the specified 'element' at the specified
+    'path' of names, or 'None' if there is none."""
+    last = len(path) - 1
+    for position, name in enumerate(path):
+        if not element.hasElement(name, True):
+            return None
+        element = element.getElement(name)
+        if position < last and element.isArray():
+            if element.numValues() == 0:
+                return None
+            element = element.getValueAsElement(0)
+    return element
+
+
+def _findRows(element):
+    """Return the first array of sequences found in the specified 'element'
+    by a depth-first search, or 'None' if there is none."""
+    if element.isArray():
+        if element.datatype() == DataType.SEQUENCE:
+            return element
+        return None
+    if element.datatype() == DataType.CHOICE:
+        return _findRows(element.getChoice())
+    if element.datatype() != DataType.SEQUENCE:
+        return None
+    for subElement in element.elements():
+        if not subElement.isNull():
+            rows = _findRows(subElement)
+            if rows is not None:
+                return rows
+    return None
+
+
+def _schemaColumns(rowDefinition):
+    """Return the name and Arrow type of the columns of the fields of the
+    specified 'rowDefinition' holding a single simple value."""
+    result = []
+    for definition in rowDefinition.elementDefinitions():
+        typeDefinition = definition.typeDefinition()
+        if definition.maxValues() != 1 or typeDefinition.isComplexType():
+            continue
+        arrowType = _arrowType(typeDefinition.datatype())
+        if arrowType is not None:
+            result.append((str(definition.name()), arrowType))
+    return result
+
+
+def elementToRecordBatch(element, schemaHint=None):
+    """Convert the rows of the specified ``element`` to a
+    ``pyarrow.RecordBatch``.
+
+    Args:
+        element (Element): Element holding the rows
+        schemaHint (pyarrow.Schema): Columns of the result, or ``None`` to
+            take them from the service schema and the rows
+
+    Returns:
+        pyarrow.RecordBatch: One row per row of ``element``.
+
+    Raises:
+        UnsupportedOperationException: If the ``pyarrow`` module is not
+            available.
+
+    See :meth:`Element.toArrow()` for the rows and columns converted.
+    """
+    _assertAvailable()
+    known = _ROW_PATHS.get(str(element.name()))
+    if known is not None:
+        rowPath, keyPaths = known
+        rows = _path(element, rowPath)
+    else:
+        keyPaths = ()
+        rows = _findRows(element)
+        if rows is None and element.datatype() == DataType.SEQUENCE:
+            rows = element
+
+    columns = []
+    byName = {}
+
+    def addColumn(name, arrowType):
+        column = _Column(name, arrowType)
+        columns.append(column)
+        byName[name] = column
+
+    if schemaHint is not None:
+        for field in schemaHint:
+            addColumn(field.name, field.type)
+    else:
+        for name, _ in keyPaths:
+            addColumn(name, pyarrow.string())
+        if rows is not None:
+            for name, arrowType in _schemaColumns(
+                    rows.elementDefinition().typeDefinition()):
+                addColumn(name, arrowType)
+
+    length = 0
+    if rows is not None:
+        skipped = set()
+        isArray = rows.isArray()
+        length = rows.numValues() if isArray else 1
+        for index in range(length):
+            row = rows.getValueAsElement(index) if isArray else rows
+            for field in row.elements():
+                name = str(field.name())
+                column = byName.get(name)
+                if column is None:
+                    if schemaHint is not None or name in skipped:
+                        continue
+                    arrowType = None if field.isArray() \
+                        else _arrowType(field.datatype())
+                    if arrowType is None:
+                        skipped.add(name)
+                        continue
+                    addColumn(name, arrowType)
+                    column = byName[name]
+                if not field.isNull():
+                    column.append(index, field)
+
+    if length:
+        for name, path in keyPaths:
+            column = byName.get(name)
+            key = _path(element, path)
+            if column is not None and key is not None and not key.isNull():
+                column.fill(length, key)
+
+    return pyarrow.RecordBatch.from_arrays(
+        [column.finish(length) for column in columns],
+        schema=pyarrow.schema([pyarrow.field(column.name, column.type)
+                               for column in columns]))
+
+
+class ArrowTableBuilder(object):
+    """Collect the rows of response messages into a ``pyarrow.Table``.
+
+    Each appended message is converted to a record batch right away, so
+    that the message can be released, and the batches become the chunks of
+    the table, without being copied. The schema of the table is the union
+    of the columns of the batches, in the order they were found; the values
+    of a column missing from a batch are null, and the values of a column
+    whose type differs from its first type are cast to the first type.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self, schemaHint=None):
+        """Create an empty :class:`ArrowTableBuilder`.
+
+        Args:
+            schemaHint (pyarrow.Schema): ``schemaHint`` argument of
+                :meth:`Message.toArrow()` for each appended message
+
+        Raises:
+            UnsupportedOperationException: If the ``pyarrow`` module is not
+                available.
+        """
+        _assertAvailable()
+        self.__schemaHint = schemaHint
+        self.__lock = threading.Lock()
+        self.__batches = []
+        self.__numRows = 0
+
+    def append(self, message):
+        """Convert the specified ``message`` and add its rows.
+
+        Args:
+            message (Message): Response message
+
+        Returns:
+            pyarrow.RecordBatch: The rows of ``message``.
+        """
+        batch = elementToRecordBatch(message.asElement(), self.__schemaHint)
+        if batch.num_rows:
+            with self.__lock:
+                self.__batches.append(batch)
+                self.__numRows += batch.num_rows
+        return batch
+
+    def appendEvent(self, event):
+        """Add the rows of the messages of the specified ``event`` if it is
+        a :attr:`~Event.PARTIAL_RESPONSE` or a :attr:`~Event.RESPONSE`.
+
+        Returns:
+            int: The number of rows added.
+        """
+        if event.eventType() not in _RESPONSE_EVENT_TYPES:
+            return 0
+        return sum(self.append(message).num_rows for message in event)
+
+    def numRows(self):
+        """Return the number of rows added."""
+        with self.__lock:
+            return self.__numRows
+
+    def clear(self):
+        """Remove all the rows added."""
+        with self.__lock:
+            self.__batches = []
+            self.__numRows = 0
+
+    def table(self):
+        """
+        Returns:
+            pyarrow.Table: The rows added, with one chunk per message.
+        """
+        with self.__lock:
+            batches = list(self.__batches)
+        names = []
+        types = {}
+        for batch in batches:
+            for field in batch.schema:
+                if field.name not in types:
+                    names.append(field.name)
+                    types[field.name] = field.type
+        if not batches and self.__schemaHint is not None:
+            schema = self.__schemaHint
+        else:
+            schema = pyarrow.schema([pyarrow.field(name, types[name])
+                                     for name in names])
+        return pyarrow.Table.from_batches(
+            [self.__conform(batch, schema) for batch in batches], schema)
+
+    @staticmethod
+    def __conform(batch, schema):
+        """Return the specified 'batch' with the columns of the specified
+        'schema'."""
+        if batch.schema.equals(schema):
+            return batch
+        arrays = []
+        for field in schema:
+            index = batch.schema.get_field_index(field.name)
+            if index < 0:
+                arrays.append(pyarrow.nulls(batch.num_rows, field.type))
+                continue
+            column = batch.column(index)
+            if not column.type.equals(field.type):
+                column = column.cast(field.type)
+            arrays.append(column)
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
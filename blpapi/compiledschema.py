@@ -0,0 +1,750 @@
+# compiledschema.py
+
+"""Provide an immutable Python copy of the schema of a service.
+
+This file defines these classes:
+    'CompiledSchema' - the schema of a whole service
+    'CompiledOperation' - the schema of an operation of a service
+    'CompiledElementDefinition' - a copy of a 'SchemaElementDefinition'
+    'CompiledTypeDefinition' - a copy of a 'SchemaTypeDefinition'
+
+Walking the schema of a 'Service' through 'SchemaElementDefinition' and
+'SchemaTypeDefinition' objects calls into the C library for every node. A
+'CompiledSchema', obtained from 'Service.compileSchema()', walks the schema
+once and keeps the result in plain Python objects that can be queried at
+dictionary speed, pickled, or saved to and loaded from a JSON file.
+
+Usage
+-----
+    schema = service.compileSchema()
+    schema.save("refdata.schema")
+    ...
+    schema = blpapi.CompiledSchema.load("refdata.schema")
+    bar = schema.getOperation("IntradayBarRequest").requestDefinition()
+    interval = bar.typeDefinition().getElementDefinition("interval")
+    print(interval.minValues(), interval.maxValues())
+
+The accessors of the compiled classes mirror the ones of the corresponding
+'blpapi' classes, except that names are returned as 'str' rather than as
+'Name' objects, and enumerations as tuples of '(name, value)' pairs rather than
+as 'ConstantList' objects.
+"""
+
+from __future__ import absolute_import
+
+import datetime as _dt
+import json
+
+from .compat import tolong
+from .datetime import FixedOffset
+from .exception import NotFoundException, IndexOutOfRangeException
+
+# pylint: disable=useless-object-inheritance,protected-access
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+
+
+class _Frozen(object):
+    """Base class of the compiled schema objects: the attributes can only be
+    set while the object is being built."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' objects are read-only" %
+                             self.__class__.__name__)
+
+    def _set(self, name, value):
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        return dict((slot, getattr(self, slot)) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
+
+class CompiledTypeDefinition(_Frozen):
+    """Immutable copy of a :class:`SchemaTypeDefinition`.
+
+    Provides the same accessors as :class:`SchemaTypeDefinition`, including
+    :meth:`indexOf()` which also resolves the alternate names of the element
+    definitions.
+    """
+
+    __slots__ = ("_name", "_description", "_status", "_datatype",
+                 "_isComplexType", "_isEnumerationType", "_elements",
+                 "_index", "_alternateIndex", "_enumeration")
+
+    def name(self):
+        """
+        Returns:
+            str: The name of this type.
+        """
+        return self._name
+
+    def description(self):
+        """
+        Returns:
+            str: Human readable description of this type.
+        """
+        return self._description
+
+    def status(self):
+        """
+        Returns:
+            int: The deprecation status of this type.
+
+        The possible return values are enumerated in :class:`SchemaStatus`.
+        """
+        return self._status
+
+    def datatype(self):
+        """
+        Returns:
+            int: The data type of this type.
+
+        The possible return values are enumerated in :class:`DataType`.
+        """
+        return self._datatype
+
+    def isComplexType(self):
+        """
+        Returns:
+            bool: ``True`` if this type is a sequence or a choice.
+        """
+        return self._isComplexType
+
+    def isSimpleType(self):
+        """
+        Returns:
+            bool: ``True`` if this type is neither a sequence nor a choice.
+        """
+        return not self._isComplexType
+
+    def isEnumerationType(self):
+        """
+        Returns:
+            bool: ``True`` if this type is an enumeration.
+        """
+        return self._isEnumerationType
+
+    def numElementDefinitions(self):
+        """
+        Returns:
+            int: The number of element definitions of this type.
+        """
+        return len(self._elements)
+
+    def hasElementDefinition(self, name):
+        """
+        Args:
+            name (Name or str): Name of the element
+
+        Returns:
+            bool: ``True`` if this type contains an element with the specified
+            ``name``.
+        """
+        return str(name) in self._index
+
+    def indexOf(self, name):
+        """
+        Args:
+            name (Name or str): Name or alternate name of the element
+
+        Returns:
+            int: Position of the element with the specified ``name``, or
+            ``None`` if there is no such element.
+        """
+        name = str(name)
+        position = self._index.get(name)
+        if position is None:
+            position = self._alternateIndex.get(name)
+        return position
+
+    def getElementDefinition(self, nameOrIndex):
+        """
+        Args:
+            nameOrIndex (Name or str or int): Name or index of the element
+
+        Returns:
+            CompiledElementDefinition: The definition of the specified element.
+
+        Raises:
+            NotFoundException: If ``nameOrIndex`` is a string and
+                ``hasElementDefinition(nameOrIndex) != True``.
+            IndexOutOfRangeException: If ``nameOrIndex`` is an integer and
+                ``nameOrIndex >= numElementDefinitions()``
+        """
+        if not isinstance(nameOrIndex, int):
+            position = self._index.get(str(nameOrIndex))
+            if position is None:
+                errMessage = \
+                    "Name '{0!s}' not a sub-element of element '{1!s}'.".\
+                    format(nameOrIndex, self._name)
+                raise NotFoundException(errMessage, 0)
+            return self._elements[position]
+        if not 0 <= nameOrIndex < len(self._elements):
+            errMessage = "Index '{0}' out of bounds.".format(nameOrIndex)
+            raise IndexOutOfRangeException(errMessage, 0)
+        return self._elements[nameOrIndex]
+
+    def elementDefinitions(self):
+        """
+        Returns:
+            Iterator over the :class:`CompiledElementDefinition`\ s of this
+            type.
+        """
+        return iter(self._elements)
+
+    def enumeration(self):
+        """
+        Returns:
+            tuple: ``(name, value)`` pairs of all the possible values of the
+            enumeration defined by this type, or ``None`` if this type is not
+            an enumeration.
+        """
+        return self._enumeration
+
+
+class CompiledElementDefinition(_Frozen):
+    """Immutable copy of a :class:`SchemaElementDefinition`."""
+
+    __slots__ = ("_name", "_description", "_status", "_typeDefinition",
+                 "_minValues", "_maxValues", "_alternateNames")
+
+    def name(self):
+        """
+        Returns:
+            str: The name of this element.
+        """
+        return self._name
+
+    def description(self):
+        """
+        Returns:
+            str: Human readable description of this element.
+        """
+        return self._description
+
+    def status(self):
+        """
+        Returns:
+            int: The deprecation status of this element.
+
+        The possible return values are enumerated in :class:`SchemaStatus`.
+        """
+        return self._status
+
+    def typeDefinition(self):
+        """
+        Returns:
+            CompiledTypeDefinition: The type of values contained in this
+            element.
+        """
+        return self._typeDefinition
+
+    def minValues(self):
+        """
+        Returns:
+            int: The minimum number of occurences of this element.
+        """
+        return self._minValues
+
+    def maxValues(self):
+        """
+        Returns:
+            int: The maximum number of occurences of this element, equal to
+            :attr:`SchemaElementDefinition.UNBOUNDED` for unbounded arrays.
+        """
+        return self._maxValues
+
+    def alternateNames(self):
+        """
+        Returns:
+            (str): The alternate names of this element.
+        """
+        return self._alternateNames
+
+
+class CompiledOperation(_Frozen):
+    """Immutable copy of the schema of an :class:`Operation`."""
+
+    __slots__ = ("_name", "_description", "_requestDefinition",
+                 "_responseDefinitions")
+
+    def name(self):
+        """
+        Returns:
+            str: The name of this operation.
+        """
+        return self._name
+
+    def description(self):
+        """
+        Returns:
+            str: Human readable description of this operation.
+        """
+        return self._description
+
+    def requestDefinition(self):
+        """
+        Returns:
+            CompiledElementDefinition: The schema of the request of this
+            operation, or ``None`` if it has none.
+        """
+        return self._requestDefinition
+
+    def numResponseDefinitions(self):
+        """
+        Returns:
+            int: The number of the response types of this operation.
+        """
+        return len(self._responseDefinitions)
+
+    def getResponseDefinitionAt(self, position):
+        """
+        Args:
+            position (int): Index of the response type
+
+        Returns:
+            CompiledElementDefinition: The schema of the response at the
+            specified ``position``.
+        """
+        return self._responseDefinitions[position]
+
+    def responseDefinitions(self):
+        """
+        Returns:
+            Iterator over the response types of this operation.
+        """
+        return iter(self._responseDefinitions)
+
+
+class CompiledSchema(_Frozen):
+    """Immutable copy of the whole schema of a :class:`Service`.
+
+    :class:`CompiledSchema` objects are created by
+    :meth:`Service.compileSchema()` or loaded with :meth:`load()`. Type
+    definitions shared by several elements are compiled once and shared in
+    the copy as well.
+    """
+
+    __slots__ = ("_name", "_description", "_operations", "_operationIndex",
+                 "_events", "_eventIndex")
+
+    def name(self):
+        """
+        Returns:
+            str: Name of the service.
+        """
+        return self._name
+
+    def description(self):
+        """
+        Returns:
+            str: Human-readable description of the service.
+        """
+        return self._description
+
+    def hasOperation(self, name):
+        """
+        Returns:
+            bool: ``True`` if the specified ``name`` is an operation of the
+            service.
+        """
+        return str(name) in self._operationIndex
+
+    def getOperation(self, nameOrIndex):
+        """
+        Args:
+            nameOrIndex (Name or str or int): Name or index of the operation
+
+        Returns:
+            CompiledOperation: The specified operation.
+
+        Raises:
+            NotFoundException: If there is no such operation.
+        """
+        if isinstance(nameOrIndex, int):
+            return self._operations[nameOrIndex]
+        position = self._operationIndex.get(str(nameOrIndex))
+        if position is None:
+            raise NotFoundException(
+                "Operation '{0!s}' not found.".format(nameOrIndex), 0)
+        return self._operations[position]
+
+    def numOperations(self):
+        """
+        Returns:
+            int: The number of operations of the service.
+        """
+        return len(self._operations)
+
+    def operations(self):
+        """
+        Returns:
+            Iterator over the :class:`CompiledOperation`\ s of the service.
+        """
+        return iter(self._operations)
+
+    def hasEventDefinition(self, name):
+        """
+        Returns:
+            bool: ``True`` if the specified ``name`` identifies an event of
+            the service.
+        """
+        return str(name) in self._eventIndex
+
+    def getEventDefinition(self, nameOrIndex):
+        """
+        Args:
+            nameOrIndex (Name or str or int): Name or index of the event
+
+        Returns:
+            CompiledElementDefinition: The definition of the specified event.
+
+        Raises:
+            NotFoundException: If there is no such event.
+        """
+        if isinstance(nameOrIndex, int):
+            return self._events[nameOrIndex]
+        position = self._eventIndex.get(str(nameOrIndex))
+        if position is None:
+            raise NotFoundException(
+                "Event '{0!s}' not found.".format(nameOrIndex), 0)
+        return self._events[position]
+
+    def numEventDefinitions(self):
+        """
+        Returns:
+            int: The number of events of the service.
+        """
+        return len(self._events)
+
+    def eventDefinitions(self):
+        """
+        Returns:
+            Iterator over the event definitions of the service.
+        """
+        return iter(self._events)
+
+    def save(self, path):
+        """Save this schema to the file at the specified ``path``.
+
+        The file holds the definitions as JSON data, and no code, so that
+        :meth:`load()` can read files of any origin.
+        """
+        data = json.dumps(_SchemaEncoder().encode(self),
+                          separators=(",", ":"))
+        with open(path, "wb") as stream:
+            stream.write(data.encode("utf-8"))
+
+    @staticmethod
+    def load(path):
+        """
+        Args:
+            path (str): Path of a file written by :meth:`save()`
+
+        Returns:
+            CompiledSchema: The schema saved in the file at ``path``.
+
+        Raises:
+            ValueError: If the file at ``path`` does not hold a schema
+                written by :meth:`save()`.
+        """
+        with open(path, "rb") as stream:
+            data = json.loads(stream.read().decode("utf-8"))
+        return _decodeSchema(data, path)
+
+
+def _setElements(compiled, elements):
+    """Set the specified 'elements' of the specified 'compiled' type
+    definition, and the indexes of their names and alternate names."""
+    alternateIndex = {}
+    for position, element in enumerate(elements):
+        for alternateName in element.alternateNames():
+            alternateIndex.setdefault(alternateName, position)
+    compiled._set("_elements", elements)
+    compiled._set("_index", dict(
+        (element.name(), position)
+        for position, element in enumerate(elements)))
+    compiled._set("_alternateIndex", alternateIndex)
+
+
+_FORMAT = "blpapi.CompiledSchema"
+_VERSION = 1
+
+
+def _encodeValue(value):
+    """Return the JSON representation of the specified enumeration constant
+    'value'."""
+    if isinstance(value, (_dt.datetime, _dt.time)):
+        offset = value.utcoffset()
+        offset = None if offset is None \
+            else offset.days * 1440 + offset.seconds // 60
+        fields = [value.hour, value.minute, value.second, value.microsecond,
+                  offset]
+        if isinstance(value, _dt.time):
+            return {"time": fields}
+        return {"datetime": [value.year, value.month, value.day] + fields}
+    if isinstance(value, _dt.date):
+        return {"date": [value.year, value.month, value.day]}
+    return value
+
+
+def _decodeValue(value):
+    """Return the enumeration constant value of the specified JSON
+    'value'."""
+    if not isinstance(value, dict):
+        return value
+    if "date" in value:
+        return _dt.date(*value["date"])
+    fields = value.get("datetime") or value["time"]
+    offset = fields[-1]
+    tzinfo = None if offset is None else FixedOffset(offset)
+    if "datetime" in value:
+        return _dt.datetime(*fields[:-1], tzinfo=tzinfo)
+    return _dt.time(*fields[:-1], tzinfo=tzinfo)
+
+
+class _SchemaEncoder(object):
+    """Convert a 'CompiledSchema' to JSON data. For internal use.
+
+    The type definitions are listed once, and referred to by their position
+    in that list, so that shared and recursive types are preserved."""
+
+    def __init__(self):
+        self.__types = []
+        self.__typeIndex = {}
+
+    def encode(self, schema):
+        """Return the JSON data of the specified 'schema'."""
+        operations = []
+        for operation in schema.operations():
+            request = operation.requestDefinition()
+            operations.append({
+                "name": operation.name(),
+                "description": operation.description(),
+                "request": None if request is None
+                           else self.encodeElement(request),
+                "responses": [self.encodeElement(definition) for definition
+                              in operation.responseDefinitions()],
+            })
+        events = [self.encodeElement(definition)
+                  for definition in schema.eventDefinitions()]
+        return {
+            "format": _FORMAT,
+            "version": _VERSION,
+            "name": schema.name(),
+            "description": schema.description(),
+            "types": self.__types,
+            "operations": operations,
+            "events": events,
+        }
+
+    def encodeElement(self, definition):
+        """Return the JSON data of the specified element 'definition'."""
+        return {
+            "name": definition.name(),
+            "description": definition.description(),
+            "status": definition.status(),
+            "minValues": definition.minValues(),
+            "maxValues": definition.maxValues(),
+            "alternateNames": list(definition.alternateNames()),
+            "type": self.encodeType(definition.typeDefinition()),
+        }
+
+    def encodeType(self, typeDefinition):
+        """Return the position of the specified 'typeDefinition' in the list
+        of types, adding it if needed."""
+        position = self.__typeIndex.get(id(typeDefinition))
+        if position is not None:
+            return position
+        position = len(self.__types)
+        self.__typeIndex[id(typeDefinition)] = position
+        data = {}
+        self.__types.append(data)
+        enumeration = typeDefinition.enumeration()
+        data.update({
+            "name": typeDefinition.name(),
+            "description": typeDefinition.description(),
+            "status": typeDefinition.status(),
+            "datatype": typeDefinition.datatype(),
+            "isComplexType": typeDefinition.isComplexType(),
+            "isEnumerationType": typeDefinition.isEnumerationType(),
+            "elements": [self.encodeElement(definition) for definition
+                         in typeDefinition.elementDefinitions()],
+            "enumeration": None if enumeration is None else [
+                [name, _encodeValue(value)] for name, value in enumeration],
+        })
+        return position
+
+
+def _decodeSchema(data, path):
+    """Return the 'CompiledSchema' of the specified JSON 'data', read from
+    the file at the specified 'path'."""
+    if not isinstance(data, dict) or data.get("format") != _FORMAT \
+            or data.get("version") != _VERSION:
+        raise ValueError("'%s' does not contain a CompiledSchema" % path)
+
+    types = [CompiledTypeDefinition.__new__(CompiledTypeDefinition)
+             for _ in data["types"]]
+
+    def decodeElement(elementData):
+        compiled = CompiledElementDefinition.__new__(
+            CompiledElementDefinition)
+        compiled._set("_name", str(elementData["name"]))
+        compiled._set("_description", elementData["description"])
+        compiled._set("_status", elementData["status"])
+        compiled._set("_minValues", elementData["minValues"])
+        compiled._set("_maxValues", elementData["maxValues"])
+        compiled._set("_alternateNames", tuple(
+            str(name) for name in elementData["alternateNames"]))
+        compiled._set("_typeDefinition", types[elementData["type"]])
+        return compiled
+
+    for compiled, typeData in zip(types, data["types"]):
+        compiled._set("_name", str(typeData["name"]))
+        compiled._set("_description", typeData["description"])
+        compiled._set("_status", typeData["status"])
+        compiled._set("_datatype", typeData["datatype"])
+        compiled._set("_isComplexType", typeData["isComplexType"])
+        compiled._set("_isEnumerationType", typeData["isEnumerationType"])
+        _setElements(compiled, tuple(decodeElement(elementData)
+                                     for elementData in typeData["elements"]))
+        enumeration = typeData["enumeration"]
+        compiled._set("_enumeration", None if enumeration is None else tuple(
+            (str(name), _decodeValue(value)) for name, value in enumeration))
+
+    operations = []
+    for operationData in data["operations"]:
+        operation = CompiledOperation.__new__(CompiledOperation)
+        operation._set("_name", str(operationData["name"]))
+        operation._set("_description", operationData["description"])
+        request = operationData["request"]
+        operation._set("_requestDefinition",
+                       None if request is None else decodeElement(request))
+        operation._set("_responseDefinitions", tuple(
+            decodeElement(response)
+            for response in operationData["responses"]))
+        operations.append(operation)
+    events = tuple(decodeElement(event) for event in data["events"])
+
+    schema = CompiledSchema.__new__(CompiledSchema)
+    schema._set("_name", str(data["name"]))
+    schema._set("_description", data["description"])
+    schema._set("_operations", tuple(operations))
+    schema._set("_operationIndex", dict(
+        (operation.name(), i) for i, operation in enumerate(operations)))
+    schema._set("_events", events)
+    schema._set("_eventIndex", dict(
+        (event.name(), i) for i, event in enumerate(events)))
+    return schema
+
+
+class _SchemaCompiler(object):
+    """Build a 'CompiledSchema' from a 'Service'. For internal use."""
+
+    def __init__(self):
+        self.__types = {}
+
+    def compileService(self, service):
+        """Return the 'CompiledSchema' of the specified 'service'."""
+        schema = CompiledSchema.__new__(CompiledSchema)
+        schema._set("_name", service.name())
+        schema._set("_description", service.description())
+
+        operations = tuple(self.compileOperation(operation)
+                           for operation in service.operations())
+        schema._set("_operations", operations)
+        schema._set("_operationIndex", dict(
+            (operation.name(), i) for i, operation in enumerate(operations)))
+
+        events = tuple(self.compileElement(definition)
+                       for definition in service.eventDefinitions())
+        schema._set("_events", events)
+        schema._set("_eventIndex", dict(
+            (event.name(), i) for i, event in enumerate(events)))
+        return schema
+
+    def compileOperation(self, operation):
+        """Return the 'CompiledOperation' of the specified 'operation'."""
+        compiled = CompiledOperation.__new__(CompiledOperation)
+        compiled._set("_name", operation.name())
+        compiled._set("_description", operation.description())
+        request = operation.requestDefinition()
+        compiled._set("_requestDefinition",
+                      None if request is None
+                      else self.compileElement(request))
+        compiled._set("_responseDefinitions", tuple(
+            self.compileElement(definition)
+            for definition in operation.responseDefinitions()))
+        return compiled
+
+    def compileElement(self, definition):
+        """Return the 'CompiledElementDefinition' of the specified
+        'definition'."""
+        compiled = CompiledElementDefinition.__new__(
+            CompiledElementDefinition)
+        compiled._set("_name", str(definition.name()))
+        compiled._set("_description", definition.description())
+        compiled._set("_status", definition.status())
+        compiled._set("_minValues", definition.minValues())
+        compiled._set("_maxValues", definition.maxValues())
+        compiled._set("_alternateNames", tuple(
+            str(name) for name in definition.alternateNames()))
+        compiled._set("_typeDefinition",
+                      self.compileType(definition.typeDefinition()))
+        return compiled
+
+    def compileType(self, typeDefinition):
+        """Return the 'CompiledTypeDefinition' of the specified
+        'typeDefinition', compiling it only once per underlying type."""
+        key = tolong(typeDefinition._handle())
+        compiled = self.__types.get(key)
+        if compiled is not None:
+            return compiled
+
+        # Register the type before compiling its elements, so that recursive
+        # types refer to themselves.
+        compiled = CompiledTypeDefinition.__new__(CompiledTypeDefinition)
+        self.__types[key] = compiled
+        compiled._set("_name", str(typeDefinition.name()))
+        compiled._set("_description", typeDefinition.description())
+        compiled._set("_status", typeDefinition.status())
+        compiled._set("_datatype", typeDefinition.datatype())
+        compiled._set("_isComplexType", typeDefinition.isComplexType())
+        compiled._set("_isEnumerationType",
+                      typeDefinition.isEnumerationType())
+
+        _setElements(compiled, tuple(
+            self.compileElement(definition)
+            for definition in typeDefinition.elementDefinitions()))
+
+        constants = typeDefinition.enumeration()
+        compiled._set("_enumeration", None if constants is None else tuple(
+            (str(constant.name()), constant.getValue())
+            for constant in constants))
+        return compiled
+
+__copyright__ = """
+Copyright 2019. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -12,15 +12,21 @@ a representation for lists of such constants
 
 
 
+try:
+    import enum
+except ImportError:
+    enum = None
+
 from .exception import _ExceptionUtil, NotFoundException, \
-    IndexOutOfRangeException
+    IndexOutOfRangeException, UnsupportedOperationException
 from .name import Name, getNamePair
 from .datatype import DataType
 from .datetime import _DatetimeUtil
 from . import utils
 from . import internals
+from .compat import tolong
 
-# pylint: disable=protected-access,old-style-class
+# pylint: disable=protected-access,old-style-class,useless-object-inheritance
 
 class Constant:
     """Represents the value of a schema enumeration constant.
@@ -289,11 +295,111 @@ class ConstantList:
             raise IndexOutOfRangeException(errMessage, 0)
         return Constant(res, self.__sessions)
 
+    def asDict(self):
+        """
+        Returns:
+            dict: Mapping from the name, as a string, of each
+            :class:`Constant` in this list to its value.
+
+        The names and values are read from the library once per list and
+        cached; the returned dict is a copy that the caller may modify.
+        """
+        return dict(_constantTable(self).byName)
+
+    def asEnum(self):
+        """
+        Returns:
+            enum.Enum: An enumeration named after this :class:`ConstantList`,
+            with a member per :class:`Constant`, named after the constant and
+            holding its value.
+
+        The enumeration is created once per list and cached, so the same
+        class is returned by every call. Constants sharing a value are
+        aliases of the first of them.
+
+        Raises:
+            UnsupportedOperationException: If the ``enum`` module is not
+                available.
+        """
+        table = _constantTable(self)
+        if table.enum is None:
+            if enum is None:
+                raise UnsupportedOperationException(
+                    "The 'enum' module is not available.", 0)
+            table.enum = enum.Enum(str(self.name()),
+                                   list(zip(table.names, table.values)))
+        return table.enum
+
+    def nameOf(self, value):
+        """
+        Args:
+            value: Value of a constant
+
+        Returns:
+            str: Name of the first :class:`Constant` in this list with the
+            specified ``value``.
+
+        Raises:
+            NotFoundException: If no :class:`Constant` in this list has the
+                specified ``value``.
+        """
+        table = _constantTable(self)
+        try:
+            return table.byValue[value]
+        except (KeyError, TypeError):
+            errMessage = \
+                "Constant with value '{0!s}' is not found in '{1!s}'.".\
+                format(value, self.name())
+            raise NotFoundException(errMessage, 0)
+
+    def _handle(self):
+        """Return the internal implementation."""
+        return self.__handle
+
     def _sessions(self):
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
 
+class _ConstantTable(object):
+    """Lookup tables from the names of the constants of a list to their
+    values and back. For internal use."""
+
+    __slots__ = ("names", "values", "byName", "byValue", "enum")
+
+    def __init__(self, constantList):
+        constants = list(constantList)
+        self.names = tuple(str(constant.name()) for constant in constants)
+        self.values = tuple(constant.getValue() for constant in constants)
+        self.byName = dict(zip(self.names, self.values))
+        self.byValue = {}
+        for name, value in zip(self.names, self.values):
+            self.byValue.setdefault(value, name)
+        self.enum = None
+
+
+# Constant list handle -> _ConstantTable. Constant lists are owned by the
+# schemas of the services of a session, so the tables are dropped with the
+# type indexes whenever a session is destroyed.
+_CONSTANT_TABLES = {}
+
+
+def _constantTable(constantList):
+    """Return the '_ConstantTable' of the specified 'constantList', building
+    it on first use. For internal use."""
+    key = tolong(constantList._handle())
+    table = _CONSTANT_TABLES.get(key)
+    if table is None:
+        table = _ConstantTable(constantList)
+        _CONSTANT_TABLES[key] = table
+    return table
+
+
+def _clearConstantTables():
+    """Drop all the cached '_ConstantTable's. For internal use."""
+    _CONSTANT_TABLES.clear()
+
+
 _CONSTANT_VALUE_GETTER = {
     DataType.CHAR: Constant.getValueAsString,
     DataType.BYTE: Constant.getValueAsInteger,
@@ -0,0 +1,209 @@
+# correlationregistry.py
+
+"""Provide a routing table from correlation ids to application objects.
+
+This file defines a class 'CorrelationRegistry' which allocates dense integer
+'CorrelationId's for application objects, such as the object handling the
+updates of one instrument, and maps the values of these correlation ids back
+to the objects with a single list index.
+
+Usage
+-----
+The following snippet shows how an application subscribes with correlation
+ids allocated by a 'CorrelationRegistry' and routes each message to the
+object which made the subscription.
+
+    registry = blpapi.CorrelationRegistry()
+    subscriptions = blpapi.SubscriptionList()
+    for instrument in instruments:
+        subscriptions.add(instrument.topic,
+                          instrument.fields,
+                          correlationId=registry.register(instrument))
+    session.subscribe(subscriptions)
+    ...
+    for msg in event:
+        for instrument in registry.route(msg):
+            instrument.onUpdate(msg)
+
+The values of the correlation ids are the indexes of the objects in a list,
+offset by 'base'; the values released by 'unregister' are reused.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from .internals import CorrelationId
+
+# pylint: disable=useless-object-inheritance
+
+
+class CorrelationRegistry(object):
+    """A table of objects indexed by the values of integer correlation ids.
+
+    Registering an object allocates a free value, not below ``base``, and
+    returns an integer :class:`CorrelationId` with that value.
+    Looking up an object by the value of its correlation id is a list index.
+
+    :meth:`route()` and :meth:`get()` only match integer correlation ids with
+    the ``classId`` of the registry, so auto-generated correlation ids, and
+    integer correlation ids of other class ids, are never routed to the
+    registered objects.  An application using other integer correlation ids
+    of the same class id on the same session should give the registry a
+    ``base`` above them.
+
+    Registration is thread safe; lookups do not take a lock.
+    """
+
+    def __init__(self, base=0, classId=0):
+        """Create an empty :class:`CorrelationRegistry`.
+
+        Args:
+            base (int): Value of the first correlation id allocated
+            classId (int): Class id of the correlation ids allocated
+
+        Raises:
+            ValueError: If ``base`` is negative.
+        """
+        if base < 0:
+            raise ValueError("base must not be negative")
+        self.__base = base
+        self.__classId = classId
+        self.__objects = []
+        self.__free = []
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def register(self, obj):
+        """Add the specified ``obj`` to this registry.
+
+        Args:
+            obj: Object to register, which must not be ``None``
+
+        Returns:
+            CorrelationId: The correlation id allocated to ``obj``.
+        """
+        if obj is None:
+            raise ValueError("obj must not be None")
+        with self.__lock:
+            if self.__free:
+                index = self.__free.pop()
+                self.__objects[index] = obj
+            else:
+                index = len(self.__objects)
+                self.__objects.append(obj)
+            self.__size += 1
+        return CorrelationId(index + self.__base, self.__classId)
+
+    def unregister(self, correlationId):
+        """Remove the object registered with the specified ``correlationId``
+        from this registry, and return it.
+
+        Args:
+            correlationId (CorrelationId or int): Correlation id, or its
+                value
+
+        Returns:
+            The object, or ``None`` if ``correlationId`` is not allocated by
+            this registry.
+
+        The value of ``correlationId`` may be allocated again by a later call
+        to :meth:`register()`.
+        """
+        index = self.__index(correlationId)
+        with self.__lock:
+            if index is None or self.__objects[index] is None:
+                return None
+            obj = self.__objects[index]
+            self.__objects[index] = None
+            self.__free.append(index)
+            self.__size -= 1
+            return obj
+
+    def get(self, correlationId):
+        """
+        Args:
+            correlationId (CorrelationId or int): Correlation id, or its
+                value
+
+        Returns:
+            The object registered with ``correlationId``, or ``None``.
+        """
+        index = self.__index(correlationId)
+        return None if index is None else self.__objects[index]
+
+    def __getitem__(self, value):
+        """Return the object registered with the correlation id with the
+        specified integer 'value'.  Raise 'KeyError' if there is none."""
+        try:
+            obj = self.__objects[value - self.__base] \
+                if value >= self.__base else None
+        except (IndexError, TypeError):
+            obj = None
+        if obj is None:
+            raise KeyError(value)
+        return obj
+
+    def route(self, message):
+        """
+        Args:
+            message (Message): Message to route
+
+        Returns:
+            list: The objects registered with the correlation ids of
+            ``message``; correlation ids not allocated by this registry are
+            skipped.
+        """
+        objects = self.__objects
+        base = self.__base
+        classId = self.__classId
+        size = len(objects)
+        result = []
+        for valueType, valueClassId, value in message.correlationIdValues():
+            if valueType != CorrelationId.INT_TYPE or valueClassId != classId:
+                continue
+            index = value - base
+            if 0 <= index < size:
+                obj = objects[index]
+                if obj is not None:
+                    result.append(obj)
+        return result
+
+    def __len__(self):
+        """Return the number of registered objects."""
+        return self.__size
+
+    def __index(self, correlationId):
+        """Return the index of the specified 'correlationId', or 'None' if it
+        cannot have been allocated by this registry."""
+        if isinstance(correlationId, CorrelationId):
+            if correlationId.type() != CorrelationId.INT_TYPE \
+                    or correlationId.classId() != self.__classId:
+                return None
+            correlationId = correlationId.value()
+        index = correlationId - self.__base
+        if 0 <= index < len(self.__objects):
+            return index
+        return None
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -3,9 +3,77 @@ on the blpapi library
 @DESCRIPTION: This component provide a collection of functions which give
 access to various sets of diagnostics information on the 'blpapi' library."""
 
+import gc
+import re
+
 from . import internals
 
+_MEMORY_LINE = re.compile(
+    r"^\s*([A-Za-z][^:=]*?)\s*[:=]\s*(-?[\d,]+(?:\.\d+)?)\s*"
+    r"(bytes|b|kb|k|mb|m|gb|g)?\s*$",
+    re.IGNORECASE)
+
+_MEMORY_SECTION = re.compile(r"^\s*([A-Za-z][^:=]*?)\s*:\s*$")
+
+_MEMORY_UNITS = {
+    "k": 1 << 10, "kb": 1 << 10,
+    "m": 1 << 20, "mb": 1 << 20,
+    "g": 1 << 30, "gb": 1 << 30,
+}
+
 def memoryInfo():
     """Return the string describing the 'blpapi' library's memory usage; the
     format of the string is platform-specific."""
     return internals.blpapi_DiagnosticsUtil_memoryInfo_wrapper()
+
+def memoryStats():
+    """Return a 'dict' of the counters in the string returned by
+    'memoryInfo()', keyed by their labels in lower case with every run of
+    other characters than letters and digits replaced by '_', and prefixed by
+    the label of the section they appear in, if any.  Counters given in
+    kilobytes, megabytes or gigabytes are converted to bytes.  Lines which
+    are not 'label: number' or 'label = number' are ignored, so the result
+    depends on the platform like the string."""
+    return _parseMemoryInfo(memoryInfo())
+
+def liveWrapperCounts():
+    """Return a 'dict' of the number of live objects of each class of the
+    'blpapi' package which wraps a handle of the library, such as 'Message'
+    or 'Element', keyed by class name.  Note that this function walks all
+    the objects tracked by the garbage collector, and is intended to be
+    called periodically rather than on a hot path."""
+    counts = {}
+    for obj in gc.get_objects():
+        cls = type(obj)
+        module = getattr(cls, "__module__", None)
+        if module and module.startswith("blpapi.") \
+                and hasattr(cls, "_handle"):
+            name = cls.__name__
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+def _statName(label):
+    """Return the specified 'label' as a key of 'memoryStats()'."""
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+def _parseMemoryInfo(text):
+    """Return the counters in the specified 'memoryInfo()' 'text'."""
+    stats = {}
+    section = ""
+    for line in text.splitlines():
+        match = _MEMORY_LINE.match(line)
+        if match is None:
+            match = _MEMORY_SECTION.match(line)
+            if match is not None:
+                section = _statName(match.group(1))
+            continue
+        label, number, unit = match.groups()
+        number = number.replace(",", "")
+        value = float(number) if "." in number else int(number)
+        if unit:
+            value *= _MEMORY_UNITS.get(unit.lower(), 1)
+        name = _statName(label)
+        if section:
+            name = section + "_" + name
+        stats[name] = value
+    return stats
@@ -19,6 +19,8 @@ from . import internals
 
 # pylint: disable=useless-object-inheritance,protected-access,too-many-return-statements,too-many-public-methods
 
+_JSON_DATETIME_FORMATS = {"iso": 0, "epochMillis": 1}
+
 class Element(object):
     """Represents an item in a message.
 
@@ -348,6 +350,81 @@ class Element(object):
                                                     level,
                                                     spacesPerLevel)
 
+    def toJSON(self, datetimeFormat="iso", includeNulls=True, fields=None):
+        """Serialize this :class:`Element` to compact JSON.
+
+        Args:
+            datetimeFormat (str): ``"iso"`` to format dates, times and
+                datetimes as ISO 8601 strings, with microseconds and UTC
+                offset when present, or ``"epochMillis"`` to format the
+                values with a date as the number of milliseconds since the
+                epoch (times without a date are still ISO 8601 strings)
+            includeNulls (bool): Whether null sub-elements are included as
+                ``null`` rather than omitted
+            fields ([str or Name]): Names of the sub-elements of this
+                :class:`Element` to include, or ``None`` to include all of
+                them; nested elements are not filtered
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of this
+            :class:`Element`.
+
+        Raises:
+            ValueError: If ``datetimeFormat`` is not supported.
+
+        A sequence is serialized as an object, a choice as an object with
+        the selected alternative as its only member, an array as an array,
+        and a value as a JSON value. Non-finite floating point values are
+        serialized as ``null``. The tree is walked in a single native pass,
+        without creating an :class:`Element` per sub-element.
+        """
+        self.__assertIsValid()
+        if datetimeFormat not in _JSON_DATETIME_FORMATS:
+            raise ValueError(
+                "unsupported datetimeFormat: {0!r}".format(datetimeFormat))
+        if fields is not None:
+            fields = tuple(str(field) for field in fields)
+        return internals.blpapi_Element_toJSONHelper(
+            self.__handle,
+            _JSON_DATETIME_FORMATS[datetimeFormat],
+            1 if includeNulls else 0,
+            fields)
+
+    def toArrow(self, schemaHint=None):
+        """Convert the rows of this :class:`Element` to an Apache Arrow
+        record batch.
+
+        Args:
+            schemaHint (pyarrow.Schema): Columns of the result, or ``None`` to
+                take them from the service schema and the rows
+
+        Returns:
+            pyarrow.RecordBatch: One row per row of this :class:`Element`.
+
+        Raises:
+            UnsupportedOperationException: If the ``pyarrow`` module is not
+                available.
+
+        The rows of a ``HistoricalDataResponse``, ``IntradayTickResponse``
+        or ``IntradayBarResponse`` are the elements of its ``fieldData``,
+        ``tickData`` or ``barTickData`` array respectively, and the rows of a
+        ``HistoricalDataResponse`` have a ``security`` column. Otherwise, the
+        rows are the elements of the first array of sequences found in this
+        :class:`Element`, or this :class:`Element` itself if it is a sequence
+        without one.
+
+        Without ``schemaHint``, there is one column for each field of the
+        rows holding a single value which is neither a sequence nor a
+        choice, with the fields of the schema first; dates are converted to
+        ``date32``, times to ``time64("us")`` and datetimes to
+        ``timestamp("us", tz="UTC")``. With ``schemaHint``, the other fields
+        are ignored, and the values are converted to the type of their
+        column. Missing and null fields are null.
+        """
+        self.__assertIsValid()
+        from .arrowconvert import elementToRecordBatch
+        return elementToRecordBatch(self, schemaHint)
+
     def getElement(self, nameOrIndex):
         """
         Args:
@@ -0,0 +1,204 @@
+# entitlementcache.py
+
+"""Provide a cache of entitlement checks.
+
+This file defines a class 'EntitlementCache' which remembers the result of
+'Identity.hasEntitlements' for each identity, service and set of EIDs, and
+forgets the results of an identity when an 'AUTHORIZATION_STATUS' event
+reports a change of its authorization.
+
+Usage
+-----
+The following snippet shows how a publisher fans a message out to the users
+entitled to it.
+
+    cache = blpapi.EntitlementCache()
+    for user in users:
+        cache.track(user.identity, user.authorizationCorrelationId)
+
+    def processEvent(event, session):
+        if event.eventType() == blpapi.Event.AUTHORIZATION_STATUS:
+            cache.processEvent(event)
+        ...
+
+    eids = msg.getElement("EID").values()
+    for identity in cache.entitled(identities, service, eids):
+        ...
+
+Once the entitlements of an identity for a set of EIDs are known, checking
+them again does not call into the library.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from .compat import tolong
+from .event import Event
+from .utils import get_handle
+
+# pylint: disable=useless-object-inheritance
+
+
+class EntitlementCache(object):
+    """A cache of the results of :meth:`Identity.hasEntitlements()`, keyed
+    by identity, service and set of entitlement ids.
+
+    The cache keeps the identities it holds results for alive until they are
+    removed with :meth:`invalidate()`.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self):
+        """Create an empty :class:`EntitlementCache`."""
+        self.__lock = threading.Lock()
+        self.__results = {}
+        self.__identities = {}
+        self.__correlationIds = {}
+
+    def track(self, identity, correlationId):
+        """Associate the specified ``identity`` with the specified
+        ``correlationId``, used to authorize it, so that
+        :meth:`processEvent()` invalidates the results of ``identity`` only.
+
+        Args:
+            identity (Identity): Authorized identity
+            correlationId (CorrelationId): Correlation id of the
+                authorization request of ``identity``
+        """
+        with self.__lock:
+            self.__correlationIds[correlationId] = identity
+
+    def hasEntitlements(self, identity, service, entitlements):
+        """
+        Args:
+            identity (Identity): Identity to check
+            service (Service): Service to check authorization for
+            entitlements ([int]): EIDs to check authorization for
+
+        Returns:
+            bool: The result of ``identity.hasEntitlements(service,
+            entitlements)``, computed once per identity, service and set of
+            EIDs.
+        """
+        return self.__check(identity,
+                            service,
+                            (service.name(), frozenset(entitlements)))
+
+    def hasEntitlementsMany(self, identity, service, entitlementSets):
+        """
+        Args:
+            identity (Identity): Identity to check
+            service (Service): Service to check authorization for
+            entitlementSets ([[int]]): Sets of EIDs to check authorization
+                for
+
+        Returns:
+            [bool]: The result of :meth:`hasEntitlements()` for each set in
+            ``entitlementSets``; the sets not in the cache are checked with a
+            single :meth:`Identity.hasEntitlementsMany()` call.
+        """
+        serviceName = service.name()
+        keys = [(serviceName, frozenset(entitlements))
+                for entitlements in entitlementSets]
+        results = self.__resultsOf(identity)
+        missing = list(set(key for key in keys if key not in results))
+        if missing:
+            values = identity.hasEntitlementsMany(
+                service, [list(key[1]) for key in missing])
+            results.update(zip(missing, values))
+        return [results[key] for key in keys]
+
+    def entitled(self, identities, service, entitlements):
+        """
+        Args:
+            identities ([Identity]): Identities to check
+            service (Service): Service to check authorization for
+            entitlements ([int]): EIDs to check authorization for
+
+        Returns:
+            [Identity]: The identities in ``identities`` which have the
+            specified ``entitlements`` for ``service``, in order.
+        """
+        key = (service.name(), frozenset(entitlements))
+        return [identity for identity in identities
+                if self.__check(identity, service, key)]
+
+    def invalidate(self, identity=None):
+        """Remove the results of the specified ``identity``, or all results
+        if ``identity`` is ``None``.
+
+        Args:
+            identity (Identity): Identity whose results to remove
+        """
+        with self.__lock:
+            if identity is None:
+                self.__results.clear()
+                self.__identities.clear()
+            else:
+                key = tolong(get_handle(identity))
+                self.__results.pop(key, None)
+                self.__identities.pop(key, None)
+
+    def processEvent(self, event):
+        """Invalidate the results affected by the specified ``event``.
+
+        Args:
+            event (Event): Event received by the session
+
+        Events other than :attr:`~Event.AUTHORIZATION_STATUS` are ignored.
+        A message whose correlation id was passed to :meth:`track()`
+        invalidates the results of the associated identity; any other
+        message invalidates all the results.
+        """
+        if event.eventType() != Event.AUTHORIZATION_STATUS:
+            return
+        for msg in event:
+            for correlationId in msg.correlationIds():
+                with self.__lock:
+                    identity = self.__correlationIds.get(correlationId)
+                self.invalidate(identity)
+
+    def __check(self, identity, service, key):
+        """Return the cached result of the specified 'identity' for the
+        specified '(serviceName, eids)' 'key', checking it with the specified
+        'service' on a miss."""
+        results = self.__resultsOf(identity)
+        result = results.get(key)
+        if result is None:
+            result = identity.hasEntitlements(service, list(key[1]))
+            results[key] = result
+        return result
+
+    def __resultsOf(self, identity):
+        """Return the dict of the results of the specified 'identity'."""
+        key = tolong(get_handle(identity))
+        with self.__lock:
+            results = self.__results.get(key)
+            if results is None:
+                results = self.__results[key] = {}
+                self.__identities[key] = identity
+            return results
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
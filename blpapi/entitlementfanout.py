@@ -0,0 +1,297 @@
+# entitlementfanout.py
+
+"""Provide entitlement filtering for the redistribution of messages.
+
+This file defines a class 'EntitlementFanout' which keeps, for each
+entitlement id (EID) seen by a redistributing application, the set of its
+subscribers entitled to that EID as a bitset, and computes the subscribers
+allowed to see a message by intersecting the bitsets of the message's EIDs.
+
+Usage
+-----
+The following snippet shows how a redistributing application forwards each
+message of a service only to the downstream users entitled to it.
+
+    fanout = blpapi.EntitlementFanout(service)
+    for user in users:
+        fanout.addSubscriber(user, user.identity,
+                             user.authorizationCorrelationId)
+
+    def processEvent(event, session):
+        if event.eventType() == blpapi.Event.AUTHORIZATION_STATUS:
+            fanout.processEvent(event)
+        elif event.eventType() == blpapi.Event.SUBSCRIPTION_DATA:
+            for msg in event:
+                eids = msg.getElement("EID").values()
+                for user in fanout.subscribers(eids):
+                    user.send(msg)
+
+The entitlements of the subscribers are checked with the library once per
+subscriber for each batch of new EIDs and when their authorization changes;
+filtering a message only combines integers, under the lock of the fanout.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from .event import Event
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+
+class EntitlementFanout(object):
+    """The subscribers, each with an :class:`Identity`, entitled to the
+    messages of one :class:`Service`.
+
+    Each subscriber is allocated a bit. The subscribers authorized for the
+    service, and the subscribers entitled to each known EID, are held as
+    bitsets, so that the subscribers entitled to a list of EIDs are the
+    intersection of the bitsets of these EIDs with the bitset of the service.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self, service):
+        """Create an :class:`EntitlementFanout` for the messages of the
+        specified ``service``, with no subscribers.
+
+        Args:
+            service (Service): Service whose messages are redistributed
+        """
+        self.__service = service
+        self.__lock = threading.Lock()
+        self.__bits = {}
+        self.__subscribers = []
+        self.__identities = []
+        self.__correlationIds = {}
+        self.__free = []
+        self.__authorized = 0
+        self.__eids = {}
+
+    def addSubscriber(self, subscriber, identity, correlationId=None):
+        """Add the specified ``subscriber``, whose entitlements are those of
+        the specified ``identity``.
+
+        Args:
+            subscriber: Hashable object returned by :meth:`subscribers()`
+            identity (Identity): Authorized identity of ``subscriber``
+            correlationId (CorrelationId): Correlation id of the
+                authorization request of ``identity``, used by
+                :meth:`processEvent()`
+
+        Adding a subscriber which is already present replaces its identity.
+        """
+        with self.__lock:
+            bit = self.__bits.get(subscriber)
+            if bit is None:
+                if self.__free:
+                    bit = self.__free.pop()
+                    self.__subscribers[bit] = subscriber
+                    self.__identities[bit] = identity
+                else:
+                    bit = len(self.__subscribers)
+                    self.__subscribers.append(subscriber)
+                    self.__identities.append(identity)
+                self.__bits[subscriber] = bit
+            else:
+                self.__identities[bit] = identity
+            if correlationId is not None:
+                self.__correlationIds[correlationId] = subscriber
+            self.__refresh(bit)
+
+    def removeSubscriber(self, subscriber):
+        """Remove the specified ``subscriber``.
+
+        Returns:
+            bool: ``True`` if ``subscriber`` was present.
+        """
+        with self.__lock:
+            bit = self.__bits.pop(subscriber, None)
+            if bit is None:
+                return False
+            self.__clear(bit)
+            self.__subscribers[bit] = None
+            self.__identities[bit] = None
+            for correlationId, other in list(self.__correlationIds.items()):
+                if other == subscriber:
+                    del self.__correlationIds[correlationId]
+            self.__free.append(bit)
+            return True
+
+    def refresh(self, subscriber=None):
+        """Check again the entitlements of the specified ``subscriber``, or
+        of all subscribers if ``subscriber`` is ``None``.
+
+        Args:
+            subscriber: Subscriber to check
+        """
+        with self.__lock:
+            if subscriber is None:
+                bits = self.__bits.values()
+            else:
+                bits = [self.__bits[subscriber]] \
+                    if subscriber in self.__bits else []
+            for bit in list(bits):
+                self.__refresh(bit)
+
+    def processEvent(self, event):
+        """Update the entitlements of the subscribers from the specified
+        ``event``.
+
+        Args:
+            event (Event): Event received by the session
+
+        Events other than :attr:`~Event.AUTHORIZATION_STATUS` are ignored.
+        A message whose correlation id was passed to :meth:`addSubscriber()`
+        refreshes the entitlements of that subscriber; any other message
+        refreshes all subscribers.
+        """
+        if event.eventType() != Event.AUTHORIZATION_STATUS:
+            return
+        for msg in event:
+            for correlationId in msg.correlationIds():
+                with self.__lock:
+                    subscriber = self.__correlationIds.get(correlationId)
+                self.refresh(subscriber)
+
+    def entitledMask(self, eids):
+        """
+        Args:
+            eids ([int]): EIDs of a message
+
+        Returns:
+            int: The bitset of the subscribers authorized for the service and
+            entitled to every EID in ``eids``.
+
+        The bit of a removed subscriber is reused by the next added one, so
+        the bits of the result only identify subscribers until the next
+        call to :meth:`removeSubscriber()`; :meth:`subscribers()` maps them
+        to the subscribers atomically.
+        """
+        with self.__lock:
+            return self.__mask(eids)
+
+    def subscribers(self, eids):
+        """
+        Args:
+            eids ([int]): EIDs of a message
+
+        Returns:
+            list: The subscribers authorized for the service and entitled to
+            every EID in ``eids``, in the order of their bits.
+        """
+        result = []
+        with self.__lock:
+            mask = self.__mask(eids)
+            subscribers = self.__subscribers
+            while mask:
+                lowest = mask & -mask
+                result.append(subscribers[lowest.bit_length() - 1])
+                mask ^= lowest
+        return result
+
+    def __len__(self):
+        """Return the number of subscribers."""
+        with self.__lock:
+            return len(self.__bits)
+
+    def __contains__(self, subscriber):
+        """Return ``True`` if the specified ``subscriber`` is present."""
+        with self.__lock:
+            return subscriber in self.__bits
+
+    def __mask(self, eids):
+        """Return the bitset of the subscribers authorized for the service
+        and entitled to every EID in the specified 'eids'.  The lock must be
+        held, so that the bits are those of the current subscribers."""
+        eidMasks = self.__eids
+        mask = self.__authorized
+        unknown = None
+        for eid in eids:
+            eidMask = eidMasks.get(eid)
+            if eidMask is None:
+                if unknown is None:
+                    unknown = []
+                unknown.append(eid)
+            else:
+                mask &= eidMask
+        if unknown:
+            self.__learn(unknown)
+            for eid in unknown:
+                mask &= eidMasks[eid]
+        return mask
+
+    def __learn(self, eids):
+        """Compute the bitsets of the specified 'eids' which are not known
+        yet, with one check per subscriber."""
+        eids = [eid for eid in set(eids) if eid not in self.__eids]
+        if not eids:
+            return
+        masks = dict.fromkeys(eids, 0)
+        for bit in self.__bits.values():
+            if not self.__authorized >> bit & 1:
+                continue
+            failed = self.__failed(bit, eids)
+            for eid in eids:
+                if eid not in failed:
+                    masks[eid] |= 1 << bit
+        self.__eids.update(masks)
+
+    def __refresh(self, bit):
+        """Check again the authorization and every known EID of the
+        subscriber with the specified 'bit'."""
+        self.__clear(bit)
+        identity = self.__identities[bit]
+        if not identity.isAuthorized(self.__service):
+            return
+        flag = 1 << bit
+        self.__authorized |= flag
+        eids = list(self.__eids)
+        failed = self.__failed(bit, eids) if eids else ()
+        for eid in eids:
+            if eid not in failed:
+                self.__eids[eid] |= flag
+
+    def __clear(self, bit):
+        """Remove the subscriber with the specified 'bit' from all the
+        bitsets."""
+        flag = ~(1 << bit)
+        self.__authorized &= flag
+        for eid in self.__eids:
+            self.__eids[eid] &= flag
+
+    def __failed(self, bit, eids):
+        """Return the set of the specified 'eids' which the subscriber with
+        the specified 'bit' is not entitled to."""
+        identity = self.__identities[bit]
+        entitled, failed = identity.getFailedEntitlements(self.__service,
+                                                          eids)
+        if entitled:
+            return ()
+        if not failed:
+            failed = [eid for eid in eids
+                      if not identity.hasEntitlements(self.__service, [eid])]
+        return frozenset(failed)
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -220,8 +220,16 @@ class EventQueue(object):
         :class:`Event` is available within the specified ``timeout`` an
         :class:`Event` with type of :attr:`~Event.TIMEOUT` will be returned.
         """
+        sessions = self._getSessions()
+        allMetrics = [session.metrics() for session in sessions]
+        allMetrics = [metrics for metrics in allMetrics if metrics is not None]
+        if allMetrics:
+            start = allMetrics[0].clock()
         res = internals.blpapi_EventQueue_nextEvent(self.__handle, timeout)
-        return Event(res, self._getSessions())
+        event = Event(res, sessions)
+        for metrics in allMetrics:
+            metrics.recordNextEvent(event.eventType(), start)
+        return event
 
     def tryNextEvent(self):
         """
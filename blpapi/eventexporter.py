@@ -0,0 +1,345 @@
+# eventexporter.py
+
+"""Provide a streaming exporter of events to files and sockets.
+
+This file defines a class 'EventExporter' which serializes the messages of
+the events passed to it, with 'Message.toJSON', and writes them to a file or
+a socket from a background thread, either as newline delimited JSON (NDJSON)
+or as length-prefixed frames.
+
+Usage
+-----
+The following snippet shows how a subscriber tees its subscription data to a
+file read by a Kafka producer, without slowing its event handler down.
+
+    exporter = blpapi.EventExporter("/var/spool/blpapi/ticks.ndjson")
+
+    def processEvent(event, session):
+        if event.eventType() == blpapi.Event.SUBSCRIPTION_DATA:
+            exporter.exportEvent(event)
+        ...
+
+    ...
+    exporter.close()
+    print(exporter.stats())
+
+Each message is serialized by the calling thread, which releases the
+message right away, and queued; the writer thread writes all the queued
+records with a single call.  When more than 'maxPendingBytes' are queued,
+the records of further events are dropped and counted, unless 'block' is
+'True', in which case the calling thread waits for the writer.
+"""
+
+from __future__ import absolute_import
+
+import io
+import json
+import socket
+import struct
+import threading
+import time
+
+from .event import Event
+from .internals import CorrelationId
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+# pylint: disable=too-many-arguments
+
+_EVENT_TYPE_NAMES = dict((value, name)
+                         for name, value in vars(Event).items()
+                         if name.isupper() and isinstance(value, int))
+
+_INTEGER_CORRELATION_TYPES = (CorrelationId.INT_TYPE,
+                              CorrelationId.AUTOGEN_TYPE)
+
+_LENGTH = struct.Struct(">I")
+
+
+class EventExporter(object):
+    """Serialize events to a file or a socket from a writer thread.
+
+    Each message is exported as a JSON object with the members
+    ``eventType``, ``messageType``, ``topic`` (if the message has one),
+    ``correlationIds`` (the values of the integer and auto-generated
+    correlation ids, and the string representation of the others) and
+    ``data`` (the result of :meth:`Message.toJSON()`).
+
+    With the ``"ndjson"`` format, each object is followed by a newline.
+    With the ``"binary"`` format, each object is preceded by its length in
+    bytes as a 4-byte big-endian unsigned integer.
+
+    All the methods of this class are thread safe.
+    """
+
+    FORMATS = ("ndjson", "binary")
+    """Supported formats"""
+
+    def __init__(self,
+                 output,
+                 format="ndjson",
+                 maxPendingBytes=64 << 20,
+                 block=False,
+                 datetimeFormat="iso",
+                 includeNulls=False):
+        """Create an :class:`EventExporter` writing to the specified
+        ``output``, and start its writer thread.
+
+        Args:
+            output: Path of a file to append to, connected
+                :class:`socket.socket`, or binary file-like object with a
+                ``write()`` method
+            format (str): One of :attr:`FORMATS`
+            maxPendingBytes (int): Number of serialized bytes queued above
+                which further events are dropped or wait, depending on
+                ``block``
+            block (bool): Whether :meth:`exportEvent()` waits for the writer
+                rather than dropping events when ``maxPendingBytes`` are
+                queued
+            datetimeFormat (str): ``datetimeFormat`` argument of
+                :meth:`Message.toJSON()`
+            includeNulls (bool): ``includeNulls`` argument of
+                :meth:`Message.toJSON()`
+
+        Raises:
+            ValueError: If ``format`` is not supported.
+            TypeError: If ``output`` is a text file-like object, such as
+                ``sys.stdout``, rather than a binary one, such as
+                ``sys.stdout.buffer``.
+        """
+        # pylint: disable=redefined-builtin
+        if format not in self.FORMATS:
+            raise ValueError("unsupported format: {0!r}".format(format))
+        if isinstance(output, io.TextIOBase):
+            raise TypeError("output must be a binary file-like object")
+        self.__binary = format == "binary"
+        self.__ownsOutput = False
+        if isinstance(output, str):
+            output = open(output, "ab")
+            self.__ownsOutput = True
+        self.__output = output
+        self.__write = output.sendall \
+            if isinstance(output, socket.socket) else output.write
+        self.__maxPendingBytes = maxPendingBytes
+        self.__block = block
+        self.__datetimeFormat = datetimeFormat
+        self.__includeNulls = includeNulls
+
+        self.__condition = threading.Condition(threading.Lock())
+        self.__pending = []
+        self.__pendingBytes = 0
+        self.__closed = False
+        self.__error = None
+        self.__stats = {
+            "events": 0,
+            "messages": 0,
+            "bytes": 0,
+            "writes": 0,
+            "droppedEvents": 0,
+            "droppedMessages": 0,
+        }
+        self.__thread = threading.Thread(target=self.__run,
+                                         name="blpapi-event-exporter")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def exportEvent(self, event):
+        """Serialize the messages of the specified ``event`` and queue them
+        for writing.
+
+        Args:
+            event (Event): Event to export
+
+        Returns:
+            bool: ``True`` if the messages were queued, ``False`` if they
+            were dropped.
+
+        Raises:
+            IOError: If the exporter is closed, or if writing failed.
+        """
+        records = self.__serialize(event)
+        return self.__enqueue(records)
+
+    def exportQueue(self, eventQueue, timeout=0):
+        """Export the events of the specified ``eventQueue`` until it
+        returns a :attr:`~Event.TIMEOUT` or a :attr:`~Event.RESPONSE` event.
+
+        Args:
+            eventQueue (EventQueue): Queue of the events to export
+            timeout (int): Timeout in milliseconds of each
+                :meth:`~EventQueue.nextEvent()` call
+
+        Returns:
+            int: The number of events exported, not counting the dropped
+            ones.
+        """
+        exported = 0
+        while True:
+            event = eventQueue.nextEvent(timeout)
+            eventType = event.eventType()
+            if eventType == Event.TIMEOUT:
+                return exported
+            if self.exportEvent(event):
+                exported += 1
+            if eventType == Event.RESPONSE:
+                return exported
+
+    def flush(self, timeout=None):
+        """Wait until the writer thread has written all the queued records,
+        or for at most ``timeout`` seconds.
+
+        Returns:
+            bool: ``True`` if all the queued records were written.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.__condition:
+            while self.__pendingBytes and self.__error is None:
+                remaining = None if deadline is None \
+                    else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                self.__condition.wait(remaining)
+            return not self.__pendingBytes and self.__error is None
+
+    def close(self):
+        """Write the queued records, stop the writer thread, and close the
+        output if it was opened by this exporter."""
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+        if self.__ownsOutput:
+            self.__output.close()
+        elif hasattr(self.__output, "flush"):
+            self.__output.flush()
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of ``events`` and ``messages`` queued, of
+            ``bytes`` and ``writes`` done by the writer thread, of
+            ``droppedEvents`` and ``droppedMessages``, and the number of
+            ``pendingBytes``.
+        """
+        with self.__condition:
+            stats = dict(self.__stats)
+            stats["pendingBytes"] = self.__pendingBytes
+        return stats
+
+    def __serialize(self, event):
+        """Return the list of the records of the messages of the specified
+        'event'."""
+        header = b'{"eventType":' + json.dumps(
+            _EVENT_TYPE_NAMES.get(event.eventType(), event.eventType())) \
+            .encode("utf-8")
+        records = []
+        for msg in event:
+            correlationIds = [
+                value if valueType in _INTEGER_CORRELATION_TYPES
+                else str(value)
+                for valueType, _, value in msg.correlationIdValues()]
+            parts = [header,
+                     b',"messageType":',
+                     json.dumps(str(msg.messageType())).encode("utf-8")]
+            topic = msg.topicName()
+            if topic:
+                parts.append(b',"topic":')
+                parts.append(json.dumps(topic).encode("utf-8"))
+            parts.append(b',"correlationIds":')
+            parts.append(json.dumps(correlationIds).encode("utf-8"))
+            parts.append(b',"data":')
+            parts.append(msg.toJSON(self.__datetimeFormat,
+                                    self.__includeNulls))
+            parts.append(b'}')
+            record = b"".join(parts)
+            if self.__binary:
+                records.append(_LENGTH.pack(len(record)))
+                records.append(record)
+            else:
+                records.append(record)
+                records.append(b"\n")
+        return records
+
+    def __enqueue(self, records):
+        """Queue the specified 'records' of one event, and return 'True', or
+        drop them and return 'False'."""
+        size = sum(len(record) for record in records)
+        count = len(records) // 2
+        with self.__condition:
+            self.__raiseIfUnusable()
+            if self.__pendingBytes and \
+                    self.__pendingBytes + size > self.__maxPendingBytes:
+                if not self.__block:
+                    self.__stats["droppedEvents"] += 1
+                    self.__stats["droppedMessages"] += count
+                    return False
+                while self.__pendingBytes and \
+                        self.__pendingBytes + size > self.__maxPendingBytes:
+                    self.__condition.wait()
+                    self.__raiseIfUnusable()
+            self.__pending.extend(records)
+            self.__pendingBytes += size
+            self.__stats["events"] += 1
+            self.__stats["messages"] += count
+            self.__condition.notify_all()
+        return True
+
+    def __raiseIfUnusable(self):
+        """Raise 'IOError' if this exporter is closed or its writer
+        failed."""
+        if self.__error is not None:
+            raise IOError("export failed: {0}".format(self.__error))
+        if self.__closed:
+            raise IOError("exporter is closed")
+
+    def __run(self):
+        """Write the queued records until closed."""
+        while True:
+            with self.__condition:
+                while not self.__pending and not self.__closed:
+                    self.__condition.wait()
+                if not self.__pending:
+                    return
+                records = self.__pending
+                size = self.__pendingBytes
+                self.__pending = []
+            try:
+                self.__write(b"".join(records))
+            except Exception as error:  # pylint: disable=broad-except
+                # Any failure, such as the 'TypeError' of an output which
+                # does not accept bytes, is raised by the next call instead
+                # of ending this thread silently.
+                with self.__condition:
+                    self.__error = error
+                    self.__pending = []
+                    self.__pendingBytes = 0
+                    self.__condition.notify_all()
+                return
+            with self.__condition:
+                self.__pendingBytes -= size
+                self.__stats["bytes"] += size
+                self.__stats["writes"] += 1
+                self.__condition.notify_all()
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
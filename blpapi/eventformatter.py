@@ -8,13 +8,113 @@ This component adds messages to an Event which can be later published.
 
 
 from .exception import _ExceptionUtil
+from .datatype import DataType
 from .datetime import _DatetimeUtil
 from .message import Message
 from .name import Name, getNamePair
+from .compat import conv2str, isstr
 from . import internals
 from .utils import get_handle, invoke_if_valid
 
-#pylint: disable=useless-object-inheritance
+#pylint: disable=useless-object-inheritance,protected-access
+
+def _toString(value):
+    """Convert the specified 'value' to a string accepted by the wrapper."""
+    return conv2str(value) if isstr(value) else str(value)
+
+
+class PublishPlan(object):
+    """A precompiled list of fields of a message, used to set all of them at
+    once with an :class:`EventFormatter`.
+
+    :class:`PublishPlan` objects are created with
+    :meth:`EventFormatter.compile()`, which resolves once, for every field,
+    the :class:`Name` of the field and the setter matching the data type of
+    the field in the schema. :meth:`fill()` then sets the fields of the
+    current message of an :class:`EventFormatter` without any per-field type
+    dispatch or name lookup.
+
+    The following snippet shows how to publish the same set of fields for a
+    number of topics::
+
+        plan = EventFormatter.compile(
+            service.getEventDefinition("MarketDataEvents"),
+            ("BID", "ASK", "LAST_PRICE", "VOLUME"))
+        formatter = EventFormatter(event)
+        for topic, values in updates:
+            formatter.appendMessage("MarketDataEvents", topic)
+            plan.fill(formatter, values)
+    """
+
+    def __init__(self, fields, names, steps):
+        """For internal use: use :meth:`EventFormatter.compile()`."""
+        self.__fields = fields
+        # The 'Name's own the name handles used by 'steps'.
+        self.__names = names
+        self.__steps = steps
+        self.__positions = dict((field, i) for i, field in enumerate(fields))
+
+    def fields(self):
+        """
+        Returns:
+            (str): Names of the fields of this plan, in the order expected by
+            :meth:`fill()`.
+        """
+        return self.__fields
+
+    def fill(self, eventFormatter, values):
+        """Set the fields of this plan in the current message of the specified
+        ``eventFormatter``.
+
+        Args:
+            eventFormatter (EventFormatter): Formatter of the event being
+                published
+            values (tuple or list or dict): Values of the fields, either in
+                the order of :meth:`fields()`, or as a mapping from field
+                names to values
+
+        A ``None`` value publishes a null value for its field, as with
+        :meth:`EventFormatter.setElementNull()`. When ``values`` is a
+        mapping, fields that are missing from it are not set.
+
+        Raises:
+            ValueError: If ``values`` is a sequence whose length differs from
+                the number of fields, or a mapping holding a field which is
+                not in this plan
+            Exception: If a value cannot be set, for the same reasons as
+                :meth:`EventFormatter.setElement()`
+        """
+        handle = eventFormatter._handle()
+        setNull = internals.blpapi_EventFormatter_setValueNull
+        if hasattr(values, "items"):
+            positions = self.__positions
+            steps = self.__steps
+            try:
+                pairs = [(steps[positions[field]], value)
+                         for field, value in values.items()]
+            except KeyError as error:
+                raise ValueError("field '%s' is not in this plan" %
+                                 (error.args[0],))
+        else:
+            if len(values) != len(self.__steps):
+                raise ValueError("expected %d values, got %d" %
+                                 (len(self.__steps), len(values)))
+            pairs = zip(self.__steps, values)
+        for (setter, nameHandle, convert), value in pairs:
+            if value is None:
+                rc = setNull(handle, None, nameHandle)
+            elif setter is None:
+                # 'convert' holds the 'Name' of the field, see 'compile'.
+                eventFormatter.setElement(convert, value)
+                continue
+            else:
+                if convert is not None:
+                    value = convert(value)
+                rc = setter(handle, None, nameHandle, value)
+            if rc:
+                _ExceptionUtil.raiseException(rc)
+
+
 class EventFormatter(object):
     """:class:`EventFormatter` is used to populate :class:`Event`\ s for
     publishing.
@@ -100,6 +200,68 @@ class EventFormatter(object):
             return EventFormatter.__nameTraits
         return EventFormatter.__defaultTraits
 
+    __setterForDatatype = {
+        DataType.BOOL: (internals.blpapi_EventFormatter_setValueBool, None),
+        DataType.CHAR: (internals.blpapi_EventFormatter_setValueChar, None),
+        DataType.BYTE: (internals.blpapi_EventFormatter_setValueInt32, None),
+        DataType.INT32: (internals.blpapi_EventFormatter_setValueInt32, None),
+        DataType.INT64: (internals.blpapi_EventFormatter_setValueInt64, None),
+        DataType.FLOAT32: (internals.blpapi_EventFormatter_setValueFloat,
+                           None),
+        DataType.FLOAT64: (internals.blpapi_EventFormatter_setValueFloat,
+                           None),
+        DataType.STRING: (internals.blpapi_EventFormatter_setValueString,
+                          _toString),
+        DataType.DATE: (internals.blpapi_EventFormatter_setValueDatetime,
+                        _DatetimeUtil.convertToBlpapi),
+        DataType.TIME: (internals.blpapi_EventFormatter_setValueDatetime,
+                        _DatetimeUtil.convertToBlpapi),
+        DataType.DATETIME: (internals.blpapi_EventFormatter_setValueDatetime,
+                            _DatetimeUtil.convertToBlpapi),
+    }
+
+    @staticmethod
+    def compile(eventDefinition, fields):
+        """Create a :class:`PublishPlan` setting the specified ``fields`` of
+        messages defined by the specified ``eventDefinition``.
+
+        Args:
+            eventDefinition (SchemaElementDefinition or
+                CompiledElementDefinition): Definition of the messages, e.g.
+                as returned by :meth:`Service.getEventDefinition()`
+            fields ([Name or str]): Names of the fields to set
+
+        Returns:
+            PublishPlan: Plan setting ``fields`` in the messages.
+
+        Raises:
+            NotFoundException: If one of the ``fields`` is not defined in
+                ``eventDefinition``
+            ValueError: If one of the ``fields`` is a sequence or a choice
+
+        Enumeration fields, and fields whose type is not known, are set with
+        :meth:`setElement()`, which accepts both strings and :class:`Name`
+        values.
+        """
+        typeDefinition = eventDefinition.typeDefinition()
+        fieldNames = []
+        names = []
+        steps = []
+        for field in fields:
+            field = str(field)
+            fieldType = typeDefinition.getElementDefinition(field)\
+                .typeDefinition()
+            if fieldType.isComplexType():
+                raise ValueError(
+                    "field '%s' is not a simple type" % field)
+            name = Name(field)
+            setter, convert = EventFormatter.__setterForDatatype.get(
+                fieldType.datatype(), (None, name))
+            steps.append((setter, name._handle(), convert))
+            names.append(name)
+            fieldNames.append(field)
+        return PublishPlan(tuple(fieldNames), tuple(names), tuple(steps))
+
     def __init__(self, event):
         """Create an :class:`EventFormatter` to create :class:`Message`\ s in
         the specified ``event``.
@@ -263,6 +425,134 @@ class EventFormatter(object):
                         fragmentType,
                         sequenceNumber))
 
+    def appendMessagesFromColumns(self, messageType, topics, columns):
+        """Append one message per topic, with fields taken from columns.
+
+        Args:
+            messageType (Name or str): Type of the messages
+            topics ([Topic]): Topics to publish the messages under
+            columns (dict): Mapping of field names to sequences of values,
+                one value per topic
+
+        The ``i``\ th message is appended under ``topics[i]``, and each field
+        ``name`` of the message is set to ``columns[name][i]``. This is
+        equivalent to calling :meth:`appendMessage()` and then
+        :meth:`setElement()` for every field, but the setter of a column and
+        the :class:`Name` of its field are determined once per column rather
+        than once per value.
+
+        A column can be a list or tuple, an ``array.array``, a NumPy array, a
+        NumPy masked array, or a ``(values, mask)`` pair where ``mask`` is a
+        sequence of booleans. Values that are ``None`` or masked are published
+        as null values, as with :meth:`setElementNull()`. The values of a
+        NumPy ``datetime64`` column are published as datetimes, and ``NaT``
+        values as null values. NumPy is not required: columns are only
+        accessed through their ``dtype``, ``astype()``, ``tolist()`` and
+        ``mask`` attributes when present.
+
+        Raises:
+            ValueError: If the length of a column differs from the number of
+                ``topics``
+            Exception: If a message cannot be appended or a value cannot be
+                set, for the same reasons as :meth:`appendMessage()` and
+                :meth:`setElement()`
+        """
+        topics = list(topics)
+        messageName = getNamePair(messageType)
+        plan = []
+        for field, column in columns.items():
+            values, mask, traits = EventFormatter.__columnValues(column)
+            if len(values) != len(topics) or \
+                    (mask is not None and len(mask) != len(topics)):
+                raise ValueError("column '%s' has %d values for %d topics" %
+                                 (field, len(values), len(topics)))
+            name = field if isinstance(field, Name) else Name(field)
+            plan.append((name._handle(),
+                         traits,
+                         values,
+                         mask,
+                         name))
+
+        handle = self.__handle
+        appendMessage = internals.blpapi_EventFormatter_appendMessage
+        setNull = internals.blpapi_EventFormatter_setValueNull
+        getTraits = EventFormatter.__getTraits
+        for i, topic in enumerate(topics):
+            rc = appendMessage(handle,
+                               messageName[0],
+                               messageName[1],
+                               get_handle(topic))
+            if rc:
+                _ExceptionUtil.raiseException(rc)
+            for nameHandle, traits, values, mask, _ in plan:
+                value = values[i]
+                if value is None or (mask is not None and mask[i]):
+                    rc = setNull(handle, None, nameHandle)
+                else:
+                    valueTraits = traits or getTraits(value)
+                    if valueTraits[2] is not None:
+                        value = valueTraits[2](value)
+                    rc = valueTraits[0](handle, None, nameHandle, value)
+                if rc:
+                    _ExceptionUtil.raiseException(rc)
+
+    @staticmethod
+    def __columnValues(column):
+        """Return a list of the values of the specified 'column', its mask
+        (or 'None') and the traits to use for all its values (or 'None' if
+        they depend on each value)."""
+        mask = None
+        if isinstance(column, tuple) and len(column) == 2 and \
+                not isstr(column[0]) and hasattr(column[0], "__len__"):
+            column, mask = column
+        elif hasattr(column, "mask") and hasattr(column, "filled"):
+            # NumPy masked array; 'mask' is 'nomask' when nothing is masked.
+            if getattr(column.mask, "ndim", 0):
+                mask = column.mask
+            column = column.data
+        traits = EventFormatter.__columnTraits(column)
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None and dtype.kind == "M" and \
+                dtype.str[-3:-1] in ("ns", "ps", "fs", "as"):
+            # 'tolist()' returns integers for units below the microsecond.
+            column = column.astype("datetime64[us]")
+        if hasattr(column, "tolist"):
+            values = column.tolist()
+        else:
+            values = list(column)
+        if mask is not None and hasattr(mask, "tolist"):
+            mask = mask.tolist()
+        return values, mask, traits
+
+    @staticmethod
+    def __columnTraits(column):
+        """Return the traits to use for all the values of the specified
+        'column', or 'None' if they depend on each value."""
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None:
+            kind = dtype.kind
+            if kind == "b":
+                return EventFormatter.__boolTraits
+            if kind == "f":
+                return EventFormatter.__floatTraits
+            if kind == "M":
+                return EventFormatter.__datetimeTraits
+            if kind in "iu" and dtype.itemsize <= 4 and \
+                    not (kind == "u" and dtype.itemsize == 4):
+                return EventFormatter.__int32Traits
+            if kind == "i":
+                return EventFormatter.__int64Traits
+            return None
+        typecode = getattr(column, "typecode", None)
+        if typecode is not None:
+            if typecode in "fd":
+                return EventFormatter.__floatTraits
+            if typecode in "bBhHi":
+                return EventFormatter.__int32Traits
+            if typecode in "lq":
+                return EventFormatter.__int64Traits
+        return None
+
     def setElement(self, name, value):
         """Set an element in the :class:`Event` referenced by this
         :class:`EventFormatter`.
@@ -161,6 +161,44 @@ class Identity(object):
             result.append(failedEIDs[i])
         return (True if res else False, result)
 
+    def hasEntitlementsMany(self, service, entitlementSets):
+        """
+        Args:
+            service (Service): Service to check authorization for
+            entitlementSets ([[int] or Element]): Sets of EIDs to check
+                authorization for
+
+        Returns:
+            [bool]: For each set in ``entitlementSets``, ``True`` if this
+            :class:`Identity` is authorized for the specified ``service`` and
+            for each of the entitlement IDs in the set, as
+            :meth:`hasEntitlements()` would return.
+
+        The union of the sets is checked with a single call to the library,
+        however many sets are passed.
+        """
+        entitlementSets = [list(entitlements.values())
+                           if isinstance(entitlements, Element)
+                           else entitlements
+                           for entitlements in entitlementSets]
+        if not self.isAuthorized(service):
+            return [False] * len(entitlementSets)
+        allEIDs = set()
+        for entitlements in entitlementSets:
+            allEIDs.update(entitlements)
+        if not allEIDs:
+            return [True] * len(entitlementSets)
+        entitled, failedEIDs = self.getFailedEntitlements(service,
+                                                          list(allEIDs))
+        if entitled:
+            return [True] * len(entitlementSets)
+        if not failedEIDs:
+            return [self.hasEntitlements(service, entitlements)
+                    for entitlements in entitlementSets]
+        failedEIDs = frozenset(failedEIDs)
+        return [failedEIDs.isdisjoint(entitlements)
+                for entitlements in entitlementSets]
+
     def isAuthorized(self, service):
         """
         Args:
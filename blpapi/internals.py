@@ -229,6 +229,14 @@ def setLoggerCallbackWrapper(cb, severity):
     return _internals.setLoggerCallbackWrapper(cb, severity)
 setLoggerCallbackWrapper = _internals.setLoggerCallbackWrapper
 
+def setLoggerRingBuffer(capacity, severity):
+    return _internals.setLoggerRingBuffer(capacity, severity)
+setLoggerRingBuffer = _internals.setLoggerRingBuffer
+
+def drainLoggerRingBuffer():
+    return _internals.drainLoggerRingBuffer()
+drainLoggerRingBuffer = _internals.drainLoggerRingBuffer
+
 def blpapi_HighPrecisionDatetime_fromTimePoint_wrapper(original):
     return _internals.blpapi_HighPrecisionDatetime_fromTimePoint_wrapper(original)
 blpapi_HighPrecisionDatetime_fromTimePoint_wrapper = _internals.blpapi_HighPrecisionDatetime_fromTimePoint_wrapper
@@ -548,6 +556,10 @@ def blpapi_Element_printHelper(element, level, spacesPerLevel):
     return _internals.blpapi_Element_printHelper(element, level, spacesPerLevel)
 blpapi_Element_printHelper = _internals.blpapi_Element_printHelper
 
+def blpapi_Element_toJSONHelper(element, datetimeFormat, includeNulls, fields):
+    return _internals.blpapi_Element_toJSONHelper(element, datetimeFormat, includeNulls, fields)
+blpapi_Element_toJSONHelper = _internals.blpapi_Element_toJSONHelper
+
 def blpapi_Element_name(element):
     return _internals.blpapi_Element_name(element)
 blpapi_Element_name = _internals.blpapi_Element_name
@@ -1551,6 +1563,10 @@ def blpapi_Message_correlationId(message, index):
     return _internals.blpapi_Message_correlationId(message, index)
 blpapi_Message_correlationId = _internals.blpapi_Message_correlationId
 
+def blpapi_Message_correlationIdsHelper(message):
+    return _internals.blpapi_Message_correlationIdsHelper(message)
+blpapi_Message_correlationIdsHelper = _internals.blpapi_Message_correlationIdsHelper
+
 def blpapi_Message_elements(message):
     return _internals.blpapi_Message_elements(message)
 blpapi_Message_elements = _internals.blpapi_Message_elements
@@ -1098,6 +1098,19 @@ SWIG_Python_AddErrorMsg(const char* mesg)
 #  define SWIG_PYTHON_THREAD_END_ALLOW
 #endif
 
+/* The calls which cannot block, such as the accessors of elements, names
+ * and schema definitions, keep the GIL, as releasing and re-acquiring it
+ * costs more than the call itself.  Define BLPAPI_RELEASE_GIL_IN_ACCESSORS
+ * to release it around these calls too, as in earlier releases, for example
+ * to compare both policies with benchmarks/bench_gil.py. */
+#if defined(BLPAPI_RELEASE_GIL_IN_ACCESSORS)
+#  define BLPAPI_ACCESSOR_BEGIN_ALLOW  SWIG_PYTHON_THREAD_BEGIN_ALLOW
+#  define BLPAPI_ACCESSOR_END_ALLOW    SWIG_PYTHON_THREAD_END_ALLOW
+#else
+#  define BLPAPI_ACCESSOR_BEGIN_ALLOW
+#  define BLPAPI_ACCESSOR_END_ALLOW
+#endif
+
 /* -----------------------------------------------------------------------------
  * Python API portion that goes into the runtime
  * ----------------------------------------------------------------------------- */
@@ -3413,8 +3426,8 @@ void loggerCallbackWrapper(blpapi_UInt64_t   threadId,
     PyObject* result = PyObject_CallFunction(loggerCallback, "KiIss",
                                              threadId, severity, ts,
                                              category, message);
-    PyGILState_Release(gilstate);
     Py_XDECREF(result);
+    PyGILState_Release(gilstate);
 }
 
 int setLoggerCallbackWrapper(PyObject *cb, int severity)
@@ -3436,6 +3449,172 @@ int setLoggerCallbackWrapper(PyObject *cb, int severity)
     return 0;
 }
 
+/* Logging ring buffer.
+ *
+ * 'loggerRingCallback' runs on the library's threads and never takes the
+ * GIL: it appends each record to the active one of two byte arenas, under a
+ * spin lock which is only ever held to copy one record or to swap the
+ * arenas.  'drainLoggerRingBuffer', called from Python, swaps the arenas and
+ * converts the records of the previously active one.  A record which does
+ * not fit in the active arena is dropped and counted.
+ */
+#if defined(_MSC_VER)
+#include <intrin.h>
+typedef long LoggerRingLock;
+#define LOGGER_RING_TRY_LOCK(lock) (_InterlockedExchange(&(lock), 1) == 0)
+#define LOGGER_RING_UNLOCK(lock)   _InterlockedExchange(&(lock), 0)
+#define LOGGER_RING_PAUSE()
+#else
+#include <sched.h>
+typedef int LoggerRingLock;
+#define LOGGER_RING_TRY_LOCK(lock) (__sync_lock_test_and_set(&(lock), 1) == 0)
+#define LOGGER_RING_UNLOCK(lock)   __sync_lock_release(&(lock))
+#define LOGGER_RING_PAUSE()        sched_yield()
+#endif
+
+typedef struct LoggerRingRecord {
+    blpapi_UInt64_t threadId;
+    double          timestamp;
+    size_t          size;          // of the whole record, padded
+    int             severity;
+    int             categoryLength;
+    // followed by category and message, each 0-terminated
+} LoggerRingRecord;
+
+typedef struct LoggerRingArena {
+    char   *data;
+    size_t  used;
+} LoggerRingArena;
+
+static volatile LoggerRingLock loggerRingLock = 0;
+static LoggerRingArena loggerRingArenas[2] = { { 0, 0 }, { 0, 0 } };
+static int loggerRingActive = 0;
+static size_t loggerRingCapacity = 0;
+static blpapi_UInt64_t loggerRingDropped = 0;
+
+static void loggerRingAcquire(void)
+{
+    while (!LOGGER_RING_TRY_LOCK(loggerRingLock)) {
+        LOGGER_RING_PAUSE();
+    }
+}
+
+void loggerRingCallback(blpapi_UInt64_t   threadId,
+                        int                severity,
+                        blpapi_Datetime_t  original,
+                        const char        *category,
+                        const char        *message)
+{
+    double timestamp = (double) blpapi_Datetime_to_unix(&original);
+    size_t categoryLength = strlen(category) + 1;
+    size_t messageLength = strlen(message) + 1;
+    size_t size = sizeof(LoggerRingRecord) + categoryLength + messageLength;
+    LoggerRingArena *arena;
+    LoggerRingRecord *record;
+
+    if (original.parts & BLPAPI_DATETIME_MILLISECONDS_PART) {
+        timestamp += original.milliSeconds / 1000.0;
+    }
+    size = (size + sizeof(double) - 1) & ~(sizeof(double) - 1);
+
+    loggerRingAcquire();
+    arena = &loggerRingArenas[loggerRingActive];
+    if (arena->used + size > loggerRingCapacity) {
+        ++loggerRingDropped;
+        LOGGER_RING_UNLOCK(loggerRingLock);
+        return;
+    }
+    record = (LoggerRingRecord *) (arena->data + arena->used);
+    record->threadId = threadId;
+    record->timestamp = timestamp;
+    record->size = size;
+    record->severity = severity;
+    record->categoryLength = (int) categoryLength;
+    memcpy((char *) (record + 1), category, categoryLength);
+    memcpy((char *) (record + 1) + categoryLength, message, messageLength);
+    arena->used += size;
+    LOGGER_RING_UNLOCK(loggerRingLock);
+}
+
+int setLoggerRingBuffer(int capacity, int severity)
+{
+    int err;
+
+    if (capacity <= 0) {
+        return -1;
+    }
+    if (!loggerRingCapacity) {
+        // The arenas are never freed nor resized: the library may call
+        // 'loggerRingCallback' at any time once it is registered.
+        loggerRingArenas[0].data = (char *) malloc(capacity);
+        loggerRingArenas[1].data = (char *) malloc(capacity);
+        if (!loggerRingArenas[0].data || !loggerRingArenas[1].data) {
+            free(loggerRingArenas[0].data);
+            free(loggerRingArenas[1].data);
+            loggerRingArenas[0].data = loggerRingArenas[1].data = 0;
+            return -1;
+        }
+        loggerRingCapacity = (size_t) capacity;
+    }
+    err = blpapi_Logging_registerCallback(&loggerRingCallback, (blpapi_Logging_Severity_t)severity);
+    if (err != 0) {
+        return -2;
+    }
+
+    return 0;
+}
+
+PyObject *drainLoggerRingBuffer()
+{
+    LoggerRingArena *arena;
+    blpapi_UInt64_t dropped;
+    PyObject *records;
+    size_t offset;
+
+    if (!loggerRingCapacity) {
+        return Py_BuildValue("([]K)", (unsigned PY_LONG_LONG) 0);
+    }
+
+    loggerRingAcquire();
+    arena = &loggerRingArenas[loggerRingActive];
+    loggerRingActive = 1 - loggerRingActive;
+    dropped = loggerRingDropped;
+    LOGGER_RING_UNLOCK(loggerRingLock);
+
+    // No callback writes to 'arena' until the next swap, which only this
+    // function does, under the GIL.
+    records = PyList_New(0);
+    if (!records) {
+        arena->used = 0;
+        return NULL;
+    }
+    for (offset = 0; offset < arena->used; ) {
+        LoggerRingRecord *record = (LoggerRingRecord *) (arena->data + offset);
+        const char *category = (const char *) (record + 1);
+        PyObject *item = Py_BuildValue("Kdiss",
+                                       record->threadId,
+                                       record->timestamp,
+                                       record->severity,
+                                       category,
+                                       category + record->categoryLength);
+        offset += record->size;
+        if (!item) {
+            // Skip records which cannot be decoded.
+            PyErr_Clear();
+            continue;
+        }
+        if (PyList_Append(records, item) != 0) {
+            Py_DECREF(item);
+            Py_DECREF(records);
+            arena->used = 0;
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    arena->used = 0;
+    return Py_BuildValue("(NK)", records, (unsigned PY_LONG_LONG) dropped);
+}
+
 /** Convert `blpapi_TimePoint_t` value to `blpapi_Datetime_t`. Function
   * always returns UTC time.
   */
@@ -4180,6 +4359,51 @@ SWIGINTERN long long blpapi_CorrelationId_t____toInteger(struct blpapi_Correlati
         return CorrelationId_t_toInteger(self);
     }
 
+// Return a new tuple of the '(type, classId, value)' of each correlation id
+// of the specified 'message', where 'value' is the integer value of an
+// integer or auto-generated correlation id, the object of a correlation id
+// created from a Python object, and 'None' otherwise, as returned by
+// 'CorrelationId.value()'.  The correlation ids are read in place, without
+// being copied.
+PyObject *blpapi_Message_correlationIdsHelper(const blpapi_Message_t *message)
+{
+    PyObject *result;
+    PyObject *value;
+    PyObject *item;
+    blpapi_CorrelationId_t cid;
+    int count = blpapi_Message_numCorrelationIds(message);
+    int i;
+
+    result = PyTuple_New(count > 0 ? count : 0);
+    if (!result) {
+        return NULL;
+    }
+    for (i = 0; i < count; ++i) {
+        cid = blpapi_Message_correlationId(message, (size_t) i);
+        if (cid.valueType == BLPAPI_CORRELATION_TYPE_INT
+                || cid.valueType == BLPAPI_CORRELATION_TYPE_AUTOGEN) {
+            value = PyLong_FromLongLong((long long) cid.value.intValue);
+        }
+        else {
+            value = CorrelationId_t_getObject(&cid);
+        }
+        if (!value) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        item = Py_BuildValue("(iiN)",
+                             (int) cid.valueType,
+                             (int) cid.classId,
+                             value);
+        if (!item) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(result, i, item);
+    }
+    return result;
+}
+
 
 #include "blpapi_element.h"
 
@@ -4260,6 +4484,446 @@ void blpapi_Element_printHelper(
 }
 
 
+// JSON serialization of elements.  'blpapi_Element_toJSONHelper' walks an
+// element tree with the C interface and appends its JSON representation to
+// a growable buffer, which is returned as a 'bytes' object.
+typedef struct JsonBuffer {
+    char   *data;
+    size_t  size;
+    size_t  capacity;
+    int     failed;
+} JsonBuffer;
+
+typedef struct JsonOptions {
+    int           datetimeFormat;  // 0: ISO 8601 strings, 1: epoch millis
+    int           includeNulls;
+    const char  **fields;          // top level fields to keep, or 0
+    Py_ssize_t    numFields;
+} JsonOptions;
+
+static void json_reserve(JsonBuffer *buffer, size_t length)
+{
+    size_t capacity;
+    char *data;
+
+    if (buffer->failed || buffer->size + length <= buffer->capacity) {
+        return;
+    }
+    capacity = buffer->capacity ? buffer->capacity : 256;
+    while (capacity < buffer->size + length) {
+        capacity *= 2;
+    }
+    data = (char *) realloc(buffer->data, capacity);
+    if (!data) {
+        buffer->failed = 1;
+        return;
+    }
+    buffer->data = data;
+    buffer->capacity = capacity;
+}
+
+static void json_append(JsonBuffer *buffer, const char *data, size_t length)
+{
+    json_reserve(buffer, length);
+    if (!buffer->failed) {
+        memcpy(buffer->data + buffer->size, data, length);
+        buffer->size += length;
+    }
+}
+
+static void json_appendChar(JsonBuffer *buffer, char c)
+{
+    json_append(buffer, &c, 1);
+}
+
+static void json_appendString(JsonBuffer *buffer, const char *value)
+{
+    static const char hex[] = "0123456789abcdef";
+    const unsigned char *p = (const unsigned char *) value;
+    const unsigned char *run = p;
+
+    json_appendChar(buffer, '"');
+    for (; *p; ++p) {
+        if (*p >= 0x20 && *p != '"' && *p != '\\') {
+            continue;
+        }
+        json_append(buffer, (const char *) run, p - run);
+        run = p + 1;
+        switch (*p) {
+          case '"':  json_append(buffer, "\\\"", 2); break;
+          case '\\': json_append(buffer, "\\\\", 2); break;
+          case '\n': json_append(buffer, "\\n", 2); break;
+          case '\r': json_append(buffer, "\\r", 2); break;
+          case '\t': json_append(buffer, "\\t", 2); break;
+          default: {
+            char escaped[6] = { '\\', 'u', '0', '0', 0, 0 };
+            escaped[4] = hex[*p >> 4];
+            escaped[5] = hex[*p & 0xF];
+            json_append(buffer, escaped, 6);
+          }
+        }
+    }
+    json_append(buffer, (const char *) run, p - run);
+    json_appendChar(buffer, '"');
+}
+
+static void json_appendDouble(JsonBuffer *buffer, double value)
+{
+    char *repr;
+
+    if (!Py_IS_FINITE(value)) {
+        json_append(buffer, "null", 4);
+        return;
+    }
+    // Shortest representation which round trips, as 'repr(float)'.
+    repr = PyOS_double_to_string(value, 'r', 0, 0, NULL);
+    if (!repr) {
+        PyErr_Clear();
+        buffer->failed = 1;
+        return;
+    }
+    json_append(buffer, repr, strlen(repr));
+    PyMem_Free(repr);
+}
+
+static void json_appendFloat(JsonBuffer *buffer, float value)
+{
+    char text[32];
+    int precision;
+
+    if (!Py_IS_FINITE(value)) {
+        json_append(buffer, "null", 4);
+        return;
+    }
+    // Shortest representation which round trips as a 32-bit float.
+    for (precision = 6; precision < 9; ++precision) {
+        PyOS_snprintf(text, sizeof(text), "%.*g", precision, (double) value);
+        if ((float) PyOS_string_to_double(text, NULL, NULL) == value) {
+            break;
+        }
+    }
+    if (precision == 9) {
+        PyOS_snprintf(text, sizeof(text), "%.9g", (double) value);
+    }
+    json_append(buffer, text, strlen(text));
+}
+
+static long long json_daysFromCivil(int year, int month, int day)
+{
+    // Number of days between 1970-01-01 and the specified date of the
+    // proleptic Gregorian calendar.
+    int era, yearOfEra, dayOfYear, dayOfEra;
+
+    year -= month <= 2;
+    era = (year >= 0 ? year : year - 399) / 400;
+    yearOfEra = year - era * 400;
+    dayOfYear = (153 * (month + (month > 2 ? -3 : 9)) + 2) / 5 + day - 1;
+    dayOfEra = yearOfEra * 365 + yearOfEra / 4 - yearOfEra / 100 + dayOfYear;
+    return (long long) era * 146097 + dayOfEra - 719468;
+}
+
+static void json_appendDatetime(JsonBuffer                          *buffer,
+                                const blpapi_HighPrecisionDatetime_t *value,
+                                const JsonOptions                   *options)
+{
+    const blpapi_Datetime_t *datetime = &value->datetime;
+    int hasDate = (datetime->parts & BLPAPI_DATETIME_DATE_PART)
+                                              == BLPAPI_DATETIME_DATE_PART;
+    int hasTime = (datetime->parts & BLPAPI_DATETIME_TIME_PART)
+                                              == BLPAPI_DATETIME_TIME_PART;
+    int hasFraction = (datetime->parts & BLPAPI_DATETIME_MILLISECONDS_PART)
+                                                                       != 0;
+    int hasOffset = (datetime->parts & BLPAPI_DATETIME_OFFSET_PART) != 0;
+    char text[64];
+    int length = 0;
+
+    if (options->datetimeFormat == 1 && hasDate) {
+        long long millis = json_daysFromCivil(datetime->year,
+                                              datetime->month,
+                                              datetime->day) * 86400000LL;
+        if (hasTime) {
+            millis += ((datetime->hours * 60 + datetime->minutes) * 60
+                       + datetime->seconds) * 1000LL;
+        }
+        if (hasFraction) {
+            millis += datetime->milliSeconds;
+        }
+        if (hasOffset) {
+            millis -= datetime->offset * 60000LL;
+        }
+        length = PyOS_snprintf(text, sizeof(text), "%lld", millis);
+        json_append(buffer, text, length);
+        return;
+    }
+
+    if (hasDate) {
+        length += PyOS_snprintf(text + length, sizeof(text) - length,
+                                "%04d-%02d-%02d",
+                                datetime->year,
+                                datetime->month,
+                                datetime->day);
+    }
+    if (hasTime) {
+        if (hasDate) {
+            text[length++] = 'T';
+        }
+        length += PyOS_snprintf(text + length, sizeof(text) - length,
+                                "%02d:%02d:%02d",
+                                datetime->hours,
+                                datetime->minutes,
+                                datetime->seconds);
+        if (hasFraction) {
+            length += PyOS_snprintf(
+                            text + length, sizeof(text) - length,
+                            ".%06u",
+                            (unsigned) (datetime->milliSeconds * 1000
+                                        + value->picoseconds / 1000000));
+        }
+    }
+    if (hasOffset && (hasDate || hasTime)) {
+        int offset = datetime->offset;
+        char sign = offset < 0 ? '-' : '+';
+        if (offset < 0) {
+            offset = -offset;
+        }
+        length += PyOS_snprintf(text + length, sizeof(text) - length,
+                                "%c%02d:%02d", sign, offset / 60, offset % 60);
+    }
+    text[length] = 0;
+    json_appendString(buffer, text);
+}
+
+static void json_appendElement(JsonBuffer        *buffer,
+                               blpapi_Element_t  *element,
+                               const JsonOptions *options,
+                               int                isRoot);
+
+static void json_appendValue(JsonBuffer        *buffer,
+                             blpapi_Element_t  *element,
+                             int                datatype,
+                             size_t             index,
+                             const JsonOptions *options)
+{
+    char text[32];
+    int rc;
+
+    if (blpapi_Element_isNullValue(element, index)) {
+        json_append(buffer, "null", 4);
+        return;
+    }
+    switch (datatype) {
+      case BLPAPI_DATATYPE_BOOL: {
+        blpapi_Bool_t value = 0;
+        rc = blpapi_Element_getValueAsBool(element, &value, index);
+        if (rc == 0) {
+            json_append(buffer, value ? "true" : "false", value ? 4 : 5);
+        }
+      } break;
+      case BLPAPI_DATATYPE_CHAR: {
+        blpapi_Char_t value = 0;
+        rc = blpapi_Element_getValueAsChar(element, &value, index);
+        if (rc == 0) {
+            text[0] = value;
+            text[1] = 0;
+            json_appendString(buffer, text);
+        }
+      } break;
+      case BLPAPI_DATATYPE_BYTE:
+      case BLPAPI_DATATYPE_INT32:
+      case BLPAPI_DATATYPE_INT64: {
+        blpapi_Int64_t value = 0;
+        rc = blpapi_Element_getValueAsInt64(element, &value, index);
+        if (rc == 0) {
+            json_append(buffer, text, PyOS_snprintf(text, sizeof(text),
+                                                    "%lld", (long long) value));
+        }
+      } break;
+      case BLPAPI_DATATYPE_FLOAT32: {
+        blpapi_Float32_t value = 0;
+        rc = blpapi_Element_getValueAsFloat32(element, &value, index);
+        if (rc == 0) {
+            json_appendFloat(buffer, value);
+        }
+      } break;
+      case BLPAPI_DATATYPE_FLOAT64:
+      case BLPAPI_DATATYPE_DECIMAL: {
+        blpapi_Float64_t value = 0;
+        rc = blpapi_Element_getValueAsFloat64(element, &value, index);
+        if (rc == 0) {
+            json_appendDouble(buffer, value);
+        }
+      } break;
+      case BLPAPI_DATATYPE_DATE:
+      case BLPAPI_DATATYPE_TIME:
+      case BLPAPI_DATATYPE_DATETIME: {
+        blpapi_HighPrecisionDatetime_t value;
+        memset(&value, 0, sizeof(value));
+        rc = blpapi_Element_getValueAsHighPrecisionDatetime(element,
+                                                            &value,
+                                                            index);
+        if (rc == 0) {
+            json_appendDatetime(buffer, &value, options);
+        }
+      } break;
+      case BLPAPI_DATATYPE_SEQUENCE:
+      case BLPAPI_DATATYPE_CHOICE: {
+        blpapi_Element_t *value = 0;
+        rc = blpapi_Element_getValueAsElement(element, &value, index);
+        if (rc == 0) {
+            json_appendElement(buffer, value, options, 0);
+        }
+      } break;
+      default: {
+        // STRING, ENUMERATION, and any other type convertible to a string
+        const char *value = 0;
+        rc = blpapi_Element_getValueAsString(element, &value, index);
+        if (rc == 0) {
+            json_appendString(buffer, value ? value : "");
+        }
+      } break;
+    }
+    if (rc != 0) {
+        json_append(buffer, "null", 4);
+    }
+}
+
+static int json_isSelected(const char *name, const JsonOptions *options)
+{
+    Py_ssize_t i;
+
+    for (i = 0; i < options->numFields; ++i) {
+        if (strcmp(name, options->fields[i]) == 0) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static void json_appendElement(JsonBuffer        *buffer,
+                               blpapi_Element_t  *element,
+                               const JsonOptions *options,
+                               int                isRoot)
+{
+    int datatype = blpapi_Element_datatype(element);
+    size_t i, count;
+    int first = 1;
+
+    if (blpapi_Element_isArray(element)) {
+        count = blpapi_Element_numValues(element);
+        json_appendChar(buffer, '[');
+        for (i = 0; i < count && !buffer->failed; ++i) {
+            if (i) {
+                json_appendChar(buffer, ',');
+            }
+            json_appendValue(buffer, element, datatype, i, options);
+        }
+        json_appendChar(buffer, ']');
+        return;
+    }
+    if (datatype == BLPAPI_DATATYPE_CHOICE) {
+        blpapi_Element_t *choice = 0;
+        json_appendChar(buffer, '{');
+        if (blpapi_Element_getChoice(element, &choice) == 0 && choice) {
+            json_appendString(buffer, blpapi_Element_nameString(choice));
+            json_appendChar(buffer, ':');
+            json_appendElement(buffer, choice, options, 0);
+        }
+        json_appendChar(buffer, '}');
+        return;
+    }
+    if (datatype != BLPAPI_DATATYPE_SEQUENCE) {
+        if (blpapi_Element_isNull(element)) {
+            json_append(buffer, "null", 4);
+        }
+        else {
+            json_appendValue(buffer, element, datatype, 0, options);
+        }
+        return;
+    }
+    count = blpapi_Element_numElements(element);
+    json_appendChar(buffer, '{');
+    for (i = 0; i < count && !buffer->failed; ++i) {
+        blpapi_Element_t *field = 0;
+        const char *name;
+        if (blpapi_Element_getElementAt(element, &field, i) != 0 || !field) {
+            continue;
+        }
+        name = blpapi_Element_nameString(field);
+        if (isRoot && options->fields && !json_isSelected(name, options)) {
+            continue;
+        }
+        if (!options->includeNulls && blpapi_Element_isNull(field)) {
+            continue;
+        }
+        if (!first) {
+            json_appendChar(buffer, ',');
+        }
+        first = 0;
+        json_appendString(buffer, name);
+        json_appendChar(buffer, ':');
+        json_appendElement(buffer, field, options, 0);
+    }
+    json_appendChar(buffer, '}');
+}
+
+PyObject *blpapi_Element_toJSONHelper(blpapi_Element_t *element,
+                                      int               datetimeFormat,
+                                      int               includeNulls,
+                                      PyObject         *fields)
+{
+    JsonBuffer buffer = { 0, 0, 0, 0 };
+    JsonOptions options;
+    PyObject *result;
+    Py_ssize_t i;
+
+    options.datetimeFormat = datetimeFormat;
+    options.includeNulls = includeNulls;
+    options.fields = 0;
+    options.numFields = 0;
+    if (fields != Py_None) {
+        if (!PyTuple_Check(fields)) {
+            PyErr_SetString(PyExc_TypeError, "fields must be a tuple or None");
+            return NULL;
+        }
+        options.numFields = PyTuple_GET_SIZE(fields);
+        options.fields = (const char **) malloc(
+                              (options.numFields + 1) * sizeof(const char *));
+        if (!options.fields) {
+            return PyErr_NoMemory();
+        }
+        for (i = 0; i < options.numFields; ++i) {
+            PyObject *field = PyTuple_GET_ITEM(fields, i);
+#if PY_VERSION_HEX >= 0x03000000
+            options.fields[i] = PyUnicode_Check(field)
+                              ? PyUnicode_AsUTF8(field) : 0;
+#else
+            options.fields[i] = PyString_Check(field)
+                              ? PyString_AsString(field) : 0;
+#endif
+            if (!options.fields[i]) {
+                free((void *) options.fields);
+                if (!PyErr_Occurred()) {
+                    PyErr_SetString(PyExc_TypeError,
+                                    "fields must contain strings");
+                }
+                return NULL;
+            }
+        }
+    }
+
+    json_appendElement(&buffer, element, &options, 1);
+    free((void *) options.fields);
+
+    if (buffer.failed) {
+        free(buffer.data);
+        return PyErr_NoMemory();
+    }
+    result = PyBytes_FromStringAndSize(buffer.data ? buffer.data : "",
+                                       (Py_ssize_t) buffer.size);
+    free(buffer.data);
+    return result;
+}
+
 
 SWIGINTERNINLINE PyObject * 
 SWIG_FromCharPtr(const char *cptr)
@@ -4636,6 +5300,54 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_setLoggerRingBuffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int arg2 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:setLoggerRingBuffer",&obj0,&obj1)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "setLoggerRingBuffer" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "setLoggerRingBuffer" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (int)setLoggerRingBuffer(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_drainLoggerRingBuffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":drainLoggerRingBuffer")) SWIG_fail;
+  result = (PyObject *)drainLoggerRingBuffer();
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_fromTimePoint_wrapper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   blpapi_TimePoint_t arg1 ;
@@ -4657,9 +5369,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_fromTimePoint_wrapper(Py
     }
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_HighPrecisionDatetime_fromTimePoint_wrapper(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj((blpapi_Datetime_t *)memcpy((blpapi_Datetime_t *)calloc(1,sizeof(blpapi_Datetime_t)),&result,sizeof(blpapi_Datetime_t)), SWIGTYPE_p_blpapi_Datetime_tag, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -4739,11 +5451,7 @@ SWIGINTERN PyObject *_wrap_blpapi_DiagnosticsUtil_memoryInfo_wrapper(PyObject *S
   PyObject *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)":blpapi_DiagnosticsUtil_memoryInfo_wrapper")) SWIG_fail;
-  {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    result = (PyObject *)blpapi_DiagnosticsUtil_memoryInfo_wrapper();
-    SWIG_PYTHON_THREAD_END_ALLOW;
-  }
+  result = (PyObject *)blpapi_DiagnosticsUtil_memoryInfo_wrapper();
   resultobj = result;
   return resultobj;
 fail:
@@ -4823,9 +5531,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_printHelper(PyObject *SWIGUNUSEDPARM(s
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Service_printHelper(arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (*arg4) {
@@ -4875,9 +5583,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_printHelper(PyObject *
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SchemaElementDefinition_printHelper(arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (*arg4) {
@@ -4927,9 +5635,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_printHelper(PyObject *SWI
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SchemaTypeDefinition_printHelper(arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (*arg4) {
@@ -4979,9 +5687,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_printHelper(PyObject *SWIGUNUSE
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_printHelper(arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (*arg4) {
@@ -5028,9 +5736,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_hasElementDefinition(PyOb
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_hasElementDefinition((void *const *)arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -5075,9 +5783,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_hasConstant(PyObject *SWIGUNUSEDP
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ConstantList_hasConstant((struct blpapi_ConstantList const *)arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -5122,9 +5830,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_hasEventDefinition(PyObject *SWIGUNUSE
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_hasEventDefinition(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -5169,9 +5877,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_hasOperation(PyObject *SWIGUNUSEDPARM(
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_hasOperation(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -5236,9 +5944,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_addHelper(PyObject *SWIGUNUSE
   }
   arg5 = (char *)(buf5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_addHelper(arg1,(char const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3,(char const *)arg4,(char const *)arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -5269,9 +5977,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_hasName(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = (char *)(buf1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Name_hasName((char const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
@@ -5297,9 +6005,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_createFromResolutionList(PyObject *S
   }
   arg1 = (blpapi_ResolutionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_TopicList_t *)blpapi_TopicList_createFromResolutionList(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_TopicList, 0 |  0 );
   return resultobj;
@@ -5323,9 +6031,9 @@ SWIGINTERN PyObject *_wrap_new_intArray(PyObject *SWIGUNUSEDPARM(self), PyObject
   } 
   arg1 = (size_t)(val1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (intArray *)new_intArray(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_intArray, SWIG_POINTER_NEW |  0 );
   return resultobj;
@@ -5348,9 +6056,9 @@ SWIGINTERN PyObject *_wrap_delete_intArray(PyObject *SWIGUNUSEDPARM(self), PyObj
   }
   arg1 = (intArray *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     delete_intArray(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -5383,9 +6091,9 @@ SWIGINTERN PyObject *_wrap_intArray___getitem__(PyObject *SWIGUNUSEDPARM(self),
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)intArray___getitem__(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -5426,9 +6134,9 @@ SWIGINTERN PyObject *_wrap_intArray___setitem__(PyObject *SWIGUNUSEDPARM(self),
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     intArray___setitem__(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -5452,9 +6160,9 @@ SWIGINTERN PyObject *_wrap_intArray_cast(PyObject *SWIGUNUSEDPARM(self), PyObjec
   }
   arg1 = (intArray *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int *)intArray_cast(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
   return resultobj;
@@ -5478,9 +6186,9 @@ SWIGINTERN PyObject *_wrap_intArray_frompointer(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (int *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (intArray *)intArray_frompointer(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_intArray, 0 |  0 );
   return resultobj;
@@ -5511,9 +6219,9 @@ SWIGINTERN PyObject *_wrap_new_topicPtrArray(PyObject *SWIGUNUSEDPARM(self), PyO
   } 
   arg1 = (size_t)(val1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Topic_t **)new_topicPtrArray(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_blpapi_Topic, 0 |  0 );
   return resultobj;
@@ -5536,9 +6244,9 @@ SWIGINTERN PyObject *_wrap_delete_topicPtrArray(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Topic_t **)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     delete_topicPtrArray(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -5571,9 +6279,9 @@ SWIGINTERN PyObject *_wrap_topicPtrArray_getitem(PyObject *SWIGUNUSEDPARM(self),
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Topic_t *)topicPtrArray_getitem(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Topic, 0 |  0 );
   return resultobj;
@@ -5614,9 +6322,9 @@ SWIGINTERN PyObject *_wrap_topicPtrArray_setitem(PyObject *SWIGUNUSEDPARM(self),
   }
   arg3 = (blpapi_Topic_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     topicPtrArray_setitem(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -5671,9 +6379,9 @@ SWIGINTERN PyObject *_wrap_CorrelationId_value_get(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (struct blpapi_CorrelationId_t_ *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_CorrelationId_t__value *)& ((arg1)->value);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_CorrelationId_t__value, 0 |  0 );
   return resultobj;
@@ -5964,9 +6672,9 @@ SWIGINTERN PyObject *_wrap_new_blpapi_CorrelationId_t__value(PyObject *SWIGUNUSE
   
   if (!PyArg_ParseTuple(args,(char *)":new_blpapi_CorrelationId_t__value")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_CorrelationId_t__value *)calloc(1, sizeof(blpapi_CorrelationId_t__value));
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_CorrelationId_t__value, SWIG_POINTER_NEW |  0 );
   return resultobj;
@@ -5989,9 +6697,9 @@ SWIGINTERN PyObject *_wrap_delete_blpapi_CorrelationId_t__value(PyObject *SWIGUN
   }
   arg1 = (blpapi_CorrelationId_t__value *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     free((char *) arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -6050,9 +6758,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementFloat(PyObject *SWIGUNUSEDPA
   } 
   arg4 = (blpapi_Float64_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementFloat(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -6096,9 +6804,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueFloat(PyObject *SWIGUNUSEDPARM
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueFloat(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6144,9 +6852,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_printHelper(PyObject *SWIGUNUSEDPARM(s
   } 
   arg3 = (int)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Element_printHelper(arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (*arg4) {
@@ -6159,6 +6867,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_blpapi_Element_toJSONHelper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  blpapi_Element_t *arg1 = (blpapi_Element_t *) 0 ;
+  int arg2 ;
+  int arg3 ;
+  PyObject *arg4 = (PyObject *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:blpapi_Element_toJSONHelper",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_blpapi_Element, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "blpapi_Element_toJSONHelper" "', argument " "1"" of type '" "blpapi_Element_t *""'"); 
+  }
+  arg1 = (blpapi_Element_t *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "blpapi_Element_toJSONHelper" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "blpapi_Element_toJSONHelper" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  arg4 = obj3;
+  result = (PyObject *)blpapi_Element_toJSONHelper(arg1,arg2,arg3,arg4);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_blpapi_Element_name(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   blpapi_Element_t *arg1 = (blpapi_Element_t *) 0 ;
@@ -6174,9 +6925,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_name(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_Element_name((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -6200,9 +6951,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_nameString(PyObject *SWIGUNUSEDPARM(se
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Element_nameString((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -6226,9 +6977,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_definition(PyObject *SWIGUNUSEDPARM(se
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SchemaElementDefinition_t *)blpapi_Element_definition((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_void, 0 |  0 );
   return resultobj;
@@ -6252,9 +7003,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_datatype(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_datatype((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6278,9 +7029,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_isComplexType(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_isComplexType((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6304,9 +7055,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_isArray(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_isArray((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6330,9 +7081,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_isReadOnly(PyObject *SWIGUNUSEDPARM(se
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_isReadOnly((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6356,9 +7107,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_numValues(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_Element_numValues((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -6382,9 +7133,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_numElements(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_Element_numElements((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -6417,9 +7168,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_isNullValue(PyObject *SWIGUNUSEDPARM(s
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_isNullValue((struct blpapi_Element const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6443,9 +7194,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_isNull(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_isNull((struct blpapi_Element const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6481,9 +7232,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getElementAt(PyObject *SWIGUNUSEDPARM(
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getElementAt((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -6530,9 +7281,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getElement(PyObject *SWIGUNUSEDPARM(se
   }
   arg4 = (blpapi_Name_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getElement((struct blpapi_Element const *)arg1,arg2,(char const *)arg3,(struct blpapi_Name const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -6596,9 +7347,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_hasElementEx(PyObject *SWIGUNUSEDPARM(
   } 
   arg5 = (int)(val5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_hasElementEx((struct blpapi_Element const *)arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -6637,9 +7388,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsBool(PyObject *SWIGUNUSEDPAR
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsBool((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -6688,9 +7439,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsChar(PyObject *SWIGUNUSEDPAR
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsChar((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -6734,9 +7485,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsInt32(PyObject *SWIGUNUSEDPA
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsInt32((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -6773,9 +7524,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsInt64(PyObject *SWIGUNUSEDPA
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsInt64((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -6818,9 +7569,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsFloat64(PyObject *SWIGUNUSED
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsFloat64((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -6862,9 +7613,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsString(PyObject *SWIGUNUSEDP
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsString((struct blpapi_Element const *)arg1,(char const **)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -6901,9 +7652,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsDatetime(PyObject *SWIGUNUSE
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsDatetime((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -6944,9 +7695,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsHighPrecisionDatetime(PyObje
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsHighPrecisionDatetime((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -6987,9 +7738,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsElement(PyObject *SWIGUNUSED
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsElement((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -7026,9 +7777,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getValueAsName(PyObject *SWIGUNUSEDPAR
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getValueAsName((struct blpapi_Element const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Name, 0));
@@ -7056,9 +7807,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_getChoice(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_getChoice((struct blpapi_Element const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -7101,9 +7852,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueBool(PyObject *SWIGUNUSEDPARM(
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueBool(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7145,9 +7896,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueInt32(PyObject *SWIGUNUSEDPARM
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueInt32(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7189,9 +7940,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueInt64(PyObject *SWIGUNUSEDPARM
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueInt64(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7234,9 +7985,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueString(PyObject *SWIGUNUSEDPAR
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueString(arg1,(char const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7280,9 +8031,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueDatetime(PyObject *SWIGUNUSEDP
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueDatetime(arg1,(struct blpapi_Datetime_tag const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7324,9 +8075,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setValueFromName(PyObject *SWIGUNUSEDP
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setValueFromName(arg1,(struct blpapi_Name const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7378,9 +8129,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementBool(PyObject *SWIGUNUSEDPAR
   } 
   arg4 = (blpapi_Bool_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementBool(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7434,9 +8185,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementInt32(PyObject *SWIGUNUSEDPA
   } 
   arg4 = (blpapi_Int32_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementInt32(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7490,9 +8241,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementInt64(PyObject *SWIGUNUSEDPA
   } 
   arg4 = (blpapi_Int64_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementInt64(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7547,9 +8298,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementString(PyObject *SWIGUNUSEDP
   }
   arg4 = (char *)(buf4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementString(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(char const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7605,9 +8356,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementDatetime(PyObject *SWIGUNUSE
   }
   arg4 = (blpapi_Datetime_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementDatetime(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(struct blpapi_Datetime_tag const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7661,9 +8412,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setElementFromName(PyObject *SWIGUNUSE
   }
   arg4 = (blpapi_Name_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setElementFromName(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(struct blpapi_Name const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7692,9 +8443,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_appendElement(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_Element_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_appendElement(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -7750,9 +8501,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Element_setChoice(PyObject *SWIGUNUSEDPARM(sel
   } 
   arg5 = (size_t)(val5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Element_setChoice(arg1,arg2,(char const *)arg3,(struct blpapi_Name const *)arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -7807,9 +8558,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueFloat(PyObject *SWIGUNU
   } 
   arg4 = (blpapi_Float64_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueFloat(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -7844,9 +8595,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueFloat(PyObject *SWIG
   } 
   arg2 = (blpapi_Float64_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueFloat(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -7870,9 +8621,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_create(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_Event_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_EventFormatter_t *)blpapi_EventFormatter_create(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_EventFormatter, 0 |  0 );
   return resultobj;
@@ -7895,9 +8646,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_destroy(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (blpapi_EventFormatter_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_EventFormatter_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -7949,9 +8700,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendMessage(PyObject *SWIGUNU
   }
   arg4 = (blpapi_Topic_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendMessage(arg1,(char const *)arg2,arg3,(struct blpapi_Topic const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8023,9 +8774,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendMessageSeq(PyObject *SWIG
   } 
   arg6 = (unsigned int)(val6);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendMessageSeq(arg1,(char const *)arg2,arg3,(struct blpapi_Topic const *)arg4,arg5,arg6);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8070,9 +8821,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendResponse(PyObject *SWIGUN
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendResponse(arg1,(char const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8116,9 +8867,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendRecapMessage(PyObject *SW
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendRecapMessage(arg1,(struct blpapi_Topic const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8178,9 +8929,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendRecapMessageSeq(PyObject
   } 
   arg5 = (unsigned int)(val5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendRecapMessageSeq(arg1,(struct blpapi_Topic const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8250,9 +9001,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendFragmentedRecapMessage(Py
   } 
   arg6 = (int)(val6);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendFragmentedRecapMessage(arg1,(char const *)arg2,arg3,(struct blpapi_Topic const *)arg4,(struct blpapi_CorrelationId_t_ const *)arg5,arg6);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8324,9 +9075,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendFragmentedRecapMessageSeq
   } 
   arg6 = (unsigned int)(val6);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendFragmentedRecapMessageSeq(arg1,(char const *)arg2,arg3,(struct blpapi_Topic const *)arg4,arg5,arg6);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8380,9 +9131,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueBool(PyObject *SWIGUNUS
   } 
   arg4 = (blpapi_Bool_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueBool(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8436,9 +9187,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueChar(PyObject *SWIGUNUS
   } 
   arg4 = (char)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueChar(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8492,9 +9243,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueInt32(PyObject *SWIGUNU
   } 
   arg4 = (blpapi_Int32_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueInt32(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8548,9 +9299,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueInt64(PyObject *SWIGUNU
   } 
   arg4 = (blpapi_Int64_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueInt64(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8604,9 +9355,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueDatetime(PyObject *SWIG
   }
   arg4 = (blpapi_Datetime_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueDatetime(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(struct blpapi_Datetime_tag const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8661,9 +9412,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueString(PyObject *SWIGUN
   }
   arg4 = (char *)(buf4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueString(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(char const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8719,9 +9470,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueFromName(PyObject *SWIG
   }
   arg4 = (blpapi_Name_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueFromName(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3,(struct blpapi_Name const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8766,9 +9517,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_setValueNull(PyObject *SWIGUNUS
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_setValueNull(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8813,9 +9564,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_pushElement(PyObject *SWIGUNUSE
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_pushElement(arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -8841,9 +9592,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_popElement(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_EventFormatter_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_popElement(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8876,9 +9627,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueBool(PyObject *SWIGU
   } 
   arg2 = (blpapi_Bool_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueBool(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8911,9 +9662,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueChar(PyObject *SWIGU
   } 
   arg2 = (char)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueChar(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8946,9 +9697,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueInt32(PyObject *SWIG
   } 
   arg2 = (blpapi_Int32_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueInt32(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -8981,9 +9732,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueInt64(PyObject *SWIG
   } 
   arg2 = (blpapi_Int64_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueInt64(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9016,9 +9767,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueDatetime(PyObject *S
   }
   arg2 = (blpapi_Datetime_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueDatetime(arg1,(struct blpapi_Datetime_tag const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9052,9 +9803,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueString(PyObject *SWI
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueString(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9089,9 +9840,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendValueFromName(PyObject *S
   }
   arg2 = (blpapi_Name_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendValueFromName(arg1,(struct blpapi_Name const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9115,9 +9866,9 @@ SWIGINTERN PyObject *_wrap_blpapi_EventFormatter_appendElement(PyObject *SWIGUNU
   }
   arg1 = (blpapi_EventFormatter_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_EventFormatter_appendElement(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9385,9 +10136,9 @@ SWIGINTERN PyObject *_wrap_blpapi_getLastErrorDescription(PyObject *SWIGUNUSEDPA
   } 
   arg1 = (int)(val1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_getLastErrorDescription(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -9402,9 +10153,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_create(PyObject *SWIGUNUSEDPARM
   
   if (!PyArg_ParseTuple(args,(char *)":blpapi_SessionOptions_create")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SessionOptions_t *)blpapi_SessionOptions_create();
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_SessionOptions, 0 |  0 );
   return resultobj;
@@ -9427,9 +10178,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_destroy(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9463,9 +10214,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setServerHost(PyObject *SWIGUNU
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setServerHost(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9500,9 +10251,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setServerPort(PyObject *SWIGUNU
   } 
   arg2 = (unsigned short)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setServerPort(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9554,9 +10305,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setServerAddress(PyObject *SWIG
   } 
   arg4 = (size_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setServerAddress(arg1,(char const *)arg2,arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9591,9 +10342,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_removeServerAddress(PyObject *S
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_removeServerAddress(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9626,9 +10377,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setConnectTimeout(PyObject *SWI
   } 
   arg2 = (unsigned int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setConnectTimeout(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -9662,9 +10413,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setDefaultServices(PyObject *SW
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setDefaultServices(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9700,9 +10451,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setDefaultSubscriptionService(P
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setDefaultSubscriptionService(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9737,9 +10488,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setDefaultTopicPrefix(PyObject
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setDefaultTopicPrefix(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9773,9 +10524,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setAllowMultipleCorrelatorsPerM
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setAllowMultipleCorrelatorsPerMsg(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9807,9 +10558,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setClientMode(PyObject *SWIGUNU
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setClientMode(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9841,9 +10592,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setMaxPendingRequests(PyObject
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setMaxPendingRequests(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9875,9 +10626,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setAutoRestartOnDisconnection(P
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setAutoRestartOnDisconnection(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9910,9 +10661,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setAuthenticationOptions(PyObje
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setAuthenticationOptions(arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -9946,9 +10697,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setNumStartAttempts(PyObject *S
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setNumStartAttempts(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -9980,9 +10731,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setMaxEventQueueSize(PyObject *
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setMaxEventQueueSize(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10015,9 +10766,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setSlowConsumerWarningHiWaterMa
   } 
   arg2 = (float)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setSlowConsumerWarningHiWaterMark(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10050,9 +10801,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setSlowConsumerWarningLoWaterMa
   } 
   arg2 = (float)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setSlowConsumerWarningLoWaterMark(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10085,9 +10836,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setDefaultKeepAliveInactivityTi
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setDefaultKeepAliveInactivityTime(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10120,9 +10871,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setDefaultKeepAliveResponseTime
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setDefaultKeepAliveResponseTimeout(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10155,9 +10906,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setKeepAliveEnabled(PyObject *S
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setKeepAliveEnabled(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10189,9 +10940,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setRecordSubscriptionDataReceiv
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setRecordSubscriptionDataReceiveTimes(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10224,9 +10975,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setServiceCheckTimeout(PyObject
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setServiceCheckTimeout(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10259,9 +11010,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setServiceDownloadTimeout(PyObj
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setServiceDownloadTimeout(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10293,9 +11044,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setTlsOptions(PyObject *SWIGUNU
   }
   arg2 = (blpapi_TlsOptions_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SessionOptions_setTlsOptions(arg1,(struct blpapi_TlsOptions const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10328,9 +11079,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setFlushPublishedEventsTimeout(
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setFlushPublishedEventsTimeout(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10363,9 +11114,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_setBandwidthSaveModeDisabled(Py
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_setBandwidthSaveModeDisabled(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10389,9 +11140,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_serverHost(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SessionOptions_serverHost(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -10415,9 +11166,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_serverPort(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (unsigned int)blpapi_SessionOptions_serverPort(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_int((unsigned int)(result));
   return resultobj;
@@ -10441,9 +11192,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_numServerAddresses(PyObject *SW
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_numServerAddresses(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10482,9 +11233,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_getServerAddress(PyObject *SWIG
   } 
   arg4 = (size_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_getServerAddress(arg1,(char const **)arg2,arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -10512,9 +11263,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_connectTimeout(PyObject *SWIGUN
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (unsigned int)blpapi_SessionOptions_connectTimeout(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_int((unsigned int)(result));
   return resultobj;
@@ -10538,9 +11289,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_defaultServices(PyObject *SWIGU
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SessionOptions_defaultServices(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -10564,9 +11315,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_defaultSubscriptionService(PyOb
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SessionOptions_defaultSubscriptionService(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -10590,9 +11341,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_defaultTopicPrefix(PyObject *SW
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SessionOptions_defaultTopicPrefix(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -10616,9 +11367,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_allowMultipleCorrelatorsPerMsg(
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_allowMultipleCorrelatorsPerMsg(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10642,9 +11393,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_clientMode(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_clientMode(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10668,9 +11419,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_maxPendingRequests(PyObject *SW
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_maxPendingRequests(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10694,9 +11445,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_autoRestartOnDisconnection(PyOb
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_autoRestartOnDisconnection(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10720,9 +11471,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_authenticationOptions(PyObject
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SessionOptions_authenticationOptions(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -10746,9 +11497,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_numStartAttempts(PyObject *SWIG
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_numStartAttempts(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10772,9 +11523,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_maxEventQueueSize(PyObject *SWI
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_SessionOptions_maxEventQueueSize(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -10798,9 +11549,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_slowConsumerWarningHiWaterMark(
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (float)blpapi_SessionOptions_slowConsumerWarningHiWaterMark(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_float((float)(result));
   return resultobj;
@@ -10824,9 +11575,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_slowConsumerWarningLoWaterMark(
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (float)blpapi_SessionOptions_slowConsumerWarningLoWaterMark(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_float((float)(result));
   return resultobj;
@@ -10850,9 +11601,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_defaultKeepAliveInactivityTime(
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_defaultKeepAliveInactivityTime(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10876,9 +11627,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_defaultKeepAliveResponseTimeout
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_defaultKeepAliveResponseTimeout(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10902,9 +11653,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_keepAliveEnabled(PyObject *SWIG
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_keepAliveEnabled(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10928,9 +11679,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_recordSubscriptionDataReceiveTi
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_recordSubscriptionDataReceiveTimes(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10954,9 +11705,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_serviceCheckTimeout(PyObject *S
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_serviceCheckTimeout(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -10980,9 +11731,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_serviceDownloadTimeout(PyObject
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_serviceDownloadTimeout(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11006,9 +11757,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_flushPublishedEventsTimeout(PyO
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_flushPublishedEventsTimeout(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11032,9 +11783,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SessionOptions_bandwidthSaveModeDisabled(PyObj
   }
   arg1 = (blpapi_SessionOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SessionOptions_bandwidthSaveModeDisabled(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11264,9 +12015,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_create(PyObject *SWIGUNUSEDPARM(self), Py
   }
   arg1 = (char *)(buf1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_Name_create((char const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
@@ -11291,9 +12042,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_destroy(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = (blpapi_Name_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Name_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11327,9 +12078,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_equalsStr(PyObject *SWIGUNUSEDPARM(self),
   }
   arg2 = (char *)(buf2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Name_equalsStr((struct blpapi_Name const *)arg1,(char const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -11355,9 +12106,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_string(PyObject *SWIGUNUSEDPARM(self), Py
   }
   arg1 = (blpapi_Name_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Name_string((struct blpapi_Name const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -11381,9 +12132,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_length(PyObject *SWIGUNUSEDPARM(self), Py
   }
   arg1 = (blpapi_Name_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_Name_length((struct blpapi_Name const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -11408,9 +12159,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Name_findName(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (char *)(buf1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_Name_findName((char const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   if (alloc1 == SWIG_NEWOBJ) free((char*)buf1);
@@ -11427,9 +12178,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_create(PyObject *SWIGUNUSEDPA
   
   if (!PyArg_ParseTuple(args,(char *)":blpapi_SubscriptionList_create")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SubscriptionList_t *)blpapi_SubscriptionList_create();
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_SubscriptionList, 0 |  0 );
   return resultobj;
@@ -11452,9 +12203,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_destroy(PyObject *SWIGUNUSEDP
   }
   arg1 = (blpapi_SubscriptionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_SubscriptionList_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11497,9 +12248,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_addResolved(PyObject *SWIGUNU
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_addResolved(arg1,(char const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -11525,9 +12276,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_clear(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (blpapi_SubscriptionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_clear(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11560,9 +12311,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_append(PyObject *SWIGUNUSEDPA
   }
   arg2 = (blpapi_SubscriptionList_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_append(arg1,(struct blpapi_SubscriptionList const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11586,9 +12337,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_size(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_SubscriptionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_size((struct blpapi_SubscriptionList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -11624,9 +12375,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_correlationIdAt(PyObject *SWI
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_correlationIdAt((struct blpapi_SubscriptionList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (!result) {
@@ -11667,9 +12418,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_topicStringAt(PyObject *SWIGU
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_topicStringAt(arg1,(char const **)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -11707,9 +12458,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SubscriptionList_isResolvedAt(PyObject *SWIGUN
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SubscriptionList_isResolvedAt(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -11747,9 +12498,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TimePoint_d_value_set(PyObject *SWIGUNUSEDPARM
   } 
   arg2 = (blpapi_Int64_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->d_value = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11773,9 +12524,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TimePoint_d_value_get(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (struct blpapi_TimePoint *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Int64_t) ((arg1)->d_value);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_long_SS_long((long long)(result));
   return resultobj;
@@ -11790,9 +12541,9 @@ SWIGINTERN PyObject *_wrap_new_blpapi_TimePoint(PyObject *SWIGUNUSEDPARM(self),
   
   if (!PyArg_ParseTuple(args,(char *)":new_blpapi_TimePoint")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (struct blpapi_TimePoint *)calloc(1, sizeof(struct blpapi_TimePoint));
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_TimePoint, SWIG_POINTER_NEW |  0 );
   return resultobj;
@@ -11815,9 +12566,9 @@ SWIGINTERN PyObject *_wrap_delete_blpapi_TimePoint(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (struct blpapi_TimePoint *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     free((char *) arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11857,9 +12608,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TimePointUtil_nanosecondsBetween(PyObject *SWI
   }
   arg2 = (blpapi_TimePoint_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (long long)blpapi_TimePointUtil_nanosecondsBetween((struct blpapi_TimePoint const *)arg1,(struct blpapi_TimePoint const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_long_SS_long((long long)(result));
   return resultobj;
@@ -11891,9 +12642,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_parts_set(PyObject *SWIGUNUSEDPAR
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->parts = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11917,9 +12668,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_parts_get(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->parts);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -11951,9 +12702,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_hours_set(PyObject *SWIGUNUSEDPAR
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->hours = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -11977,9 +12728,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_hours_get(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->hours);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -12011,9 +12762,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_minutes_set(PyObject *SWIGUNUSEDP
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->minutes = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12037,9 +12788,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_minutes_get(PyObject *SWIGUNUSEDP
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->minutes);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -12071,9 +12822,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_seconds_set(PyObject *SWIGUNUSEDP
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->seconds = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12097,9 +12848,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_seconds_get(PyObject *SWIGUNUSEDP
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->seconds);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -12131,9 +12882,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_milliSeconds_set(PyObject *SWIGUN
   } 
   arg2 = (blpapi_UInt16_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->milliSeconds = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12157,9 +12908,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_milliSeconds_get(PyObject *SWIGUN
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UInt16_t) ((arg1)->milliSeconds);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
   return resultobj;
@@ -12191,9 +12942,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_month_set(PyObject *SWIGUNUSEDPAR
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->month = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12217,9 +12968,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_month_get(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->month);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -12251,9 +13002,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_day_set(PyObject *SWIGUNUSEDPARM(
   } 
   arg2 = (blpapi_UChar_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->day = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12277,9 +13028,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_day_get(PyObject *SWIGUNUSEDPARM(
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UChar_t) ((arg1)->day);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
   return resultobj;
@@ -12311,9 +13062,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_year_set(PyObject *SWIGUNUSEDPARM
   } 
   arg2 = (blpapi_UInt16_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->year = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12337,9 +13088,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_year_get(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UInt16_t) ((arg1)->year);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_short((unsigned short)(result));
   return resultobj;
@@ -12371,9 +13122,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_offset_set(PyObject *SWIGUNUSEDPA
   } 
   arg2 = (blpapi_Int16_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->offset = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12397,9 +13148,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Datetime_tag_offset_get(PyObject *SWIGUNUSEDPA
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Int16_t) ((arg1)->offset);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_short((short)(result));
   return resultobj;
@@ -12414,9 +13165,9 @@ SWIGINTERN PyObject *_wrap_new_blpapi_Datetime_tag(PyObject *SWIGUNUSEDPARM(self
   
   if (!PyArg_ParseTuple(args,(char *)":new_blpapi_Datetime_tag")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (struct blpapi_Datetime_tag *)calloc(1, sizeof(struct blpapi_Datetime_tag));
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Datetime_tag, SWIG_POINTER_NEW |  0 );
   return resultobj;
@@ -12439,9 +13190,9 @@ SWIGINTERN PyObject *_wrap_delete_blpapi_Datetime_tag(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (struct blpapi_Datetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     free((char *) arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12480,9 +13231,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_tag_datetime_set(PyObjec
   }
   arg2 = (blpapi_Datetime_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->datetime = *arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12506,9 +13257,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_tag_datetime_get(PyObjec
   }
   arg1 = (struct blpapi_HighPrecisionDatetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Datetime_t *)& ((arg1)->datetime);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Datetime_tag, 0 |  0 );
   return resultobj;
@@ -12540,9 +13291,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_tag_picoseconds_set(PyOb
   } 
   arg2 = (blpapi_UInt32_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     if (arg1) (arg1)->picoseconds = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12566,9 +13317,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_tag_picoseconds_get(PyOb
   }
   arg1 = (struct blpapi_HighPrecisionDatetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_UInt32_t) ((arg1)->picoseconds);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_unsigned_SS_int((unsigned int)(result));
   return resultobj;
@@ -12583,9 +13334,9 @@ SWIGINTERN PyObject *_wrap_new_blpapi_HighPrecisionDatetime_tag(PyObject *SWIGUN
   
   if (!PyArg_ParseTuple(args,(char *)":new_blpapi_HighPrecisionDatetime_tag")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (struct blpapi_HighPrecisionDatetime_tag *)calloc(1, sizeof(struct blpapi_HighPrecisionDatetime_tag));
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_HighPrecisionDatetime_tag, SWIG_POINTER_NEW |  0 );
   return resultobj;
@@ -12608,9 +13359,9 @@ SWIGINTERN PyObject *_wrap_delete_blpapi_HighPrecisionDatetime_tag(PyObject *SWI
   }
   arg1 = (struct blpapi_HighPrecisionDatetime_tag *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     free((char *) arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12650,9 +13401,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_compare(PyObject *SWIGUN
   }
   arg2 = (blpapi_HighPrecisionDatetime_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_HighPrecisionDatetime_compare((struct blpapi_HighPrecisionDatetime_tag const *)arg1,(struct blpapi_HighPrecisionDatetime_tag const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -12716,9 +13467,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_print(PyObject *SWIGUNUS
   } 
   arg5 = (int)(val5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_HighPrecisionDatetime_print((struct blpapi_HighPrecisionDatetime_tag const *)arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -12754,9 +13505,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighPrecisionDatetime_fromTimePoint(PyObject *
   } 
   arg3 = (short)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_HighPrecisionDatetime_fromTimePoint(arg1,(struct blpapi_TimePoint const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -12785,9 +13536,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_name(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_Constant_name((struct blpapi_Constant const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -12811,9 +13562,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_description(PyObject *SWIGUNUSEDPARM(
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Constant_description((struct blpapi_Constant const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -12837,9 +13588,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_status(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_status((struct blpapi_Constant const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -12863,9 +13614,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_datatype(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_datatype((struct blpapi_Constant const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -12893,9 +13644,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_getValueAsInt64(PyObject *SWIGUNUSEDP
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_getValueAsInt64((struct blpapi_Constant const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -12929,9 +13680,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_getValueAsFloat64(PyObject *SWIGUNUSE
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_getValueAsFloat64((struct blpapi_Constant const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -12964,9 +13715,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_getValueAsDatetime(PyObject *SWIGUNUS
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_getValueAsDatetime((struct blpapi_Constant const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -12998,9 +13749,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Constant_getValueAsString(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_Constant_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Constant_getValueAsString((struct blpapi_Constant const *)arg1,(char const **)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -13025,9 +13776,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_name(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_ConstantList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_ConstantList_name((struct blpapi_ConstantList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -13051,9 +13802,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_description(PyObject *SWIGUNUSEDP
   }
   arg1 = (blpapi_ConstantList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_ConstantList_description((struct blpapi_ConstantList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -13077,9 +13828,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_numConstants(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_ConstantList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ConstantList_numConstants((struct blpapi_ConstantList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13103,9 +13854,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_datatype(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_ConstantList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ConstantList_datatype((struct blpapi_ConstantList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13129,9 +13880,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_status(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (blpapi_ConstantList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ConstantList_status((struct blpapi_ConstantList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13174,9 +13925,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_getConstant(PyObject *SWIGUNUSEDP
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Constant_t *)blpapi_ConstantList_getConstant((struct blpapi_ConstantList const *)arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Constant, 0 |  0 );
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -13211,9 +13962,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ConstantList_getConstantAt(PyObject *SWIGUNUSE
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Constant_t *)blpapi_ConstantList_getConstantAt((struct blpapi_ConstantList const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Constant, 0 |  0 );
   return resultobj;
@@ -13237,9 +13988,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_name(PyObject *SWIGUNU
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_SchemaElementDefinition_name((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -13263,9 +14014,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_description(PyObject *
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SchemaElementDefinition_description((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -13289,9 +14040,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_status(PyObject *SWIGU
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaElementDefinition_status((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13315,9 +14066,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_type(PyObject *SWIGUNU
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SchemaTypeDefinition_t *)blpapi_SchemaElementDefinition_type((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_void, 0 |  0 );
   return resultobj;
@@ -13341,9 +14092,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_numAlternateNames(PyOb
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_SchemaElementDefinition_numAlternateNames((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -13376,9 +14127,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_getAlternateName(PyObj
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_SchemaElementDefinition_getAlternateName((void *const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -13402,9 +14153,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_minValues(PyObject *SW
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_SchemaElementDefinition_minValues((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -13428,9 +14179,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaElementDefinition_maxValues(PyObject *SW
   }
   arg1 = (blpapi_SchemaElementDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_SchemaElementDefinition_maxValues((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -13454,9 +14205,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_name(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_SchemaTypeDefinition_name((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -13480,9 +14231,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_description(PyObject *SWI
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_SchemaTypeDefinition_description((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -13506,9 +14257,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_status(PyObject *SWIGUNUS
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_status((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13532,9 +14283,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_datatype(PyObject *SWIGUN
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_datatype((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13558,9 +14309,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_isComplexType(PyObject *S
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_isComplexType((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13584,9 +14335,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_isSimpleType(PyObject *SW
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_isSimpleType((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13610,9 +14361,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_isEnumerationType(PyObjec
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_SchemaTypeDefinition_isEnumerationType((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13636,9 +14387,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_numElementDefinitions(PyO
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_SchemaTypeDefinition_numElementDefinitions((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_size_t((size_t)(result));
   return resultobj;
@@ -13681,9 +14432,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_getElementDefinition(PyOb
   }
   arg3 = (blpapi_Name_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SchemaElementDefinition_t *)blpapi_SchemaTypeDefinition_getElementDefinition((void *const *)arg1,(char const *)arg2,(struct blpapi_Name const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_void, 0 |  0 );
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -13718,9 +14469,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_getElementDefinitionAt(Py
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_SchemaElementDefinition_t *)blpapi_SchemaTypeDefinition_getElementDefinitionAt((void *const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_void, 0 |  0 );
   return resultobj;
@@ -13744,9 +14495,9 @@ SWIGINTERN PyObject *_wrap_blpapi_SchemaTypeDefinition_enumeration(PyObject *SWI
   }
   arg1 = (blpapi_SchemaTypeDefinition_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_ConstantList_t *)blpapi_SchemaTypeDefinition_enumeration((void *const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_ConstantList, 0 |  0 );
   return resultobj;
@@ -13769,9 +14520,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Request_destroy(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Request_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Request_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -13795,9 +14546,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Request_elements(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (blpapi_Request_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Element_t *)blpapi_Request_elements(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Element, 0 |  0 );
   return resultobj;
@@ -13829,9 +14580,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Request_setPreferredRoute(PyObject *SWIGUNUSED
   }
   arg2 = (blpapi_CorrelationId_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Request_setPreferredRoute(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -13855,9 +14606,9 @@ SWIGINTERN PyObject *_wrap_blpapi_RequestTemplate_release(PyObject *SWIGUNUSEDPA
   }
   arg1 = (blpapi_RequestTemplate_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_RequestTemplate_release((struct blpapi_RequestTemplate const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -13881,9 +14632,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Operation_name(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Operation_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Operation_name(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -13907,9 +14658,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Operation_description(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_Operation_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Operation_description(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -13936,9 +14687,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Operation_requestDefinition(PyObject *SWIGUNUS
   }
   arg1 = (blpapi_Operation_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Operation_requestDefinition(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_p_void, 0));
@@ -13963,9 +14714,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Operation_numResponseDefinitions(PyObject *SWI
   }
   arg1 = (blpapi_Operation_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Operation_numResponseDefinitions(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14001,9 +14752,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Operation_responseDefinition(PyObject *SWIGUNU
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Operation_responseDefinition(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_p_void, 0));
@@ -14028,9 +14779,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_name(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Service_name(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -14054,9 +14805,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_description(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Service_description(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -14080,9 +14831,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_numOperations(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_numOperations(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14106,9 +14857,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_numEventDefinitions(PyObject *SWIGUNUS
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_numEventDefinitions(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14132,9 +14883,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_addRef(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_addRef(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14157,9 +14908,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_release(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Service_release(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -14183,9 +14934,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_authorizationServiceName(PyObject *SWI
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Service_authorizationServiceName(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -14231,9 +14982,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_getOperation(PyObject *SWIGUNUSEDPARM(
   }
   arg4 = (blpapi_Name_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_getOperation(arg1,arg2,(char const *)arg3,(struct blpapi_Name const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Operation, 0));
@@ -14272,9 +15023,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_getOperationAt(PyObject *SWIGUNUSEDPAR
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_getOperationAt(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Operation, 0));
@@ -14321,9 +15072,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_getEventDefinition(PyObject *SWIGUNUSE
   }
   arg4 = (blpapi_Name_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_getEventDefinition(arg1,arg2,(char const *)arg3,(struct blpapi_Name const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_p_void, 0));
@@ -14362,9 +15113,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_getEventDefinitionAt(PyObject *SWIGUNU
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_getEventDefinitionAt(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_p_void, 0));
@@ -14402,9 +15153,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_createRequest(PyObject *SWIGUNUSEDPARM
   }
   arg3 = (char *)(buf3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_createRequest(arg1,arg2,(char const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Request, 0));
@@ -14444,9 +15195,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_createAuthorizationRequest(PyObject *S
   }
   arg3 = (char *)(buf3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_createAuthorizationRequest(arg1,arg2,(char const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Request, 0));
@@ -14476,9 +15227,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_createPublishEvent(PyObject *SWIGUNUSE
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_createPublishEvent(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Event, 0));
@@ -14506,9 +15257,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_createAdminEvent(PyObject *SWIGUNUSEDP
   }
   arg1 = (blpapi_Service_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_createAdminEvent(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Event, 0));
@@ -14545,9 +15296,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Service_createResponseEvent(PyObject *SWIGUNUS
   }
   arg2 = (blpapi_CorrelationId_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Service_createResponseEvent(arg1,(struct blpapi_CorrelationId_t_ const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg3), SWIGTYPE_p_blpapi_Event, 0));
@@ -14572,9 +15323,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_messageType(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Name_t *)blpapi_Message_messageType((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Name, 0 |  0 );
   return resultobj;
@@ -14598,9 +15349,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_topicName(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (char *)blpapi_Message_topicName((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_FromCharPtr((const char *)result);
   return resultobj;
@@ -14624,9 +15375,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_service(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Service_t *)blpapi_Message_service((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Service, 0 |  0 );
   return resultobj;
@@ -14650,9 +15401,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_numCorrelationIds(PyObject *SWIGUNUSED
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_numCorrelationIds((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14685,9 +15436,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_correlationId(PyObject *SWIGUNUSEDPARM
   } 
   arg2 = (size_t)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = blpapi_Message_correlationId((struct blpapi_Message const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj(CorrelationId_t_clone(&result), SWIGTYPE_p_blpapi_CorrelationId_t_, SWIG_POINTER_OWN));
@@ -14698,6 +15449,28 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_blpapi_Message_correlationIdsHelper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  blpapi_Message_t *arg1 = (blpapi_Message_t *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:blpapi_Message_correlationIdsHelper",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_blpapi_Message, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "blpapi_Message_correlationIdsHelper" "', argument " "1"" of type '" "blpapi_Message_t const *""'"); 
+  }
+  arg1 = (blpapi_Message_t *)(argp1);
+  result = (PyObject *)blpapi_Message_correlationIdsHelper((struct blpapi_Message const *)arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_blpapi_Message_elements(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   blpapi_Message_t *arg1 = (blpapi_Message_t *) 0 ;
@@ -14713,9 +15486,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_elements(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Element_t *)blpapi_Message_elements((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Element, 0 |  0 );
   return resultobj;
@@ -14739,9 +15512,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_fragmentType(PyObject *SWIGUNUSEDPARM(
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_fragmentType((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14765,9 +15538,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_recapType(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_recapType((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14831,9 +15604,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_print(PyObject *SWIGUNUSEDPARM(self),
   } 
   arg5 = (int)(val5);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_print((struct blpapi_Message const *)arg1,arg2,arg3,arg4,arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14857,9 +15630,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_addRef(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_addRef((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14883,9 +15656,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_release(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_release((struct blpapi_Message const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14912,9 +15685,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Message_timeReceived(PyObject *SWIGUNUSEDPARM(
   }
   arg1 = (blpapi_Message_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Message_timeReceived((struct blpapi_Message const *)arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -14943,9 +15716,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Event_eventType(PyObject *SWIGUNUSEDPARM(self)
   }
   arg1 = (blpapi_Event_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Event_eventType((struct blpapi_Event const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -14969,9 +15742,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Event_release(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Event_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Event_release((struct blpapi_Event const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -15129,9 +15902,9 @@ SWIGINTERN PyObject *_wrap_blpapi_MessageIterator_create(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (blpapi_Event_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_MessageIterator_t *)blpapi_MessageIterator_create((struct blpapi_Event const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_MessageIterator, 0 |  0 );
   return resultobj;
@@ -15154,9 +15927,9 @@ SWIGINTERN PyObject *_wrap_blpapi_MessageIterator_destroy(PyObject *SWIGUNUSEDPA
   }
   arg1 = (blpapi_MessageIterator_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_MessageIterator_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -15183,9 +15956,9 @@ SWIGINTERN PyObject *_wrap_blpapi_MessageIterator_next(PyObject *SWIGUNUSEDPARM(
   }
   arg1 = (blpapi_MessageIterator_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_MessageIterator_next(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Message, 0));
@@ -15406,9 +16179,9 @@ SWIGINTERN PyObject *_wrap_blpapi_HighResolutionClock_now(PyObject *SWIGUNUSEDPA
   arg1 = &temp1;
   if (!PyArg_ParseTuple(args,(char *)":blpapi_HighResolutionClock_now")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_HighResolutionClock_now(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -16540,9 +17313,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_extractAttributeFromResolutionS
   }
   arg2 = (blpapi_Name_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Element_t *)blpapi_ResolutionList_extractAttributeFromResolutionSuccess((struct blpapi_Message const *)arg1,(struct blpapi_Name const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Element, 0 |  0 );
   return resultobj;
@@ -16566,9 +17339,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_create(PyObject *SWIGUNUSEDPARM
   }
   arg1 = (blpapi_ResolutionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_ResolutionList_t *)blpapi_ResolutionList_create(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_ResolutionList, 0 |  0 );
   return resultobj;
@@ -16591,9 +17364,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_destroy(PyObject *SWIGUNUSEDPAR
   }
   arg1 = (blpapi_ResolutionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ResolutionList_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -16636,9 +17409,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_add(PyObject *SWIGUNUSEDPARM(se
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_add(arg1,(char const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -16682,9 +17455,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_addFromMessage(PyObject *SWIGUN
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_addFromMessage(arg1,(struct blpapi_Message const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -16717,9 +17490,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_addAttribute(PyObject *SWIGUNUS
   }
   arg2 = (blpapi_Name_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_addAttribute(arg1,(struct blpapi_Name const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -16755,9 +17528,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_correlationIdAt(PyObject *SWIGU
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_correlationIdAt((struct blpapi_ResolutionList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (!result) {
@@ -16798,9 +17571,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_topicString(PyObject *SWIGUNUSE
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_topicString((struct blpapi_ResolutionList const *)arg1,(char const **)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -16837,9 +17610,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_topicStringAt(PyObject *SWIGUNU
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_topicStringAt((struct blpapi_ResolutionList const *)arg1,(char const **)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -16877,9 +17650,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_status(PyObject *SWIGUNUSEDPARM
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_status((struct blpapi_ResolutionList const *)arg1,arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -16922,9 +17695,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_statusAt(PyObject *SWIGUNUSEDPA
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_statusAt((struct blpapi_ResolutionList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -16975,9 +17748,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_attribute(PyObject *SWIGUNUSEDP
   }
   arg4 = (blpapi_CorrelationId_t *)(argp4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_attribute((struct blpapi_ResolutionList const *)arg1,arg2,(struct blpapi_Name const *)arg3,(struct blpapi_CorrelationId_t_ const *)arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -17023,9 +17796,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_attributeAt(PyObject *SWIGUNUSE
   } 
   arg4 = (size_t)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_attributeAt((struct blpapi_ResolutionList const *)arg1,arg2,(struct blpapi_Name const *)arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Element, 0));
@@ -17062,9 +17835,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_message(PyObject *SWIGUNUSEDPAR
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_message((struct blpapi_ResolutionList const *)arg1,arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Message, 0));
@@ -17101,9 +17874,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_messageAt(PyObject *SWIGUNUSEDP
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_messageAt((struct blpapi_ResolutionList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Message, 0));
@@ -17128,9 +17901,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ResolutionList_size(PyObject *SWIGUNUSEDPARM(s
   }
   arg1 = (blpapi_ResolutionList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ResolutionList_size((struct blpapi_ResolutionList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -17154,9 +17927,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Topic_create(PyObject *SWIGUNUSEDPARM(self), P
   }
   arg1 = (blpapi_Topic_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Topic_t *)blpapi_Topic_create(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Topic, 0 |  0 );
   return resultobj;
@@ -17179,9 +17952,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Topic_destroy(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Topic_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_Topic_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -17214,9 +17987,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Topic_compare(PyObject *SWIGUNUSEDPARM(self),
   }
   arg2 = (blpapi_Topic_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Topic_compare((struct blpapi_Topic const *)arg1,(struct blpapi_Topic const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -17240,9 +18013,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Topic_service(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Topic_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_Service_t *)blpapi_Topic_service((struct blpapi_Topic const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_Service, 0 |  0 );
   return resultobj;
@@ -17266,9 +18039,9 @@ SWIGINTERN PyObject *_wrap_blpapi_Topic_isActive(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_Topic_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_Topic_isActive((struct blpapi_Topic const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -17292,9 +18065,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_create(PyObject *SWIGUNUSEDPARM(self
   }
   arg1 = (blpapi_TopicList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_TopicList_t *)blpapi_TopicList_create(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_TopicList, 0 |  0 );
   return resultobj;
@@ -17317,9 +18090,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_destroy(PyObject *SWIGUNUSEDPARM(sel
   }
   arg1 = (blpapi_TopicList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_TopicList_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -17362,9 +18135,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_add(PyObject *SWIGUNUSEDPARM(self),
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_add(arg1,(char const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
@@ -17408,9 +18181,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_addFromMessage(PyObject *SWIGUNUSEDP
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_addFromMessage(arg1,(struct blpapi_Message const *)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -17446,9 +18219,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_correlationIdAt(PyObject *SWIGUNUSED
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_correlationIdAt((struct blpapi_TopicList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (!result) {
@@ -17489,9 +18262,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_topicString(PyObject *SWIGUNUSEDPARM
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_topicString((struct blpapi_TopicList const *)arg1,(char const **)arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -17528,9 +18301,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_topicStringAt(PyObject *SWIGUNUSEDPA
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_topicStringAt((struct blpapi_TopicList const *)arg1,(char const **)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_FromCharPtr(*arg2));
@@ -17568,9 +18341,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_status(PyObject *SWIGUNUSEDPARM(self
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_status((struct blpapi_TopicList const *)arg1,arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -17613,9 +18386,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_statusAt(PyObject *SWIGUNUSEDPARM(se
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_statusAt((struct blpapi_TopicList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   if (SWIG_IsTmpObj(res2)) {
@@ -17657,9 +18430,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_message(PyObject *SWIGUNUSEDPARM(sel
   }
   arg3 = (blpapi_CorrelationId_t *)(argp3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_message((struct blpapi_TopicList const *)arg1,arg2,(struct blpapi_CorrelationId_t_ const *)arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Message, 0));
@@ -17696,9 +18469,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_messageAt(PyObject *SWIGUNUSEDPARM(s
   } 
   arg3 = (size_t)(val3);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_messageAt((struct blpapi_TopicList const *)arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_NewPointerObj((*arg2), SWIGTYPE_p_blpapi_Message, 0));
@@ -17723,9 +18496,9 @@ SWIGINTERN PyObject *_wrap_blpapi_TopicList_size(PyObject *SWIGUNUSEDPARM(self),
   }
   arg1 = (blpapi_TopicList_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_TopicList_size((struct blpapi_TopicList const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -18847,9 +19620,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_create(PyObject *SW
   
   if (!PyArg_ParseTuple(args,(char *)":blpapi_ServiceRegistrationOptions_create")) SWIG_fail;
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_ServiceRegistrationOptions_t *)blpapi_ServiceRegistrationOptions_create();
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_ServiceRegistrationOptions, 0 |  0 );
   return resultobj;
@@ -18873,9 +19646,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_duplicate(PyObject
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (blpapi_ServiceRegistrationOptions_t *)blpapi_ServiceRegistrationOptions_duplicate((struct blpapi_ServiceRegistrationOptions const *)arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_blpapi_ServiceRegistrationOptions, 0 |  0 );
   return resultobj;
@@ -18898,9 +19671,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_destroy(PyObject *S
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ServiceRegistrationOptions_destroy(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -18932,9 +19705,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_copy(PyObject *SWIG
   }
   arg2 = (blpapi_ServiceRegistrationOptions_t *)(argp2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ServiceRegistrationOptions_copy(arg1,(struct blpapi_ServiceRegistrationOptions const *)arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -18985,9 +19758,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_addActiveSubService
   } 
   arg4 = (int)(val4);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ServiceRegistrationOptions_addActiveSubServiceCodeRange(arg1,arg2,arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -19010,9 +19783,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_removeAllActiveSubS
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ServiceRegistrationOptions_removeAllActiveSubServiceCodeRanges(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -19047,9 +19820,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_setGroupId(PyObject
     }
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ServiceRegistrationOptions_setGroupId(arg1,(char const *)arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -19082,9 +19855,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_setServicePriority(
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ServiceRegistrationOptions_setServicePriority(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -19116,9 +19889,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_setPartsToRegister(
   } 
   arg2 = (int)(val2);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     blpapi_ServiceRegistrationOptions_setPartsToRegister(arg1,arg2);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -19148,9 +19921,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_getGroupId(PyObject
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ServiceRegistrationOptions_getGroupId(arg1,arg2,arg3);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   {
@@ -19177,9 +19950,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_getServicePriority(
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ServiceRegistrationOptions_getServicePriority(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -19203,9 +19976,9 @@ SWIGINTERN PyObject *_wrap_blpapi_ServiceRegistrationOptions_getPartsToRegister(
   }
   arg1 = (blpapi_ServiceRegistrationOptions_t *)(argp1);
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    BLPAPI_ACCESSOR_BEGIN_ALLOW;
     result = (int)blpapi_ServiceRegistrationOptions_getPartsToRegister(arg1);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    BLPAPI_ACCESSOR_END_ALLOW;
   }
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
@@ -19261,6 +20034,8 @@ fail:
 static PyMethodDef SwigMethods[] = {
 	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
 	 { (char *)"setLoggerCallbackWrapper", _wrap_setLoggerCallbackWrapper, METH_VARARGS, NULL},
+	 { (char *)"setLoggerRingBuffer", _wrap_setLoggerRingBuffer, METH_VARARGS, NULL},
+	 { (char *)"drainLoggerRingBuffer", _wrap_drainLoggerRingBuffer, METH_VARARGS, NULL},
 	 { (char *)"blpapi_HighPrecisionDatetime_fromTimePoint_wrapper", _wrap_blpapi_HighPrecisionDatetime_fromTimePoint_wrapper, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Logging_registerCallback", _wrap_blpapi_Logging_registerCallback, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Logging_logTestMessage", _wrap_blpapi_Logging_logTestMessage, METH_VARARGS, NULL},
@@ -19323,6 +20098,7 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"blpapi_Element_setElementFloat", _wrap_blpapi_Element_setElementFloat, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Element_setValueFloat", _wrap_blpapi_Element_setValueFloat, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Element_printHelper", _wrap_blpapi_Element_printHelper, METH_VARARGS, NULL},
+	 { (char *)"blpapi_Element_toJSONHelper", _wrap_blpapi_Element_toJSONHelper, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Element_name", _wrap_blpapi_Element_name, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Element_nameString", _wrap_blpapi_Element_nameString, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Element_definition", _wrap_blpapi_Element_definition, METH_VARARGS, NULL},
@@ -19574,6 +20350,7 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"blpapi_Message_service", _wrap_blpapi_Message_service, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Message_numCorrelationIds", _wrap_blpapi_Message_numCorrelationIds, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Message_correlationId", _wrap_blpapi_Message_correlationId, METH_VARARGS, NULL},
+	 { (char *)"blpapi_Message_correlationIdsHelper", _wrap_blpapi_Message_correlationIdsHelper, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Message_elements", _wrap_blpapi_Message_elements, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Message_fragmentType", _wrap_blpapi_Message_fragmentType, METH_VARARGS, NULL},
 	 { (char *)"blpapi_Message_recapType", _wrap_blpapi_Message_recapType, METH_VARARGS, NULL},
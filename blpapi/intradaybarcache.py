@@ -0,0 +1,500 @@
+# intradaybarcache.py
+
+"""Provide an incremental cache for 'IntradayBarRequest' results.
+
+This file defines a class 'IntradayBarCache' which keeps intraday bars
+received from the '//blp/refdata' service, keyed by security, event type and
+bar interval, and only requests the parts of a time range that have not been
+received before.
+
+Usage
+-----
+The following snippet shows how to use an 'IntradayBarCache' on a started
+synchronous or asynchronous 'Session'.
+
+    cache = blpapi.IntradayBarCache(session, directory="/var/cache/bars")
+    bars = cache.getBars("IBM US Equity",
+                         "TRADE",
+                         1,
+                         datetime.datetime(2019, 8, 11, 13, 30),
+                         datetime.datetime(2019, 8, 11, 20, 0))
+    for t, close in zip(bars["time"], bars["close"]):
+        ...
+
+Repeating the call with a later 'endDateTime' only requests the bars after
+the last completed bar already held by the cache.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+
+import array
+import bisect
+import calendar
+import datetime as _dt
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+from .event import Event, EventQueue
+from .internals import CorrelationId
+
+# pylint: disable=useless-object-inheritance,too-many-arguments,too-many-locals
+
+BAR_DATA = "barData"
+BAR_TICK_DATA = "barTickData"
+RESPONSE_ERROR = "responseError"
+CATEGORY = "category"
+MESSAGE = "message"
+TIME = "time"
+
+_EPOCH = _dt.datetime(1970, 1, 1)
+
+_MAGIC = b"BLPAPI-BARS 1\n"
+
+
+def _toSeconds(dtime):
+    """Return the number of seconds since the epoch for the specified
+    'dtime'. Naive datetimes are assumed to be in GMT."""
+    return calendar.timegm(dtime.utctimetuple()) + dtime.microsecond / 1e6
+
+
+def _toDatetime(seconds):
+    """Return a naive GMT datetime for the specified 'seconds' since the
+    epoch."""
+    return _EPOCH + _dt.timedelta(seconds=seconds)
+
+
+def _alignRange(start, end, interval):
+    """Return the specified [start, end) range, in seconds, widened to
+    multiples of the specified 'interval' minutes."""
+    step = interval * 60
+    return start // step * step, -(-end // step) * step
+
+
+def _splitRanges(ranges, maxSpan, interval):
+    """Split the specified 'ranges', whose bounds are multiples of the
+    specified 'interval' minutes, into windows of at most 'maxSpan' seconds
+    whose bounds are also multiples of 'interval', so that no bar straddles
+    two windows."""
+    step = interval * 60
+    span = max(step, maxSpan // step * step)
+    windows = []
+    for start, end in ranges:
+        if windows and start < windows[-1][1]:
+            start = windows[-1][1]
+        while start < end:
+            windowEnd = min(end, (start // span + 1) * span)
+            windows.append((start, windowEnd))
+            start = windowEnd
+    return windows
+
+
+class _BarSeries(object):
+    """Columnar storage of the bars for a single (security, eventType,
+    interval) key, together with the time ranges that are known to be
+    complete."""
+
+    def __init__(self):
+        self.columns = dict(
+            (column, array.array('d')) for column in IntradayBarCache.COLUMNS)
+        # Sorted, non-overlapping list of [start, end) ranges, in seconds.
+        self.covered = []
+
+    def missingRanges(self, start, end):
+        """Return the list of [start, end) sub-ranges of the specified range
+        that are not covered."""
+        missing = []
+        cursor = start
+        for coveredStart, coveredEnd in self.covered:
+            if coveredEnd <= cursor:
+                continue
+            if coveredStart >= end:
+                break
+            if coveredStart > cursor:
+                missing.append((cursor, coveredStart))
+            cursor = max(cursor, coveredEnd)
+            if cursor >= end:
+                break
+        if cursor < end:
+            missing.append((cursor, end))
+        return missing
+
+    def addCovered(self, start, end):
+        """Mark the specified [start, end) range as covered."""
+        if start >= end:
+            return
+        merged = []
+        for coveredStart, coveredEnd in self.covered:
+            if coveredEnd < start or coveredStart > end:
+                merged.append((coveredStart, coveredEnd))
+            else:
+                start = min(start, coveredStart)
+                end = max(end, coveredEnd)
+        merged.append((start, end))
+        merged.sort()
+        self.covered = merged
+
+    def replace(self, start, end, rows):
+        """Replace all bars with a time in [start, end) by the specified
+        'rows', which must be sorted by time and lie in that range."""
+        times = self.columns["time"]
+        lo = bisect.bisect_left(times, start)
+        hi = bisect.bisect_left(times, end)
+        for index, column in enumerate(IntradayBarCache.COLUMNS):
+            self.columns[column][lo:hi] = array.array(
+                'd', [row[index] for row in rows])
+
+    def select(self, start, end):
+        """Return the columns for the bars with a time in [start, end)."""
+        times = self.columns["time"]
+        lo = bisect.bisect_left(times, start)
+        hi = bisect.bisect_left(times, end)
+        return dict((column, values[lo:hi])
+                    for column, values in self.columns.items())
+
+    def write(self, stream):
+        """Write this series to the specified binary 'stream': a magic line,
+        a JSON line with the covered ranges and the number of bars, then the
+        values of each column in 'COLUMNS' order, as little-endian
+        doubles."""
+        header = {"covered": self.covered,
+                  "bars": len(self.columns["time"])}
+        stream.write(_MAGIC)
+        stream.write(json.dumps(header).encode("ascii") + b"\n")
+        for column in IntradayBarCache.COLUMNS:
+            values = self.columns[column]
+            if sys.byteorder != "little":
+                values = array.array('d', values)
+                values.byteswap()
+            stream.write(values.tobytes() if hasattr(values, "tobytes")
+                         else values.tostring())
+
+    @classmethod
+    def read(cls, stream):
+        """Return the series written by 'write()' to the specified binary
+        'stream'.  Raise 'ValueError' if 'stream' does not hold one."""
+        if stream.readline() != _MAGIC:
+            raise ValueError("not a bar series")
+        header = json.loads(stream.readline().decode("ascii"))
+        series = cls()
+        series.covered = [tuple(bounds) for bounds in header["covered"]]
+        size = header["bars"] * array.array('d').itemsize
+        for column in IntradayBarCache.COLUMNS:
+            data = stream.read(size)
+            if len(data) != size:
+                raise ValueError("truncated bar series")
+            values = series.columns[column]
+            if hasattr(values, "frombytes"):
+                values.frombytes(data)
+            else:
+                values.fromstring(data)
+            if sys.byteorder != "little":
+                values.byteswap()
+        return series
+
+
+class IntradayBarCache(object):
+    """Incremental cache of intraday bars.
+
+    An :class:`IntradayBarCache` answers :meth:`getBars()` calls from bars
+    received earlier and sends ``IntradayBarRequest``\ s only for the holes
+    in the requested time range. Bars are stored per ``(security, eventType,
+    interval)`` as one ``array.array`` of doubles per column (see
+    :attr:`COLUMNS`), and, if a ``directory`` is supplied, persisted to one
+    file per key, holding the raw columns, so that a restarted application
+    does not need to request them again.
+
+    Holes are widened to whole bars, split into windows of at most
+    ``maxRequestSpan`` whose bounds are multiples of the bar interval, and
+    requested concurrently, with at most ``maxInFlight`` requests
+    outstanding at a time.
+    All requests are sent with a private :class:`EventQueue`, so the cache
+    can be used with both synchronous and asynchronous sessions.
+
+    The bar that is still being formed at the time of a request is never
+    recorded as complete, and will be requested again by the next call that
+    covers it.
+
+    All times are in GMT; naive ``datetime.datetime`` objects are interpreted
+    as GMT.
+
+    Calls for different keys run concurrently; calls for the same key wait
+    for each other, so that a range is requested once.
+    """
+
+    COLUMNS = ("time", "open", "high", "low", "close", "volume", "numEvents")
+    """Columns stored for each bar. ``time`` is the start of the bar in
+    seconds since the epoch."""
+
+    def __init__(self,
+                 session,
+                 directory=None,
+                 serviceName="//blp/refdata",
+                 maxRequestSpan=_dt.timedelta(days=1),
+                 maxInFlight=4,
+                 timeout=0):
+        """Create an :class:`IntradayBarCache`.
+
+        Args:
+            session (Session): Started session used to send the requests
+            directory (str): Directory where the bars are persisted. If
+                ``None``, the bars are only kept in memory
+            serviceName (str): Name of the service that handles
+                ``IntradayBarRequest``\ s
+            maxRequestSpan (datetime.timedelta): Maximum time range covered
+                by a single request
+            maxInFlight (int): Maximum number of outstanding requests
+            timeout (int): Maximum time in milliseconds to wait between two
+                events of a backfill. ``0`` (the default) means no timeout
+
+        The service identified by ``serviceName`` is opened on first use if
+        ``session`` has not opened it yet.
+        """
+        if maxInFlight < 1:
+            raise ValueError("maxInFlight must be positive")
+        if maxRequestSpan <= _dt.timedelta(0):
+            raise ValueError("maxRequestSpan must be positive")
+        self.__session = session
+        self.__directory = directory
+        self.__serviceName = serviceName
+        self.__maxRequestSpan = maxRequestSpan.total_seconds()
+        self.__maxInFlight = maxInFlight
+        self.__timeout = timeout
+        self.__series = {}
+        self.__seriesLocks = {}
+        # Protects the two dicts above, not the series; each series is
+        # protected by its lock in 'seriesLocks', held across its requests.
+        self.__lock = threading.Lock()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def getBars(self, security, eventType, interval, startDateTime,
+                endDateTime):
+        """Return the bars in the specified range, requesting missing ones.
+
+        Args:
+            security (str): Security of the bars
+            eventType (str): Event type of the bars, e.g. ``"TRADE"``
+            interval (int): Bar interval in minutes
+            startDateTime (datetime.datetime): Start of the range (inclusive)
+            endDateTime (datetime.datetime): End of the range (exclusive)
+
+        Returns:
+            dict: Mapping of each name in :attr:`COLUMNS` to an
+            ``array.array`` holding the values of the bars that start in the
+            specified range, ordered by time.
+
+        Raises:
+            RuntimeError: If one of the requests fails or times out
+
+        Only the parts of the range that are not already held by this cache
+        are requested, concurrently.
+        """
+        start = _toSeconds(startDateTime)
+        end = _toSeconds(endDateTime)
+        key = (security, eventType, interval)
+        with self.__seriesLock(key):
+            series = self.__getSeries(key)
+            missing = _splitRanges(
+                series.missingRanges(*_alignRange(start, end, interval)),
+                self.__maxRequestSpan,
+                interval)
+            if missing:
+                self.__backfill(series, security, eventType, interval,
+                                missing)
+                self.__save(key, series)
+            return series.select(start, end)
+
+    def missingRanges(self, security, eventType, interval, startDateTime,
+                      endDateTime):
+        """Return the parts of the specified range that are not cached.
+
+        Args:
+            security (str): Security of the bars
+            eventType (str): Event type of the bars
+            interval (int): Bar interval in minutes
+            startDateTime (datetime.datetime): Start of the range
+            endDateTime (datetime.datetime): End of the range
+
+        Returns:
+            [(datetime.datetime, datetime.datetime)]: GMT ``[start, end)``
+            ranges, widened to whole bars, that would be requested by
+            :meth:`getBars()`.
+        """
+        key = (security, eventType, interval)
+        start, end = _alignRange(_toSeconds(startDateTime),
+                                 _toSeconds(endDateTime),
+                                 interval)
+        with self.__seriesLock(key):
+            series = self.__getSeries(key)
+            return [(_toDatetime(missingStart), _toDatetime(missingEnd))
+                    for missingStart, missingEnd
+                    in series.missingRanges(start, end)]
+
+    def invalidate(self, security, eventType, interval):
+        """Drop all the bars cached for the specified key, both in memory and
+        on disk."""
+        key = (security, eventType, interval)
+        with self.__seriesLock(key):
+            with self.__lock:
+                self.__series.pop(key, None)
+            path = self.__path(key)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    def __seriesLock(self, key):
+        """Return the lock of the series of the specified 'key'."""
+        with self.__lock:
+            lock = self.__seriesLocks.get(key)
+            if lock is None:
+                lock = self.__seriesLocks[key] = threading.Lock()
+            return lock
+
+    def __getSeries(self, key):
+        """Return the series of the specified 'key', loading it if needed.
+        The lock of the series must be held."""
+        with self.__lock:
+            series = self.__series.get(key)
+        if series is None:
+            series = self.__load(key)
+            with self.__lock:
+                self.__series[key] = series
+        return series
+
+    def __path(self, key):
+        if self.__directory is None:
+            return None
+        fileName = re.sub(r"[^-_.a-zA-Z0-9]", "_", "%s_%s_%d" % key)
+        return os.path.join(self.__directory, fileName + ".bars")
+
+    def __load(self, key):
+        path = self.__path(key)
+        if path is None or not os.path.exists(path):
+            return _BarSeries()
+        try:
+            with open(path, "rb") as stream:
+                return _BarSeries.read(stream)
+        except ValueError:
+            # A file of another format is only a cache; its bars are
+            # requested again and the file is replaced.
+            return _BarSeries()
+
+    def __save(self, key, series):
+        path = self.__path(key)
+        if path is None:
+            return
+        tmpPath = path + ".tmp"
+        with open(tmpPath, "wb") as stream:
+            series.write(stream)
+        getattr(os, "replace", os.rename)(tmpPath, path)
+
+    def __createRequest(self, security, eventType, interval, start, end):
+        service = self.__session.getService(self.__serviceName)
+        request = service.createRequest("IntradayBarRequest")
+        request.set("security", security)
+        request.set("eventType", eventType)
+        request.set("interval", interval)
+        request.set("startDateTime", _toDatetime(start))
+        request.set("endDateTime", _toDatetime(end))
+        return request
+
+    def __backfill(self, series, security, eventType, interval, windows):
+        """Request the specified 'windows' concurrently and store the
+        received bars into the specified 'series'."""
+        if not self.__session.openService(self.__serviceName):
+            raise RuntimeError("Failed to open " + self.__serviceName)
+
+        # Only bars that started at least one 'interval' before the requests
+        # were sent are complete.
+        intervalSeconds = interval * 60
+        completeBefore = \
+            (time.time() // intervalSeconds) * intervalSeconds
+
+        eventQueue = EventQueue()
+        pendingWindows = list(reversed(windows))
+        inFlight = {}
+
+        def sendNext():
+            start, end = pendingWindows.pop()
+            correlationId = CorrelationId()
+            self.__session.sendRequest(
+                self.__createRequest(security, eventType, interval,
+                                     start, end),
+                correlationId=correlationId,
+                eventQueue=eventQueue)
+            inFlight[correlationId] = (start, end, [])
+
+        try:
+            while pendingWindows and len(inFlight) < self.__maxInFlight:
+                sendNext()
+
+            while inFlight:
+                event = eventQueue.nextEvent(self.__timeout)
+                evType = event.eventType()
+                if evType == Event.TIMEOUT:
+                    raise RuntimeError("IntradayBarRequest timed out")
+                for msg in event:
+                    cids = msg.correlationIds()
+                    if not cids or cids[0] not in inFlight:
+                        continue
+                    start, end, rows = inFlight[cids[0]]
+                    if evType == Event.REQUEST_STATUS:
+                        raise RuntimeError(
+                            "IntradayBarRequest failed: %s" % msg)
+                    if msg.hasElement(RESPONSE_ERROR):
+                        error = msg.getElement(RESPONSE_ERROR)
+                        raise RuntimeError(
+                            "IntradayBarRequest failed: %s (%s)" % (
+                                error.getElementAsString(CATEGORY),
+                                error.getElementAsString(MESSAGE)))
+                    self.__appendRows(msg, rows)
+                    if evType == Event.RESPONSE:
+                        del inFlight[cids[0]]
+                        rows.sort()
+                        series.replace(start, end, rows)
+                        series.addCovered(start, min(end, completeBefore))
+                        if pendingWindows:
+                            sendNext()
+        finally:
+            if inFlight:
+                for correlationId in inFlight:
+                    self.__session.cancel(correlationId)
+            eventQueue.purge()
+
+    @staticmethod
+    def __appendRows(msg, rows):
+        """Append a row for each bar in the specified 'msg' to the specified
+        'rows'."""
+        if not msg.hasElement(BAR_DATA):
+            return
+        data = msg.getElement(BAR_DATA).getElement(BAR_TICK_DATA)
+        names = IntradayBarCache.COLUMNS[1:]
+        for bar in data.values():
+            row = [_toSeconds(bar.getElementAsDatetime(TIME))]
+            row.extend(bar.getElementAsFloat(column) for column in names)
+            rows.append(tuple(row))
+
+__copyright__ = """
+Copyright 2019. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -7,6 +7,8 @@
 
 from __future__ import absolute_import
 from datetime import datetime
+import logging as stdlogging
+import threading
 from blpapi import internals
 from . import utils
 from .compat import with_metaclass
@@ -45,9 +47,151 @@ class Logger:
         elif err_code == -2:
             raise RuntimeError("unable to register callback")
 
+    @staticmethod
+    def registerLoggingBridge(logger=None,
+                              thresholdSeverity=SEVERITY_INFO,
+                              capacity=1 << 20,
+                              interval=0.1):
+        """Forward all log messages with severity greater than or equal to
+        the specified 'thresholdSeverity' to the specified standard library
+        'logger' (the 'blpapi' logger by default), and return the started
+        'LoggingBridge'.  Unlike 'registerCallback', the library threads do
+        not take the GIL: each message is copied into one of two native
+        buffers of the specified 'capacity' bytes, which a Python thread
+        drains into 'logger' every 'interval' seconds.  The bridge needs to
+        be registered before the start of all sessions, and replaces any
+        registered callback.  An exception of type 'RuntimeError' will be
+        thrown if the bridge cannot be registered."""
+        bridge = LoggingBridge(logger, thresholdSeverity, capacity, interval)
+        bridge.start()
+        return bridge
+
     @staticmethod
     def logTestMessage(severity):
         """Log a test message at the specified 'severity'.
         Note that this function is intended for testing
         of the logging configuration only."""
         internals.blpapi_Logging_logTestMessage(severity)
+
+
+class LoggingBridge(object):
+    """Forward the log messages of the library to a standard library logger.
+
+    The messages are buffered natively without taking the GIL, and emitted
+    by a daemon thread in batches as 'logging.LogRecord's whose 'created'
+    time is the time of the message, with millisecond precision, whose
+    'thread' is the id of the library thread which logged it, and which have
+    an additional 'category' attribute.  A message which does not fit in the
+    buffer is dropped rather than blocking the library thread: 'dropped()'
+    returns their number, and each batch following a drop is preceded by a
+    warning record.
+
+    Use 'Logger.registerLoggingBridge' to create and start a bridge.  As the
+    library supports a single logging callback, only one bridge should be
+    started per process."""
+
+    # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+    LEVELS = {
+        Logger.SEVERITY_FATAL: stdlogging.CRITICAL,
+        Logger.SEVERITY_ERROR: stdlogging.ERROR,
+        Logger.SEVERITY_WARN: stdlogging.WARNING,
+        Logger.SEVERITY_INFO: stdlogging.INFO,
+        Logger.SEVERITY_DEBUG: stdlogging.DEBUG,
+        Logger.SEVERITY_TRACE: stdlogging.DEBUG - 5,
+    }
+    """Standard library level of each severity"""
+
+    def __init__(self, logger=None,
+                 thresholdSeverity=Logger.SEVERITY_INFO,
+                 capacity=1 << 20,
+                 interval=0.1):
+        """Create a bridge to the specified 'logger', or to the 'blpapi'
+        logger if 'logger' is 'None', of the messages with severity greater
+        than or equal to the specified 'thresholdSeverity', buffered in two
+        native buffers of the specified 'capacity' bytes and drained every
+        'interval' seconds.  The native buffers are allocated by the first
+        bridge started, and keep their size afterwards."""
+        if logger is None:
+            logger = stdlogging.getLogger("blpapi")
+        self.__logger = logger
+        self.__thresholdSeverity = thresholdSeverity
+        self.__capacity = capacity
+        self.__interval = interval
+        self.__dropped = 0
+        self.__drainLock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread = None
+
+    def start(self):
+        """Register the native buffer as the logging callback of the library
+        and start the thread draining it.  An exception of type
+        'RuntimeError' will be thrown if the buffer cannot be allocated or
+        registered."""
+        if self.__thread is not None:
+            return
+        err_code = internals.setLoggerRingBuffer(self.__capacity,
+                                                 self.__thresholdSeverity)
+        if err_code == -1:
+            raise RuntimeError("unable to allocate the logging buffer")
+        elif err_code == -2:
+            raise RuntimeError("unable to register callback")
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run,
+                                         name="blpapi-logging-bridge")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """Stop the thread draining the buffer, then emit the messages still
+        buffered.  The library keeps buffering messages until another
+        callback is registered."""
+        thread = self.__thread
+        if thread is None:
+            return
+        self.__stopped.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self.__thread = None
+        self.drain()
+
+    def drain(self):
+        """Emit the messages buffered so far, and return their number."""
+        with self.__drainLock:
+            records, dropped = internals.drainLoggerRingBuffer()
+            logger = self.__logger
+            if dropped > self.__dropped:
+                logger.warning("%d blpapi log messages dropped",
+                               dropped - self.__dropped,
+                               extra={"category": "LoggingBridge"})
+                self.__dropped = dropped
+            levels = self.LEVELS
+            for threadId, ts, severity, category, message in records:
+                level = levels.get(severity, stdlogging.INFO)
+                if not logger.isEnabledFor(level):
+                    continue
+                record = logger.makeRecord(
+                    logger.name, level, category, 0, message, None, None)
+                record.relativeCreated += (ts - record.created) * 1000
+                record.created = ts
+                record.msecs = (ts - int(ts)) * 1000
+                record.thread = threadId
+                record.threadName = "blpapi"
+                record.category = category
+                logger.handle(record)
+            return len(records)
+
+    def dropped(self):
+        """Return the number of messages dropped since the buffer was
+        allocated because it was full."""
+        return self.__dropped
+
+    def __run(self):
+        """Drain the buffer every 'interval' seconds until stopped."""
+        while not self.__stopped.wait(self.__interval):
+            try:
+                self.drain()
+            except Exception:  # pylint: disable=broad-except
+                # Keep draining: a failing handler must not let the buffer
+                # fill up and drop every later message.
+                pass
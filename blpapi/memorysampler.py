@@ -0,0 +1,184 @@
+# memorysampler.py
+
+"""Provide a periodic sampler of the memory usage of the library.
+
+This file defines a class 'MemorySampler' which, from a background thread,
+records at a fixed interval the counters returned by
+'diagnosticsutil.memoryStats()' together with the number of live objects of
+each class of the 'blpapi' package, keeps the most recent samples, and passes
+each sample to an exporter such as 'PrometheusTextfileExporter' or
+'StatsdExporter'.
+
+Usage
+-----
+The following snippet shows how a long running subscriber exports its
+memory usage every minute to the textfile collector of Prometheus.
+
+    sampler = blpapi.MemorySampler(
+        interval=60,
+        exporter=blpapi.PrometheusTextfileExporter(
+            "/var/lib/node_exporter/blpapi.prom"))
+    sampler.start()
+    ...
+    sampler.stop()
+
+A steady growth of the count of a wrapper class, such as 'Message' or
+'Element', points at objects retained by the application; a growth of the
+library counters without one points at the library.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+
+from . import diagnosticsutil
+
+# pylint: disable=useless-object-inheritance,too-many-arguments
+
+MemorySample = collections.namedtuple(
+    "MemorySample", ["time", "memory", "wrappers"])
+MemorySample.__doc__ = """One sample of a :class:`MemorySampler`: the time
+of the sample in seconds since the epoch, the result of
+:func:`diagnosticsutil.memoryStats()` and the result of
+:func:`diagnosticsutil.liveWrapperCounts()`, which is empty if wrappers are
+not counted."""
+
+
+class MemorySampler(object):
+    """Record the memory usage of the library at a fixed interval.
+
+    Each sample is exported, if an exporter is given, as the metrics
+    ``memory_<counter>`` for the counters of
+    :func:`diagnosticsutil.memoryStats()` and ``live_wrappers`` with a
+    ``class`` label for the counts of live wrapper objects.
+    """
+
+    def __init__(self,
+                 interval=60.0,
+                 exporter=None,
+                 countWrappers=True,
+                 maxSamples=1440):
+        """Create a stopped :class:`MemorySampler`.
+
+        Args:
+            interval (float): Number of seconds between samples
+            exporter: Callable taking an iterable of ``(name, labels,
+                value)`` metrics, called with each sample
+            countWrappers (bool): Whether to count the live objects of the
+                ``blpapi`` classes, which walks all the objects tracked by
+                the garbage collector
+            maxSamples (int): Number of most recent samples kept
+        """
+        self.__interval = interval
+        self.__exporter = exporter
+        self.__countWrappers = countWrappers
+        self.__samples = collections.deque(maxlen=maxSamples)
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread = None
+
+    def start(self):
+        """Take a sample now, then start the thread taking a sample every
+        ``interval`` seconds."""
+        if self.__thread is not None:
+            return
+        self.sample()
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run,
+                                         name="blpapi-memory-sampler")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """Stop the thread taking samples."""
+        thread = self.__thread
+        if thread is None:
+            return
+        self.__stopped.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self.__thread = None
+
+    def sample(self):
+        """Take a sample, record it and pass it to the exporter.
+
+        Returns:
+            MemorySample: The sample taken.
+        """
+        wrappers = diagnosticsutil.liveWrapperCounts() \
+            if self.__countWrappers else {}
+        sample = MemorySample(time.time(),
+                              diagnosticsutil.memoryStats(),
+                              wrappers)
+        with self.__lock:
+            self.__samples.append(sample)
+        if self.__exporter is not None:
+            self.__exporter(self.metrics(sample))
+        return sample
+
+    def samples(self):
+        """
+        Returns:
+            [MemorySample]: The recorded samples, oldest first.
+        """
+        with self.__lock:
+            return list(self.__samples)
+
+    def latest(self):
+        """
+        Returns:
+            MemorySample: The most recent sample, or ``None`` if no sample
+            was taken.
+        """
+        with self.__lock:
+            return self.__samples[-1] if self.__samples else None
+
+    @staticmethod
+    def metrics(sample):
+        """
+        Args:
+            sample (MemorySample): Sample to export
+
+        Returns:
+            [(str, dict, number)]: The metrics of ``sample``, as passed to
+            the exporter.
+        """
+        result = [("memory_" + name, {}, value)
+                  for name, value in sorted(sample.memory.items())]
+        result.extend(("live_wrappers", {"class": name}, count)
+                      for name, count in sorted(sample.wrappers.items()))
+        return result
+
+    def __run(self):
+        """Take a sample every 'interval' seconds until stopped."""
+        while not self.__stopped.wait(self.__interval):
+            try:
+                self.sample()
+            except Exception:  # pylint: disable=broad-except
+                # A failure of one sample, for example of the exporter,
+                # must not stop the sampling.
+                pass
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -9,7 +9,6 @@ inside an event and containing elements.
 
 
 from __future__ import absolute_import
-import sys
 import weakref
 from blpapi.datetime import _DatetimeUtil, UTC
 from .element import Element
@@ -20,12 +19,6 @@ from .compat import with_metaclass
 
 # pylint: disable=useless-object-inheritance,protected-access
 
-# Handling a circular dependancy between modules:
-#   service->event->message->service
-service = sys.modules.get('blpapi.service')
-if service is None:
-    from . import service
-
 
 @with_metaclass(utils.MetaClassForClassesWithEnums)
 class Message(object):
@@ -153,9 +146,13 @@ class Message(object):
         Returns:
             Service: Service that this :class:`Message` is associated with.
         """
+        # 'Service' is imported here rather than at the top of this file to
+        # break the import cycle service->event->message->service, which
+        # fails whichever of these modules is imported first.
+        from .service import Service
         serviceHandle = internals.blpapi_Message_service(self.__handle)
         return None if serviceHandle is None \
-            else service.Service(serviceHandle, self.__sessions)
+            else Service(serviceHandle, self.__sessions)
 
     def correlationIds(self):
         """
@@ -184,6 +181,22 @@ class Message(object):
                 internals.blpapi_Message_correlationId(self.__handle, i))
         return res
 
+    def correlationIdValues(self):
+        """
+        Returns:
+            tuple: A ``(type, classId, value)`` tuple for each correlation id
+            associated with this message, in the order of
+            :meth:`correlationIds()`.
+
+        Equivalent to ``tuple((cid.type(), cid.classId(), cid.value()) for
+        cid in self.correlationIds())``, but reads the correlation ids in
+        place instead of creating a :class:`CorrelationId` for each of them.
+        The ``value`` of an integer or auto-generated correlation id is an
+        ``int``; the values of the two types can be equal, so ``type`` and
+        ``classId`` must be checked before using ``value`` as a key.
+        """
+        return internals.blpapi_Message_correlationIdsHelper(self.__handle)
+
     def hasElement(self, name, excludeNullElements=False):
         """Equivalent to asElement().hasElement(name, excludeNullElements)."""
         return self.asElement().hasElement(name, excludeNullElements)
@@ -256,6 +269,16 @@ class Message(object):
         """
         return self.asElement().toString(level, spacesPerLevel)
 
+    def toJSON(self, datetimeFormat="iso", includeNulls=True, fields=None):
+        """Equivalent to :meth:`asElement().toJSON(datetimeFormat,
+        includeNulls, fields) <Element.toJSON()>`."""
+        return self.asElement().toJSON(datetimeFormat, includeNulls, fields)
+
+    def toArrow(self, schemaHint=None):
+        """Equivalent to :meth:`asElement().toArrow(schemaHint)
+        <Element.toArrow()>`."""
+        return self.asElement().toArrow(schemaHint)
+
     def timeReceived(self, tzinfo=UTC):
         """Get the time when the message was received by the SDK.
 
@@ -0,0 +1,188 @@
+# metricexporter.py
+
+"""Provide exporters of numeric metrics to monitoring systems.
+
+This file defines the classes 'PrometheusTextfileExporter', which writes
+metrics to a file in the Prometheus text exposition format for the textfile
+collector of the node exporter, and 'StatsdExporter', which sends them as
+StatsD gauges over UDP.
+
+Usage
+-----
+An exporter is a callable taking an iterable of '(name, labels, value)'
+metrics, where 'labels' is a 'dict' of strings, possibly empty.
+
+    exporter = blpapi.PrometheusTextfileExporter(
+        "/var/lib/node_exporter/blpapi.prom")
+    exporter([("memory_in_use_bytes", {}, 74560),
+              ("live_wrappers", {"class": "Message"}, 12)])
+
+Any callable with the same signature can be used wherever an exporter is
+expected, such as by 'MemorySampler'.
+"""
+
+from __future__ import absolute_import
+
+import numbers
+import os
+import re
+import socket
+import threading
+
+# pylint: disable=useless-object-inheritance
+
+_replace = getattr(os, "replace", os.rename)
+
+# The spelling of the special floats in the Prometheus text format.
+_PROMETHEUS_FLOATS = {"inf": "+Inf", "-inf": "-Inf", "nan": "NaN"}
+
+
+def _metricName(name):
+    """Return the specified 'name' with the characters not allowed in a
+    metric name replaced by '_'."""
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    return "_" + name if name[:1].isdigit() else name
+
+
+def _formatValue(value):
+    """Return the text of the specified numeric 'value': an integer for a
+    'bool' or an integral value, and a float otherwise."""
+    if isinstance(value, numbers.Integral):
+        return "%d" % value
+    return repr(float(value))
+
+
+class PrometheusTextfileExporter(object):
+    """Write metrics to a file in the Prometheus text format.
+
+    Each call replaces the content of the file atomically, by writing to a
+    temporary file in the same directory and renaming it, so that the
+    collector never reads a partially written file. All the metrics are
+    exported as gauges; ``bool`` values are exported as ``0`` or ``1``.
+    """
+
+    def __init__(self, path, prefix="blpapi_"):
+        """Create an exporter writing to the specified ``path``.
+
+        Args:
+            path (str): Path of the file to write, which should end with
+                ``.prom`` for the textfile collector
+            prefix (str): Prefix of the name of every metric
+        """
+        self.__path = path
+        self.__prefix = prefix
+        self.__lock = threading.Lock()
+
+    def __call__(self, metrics):
+        """Replace the content of the file with the specified ``metrics``.
+
+        Args:
+            metrics: Iterable of ``(name, labels, value)`` tuples
+        """
+        lines = []
+        declared = set()
+        for name, labels, value in metrics:
+            name = _metricName(self.__prefix + name)
+            if name not in declared:
+                declared.add(name)
+                lines.append("# TYPE {0} gauge".format(name))
+            if labels:
+                name += "{" + ",".join(
+                    '{0}="{1}"'.format(
+                        _metricName(key),
+                        str(label).replace("\\", "\\\\")
+                        .replace('"', '\\"').replace("\n", "\\n"))
+                    for key, label in sorted(labels.items())) + "}"
+            value = _formatValue(value)
+            lines.append("{0} {1}".format(
+                name, _PROMETHEUS_FLOATS.get(value, value)))
+        lines.append("")
+        temporary = "{0}.{1}.tmp".format(self.__path, os.getpid())
+        with self.__lock:
+            with open(temporary, "w") as output:
+                output.write("\n".join(lines))
+            _replace(temporary, self.__path)
+
+
+class StatsdExporter(object):
+    """Send metrics to a StatsD server as gauges.
+
+    The labels of a metric are appended to its name, in the order of their
+    keys, as StatsD has no labels. The metrics of one call are sent in as
+    few UDP datagrams of at most ``maxPacketSize`` bytes as possible;
+    failures to send are ignored, like StatsD clients do.
+    """
+
+    def __init__(self, host="localhost", port=8125, prefix="blpapi.",
+                 maxPacketSize=1432):
+        """Create an exporter sending to the specified ``host`` and
+        ``port``.
+
+        Args:
+            host (str): Host of the StatsD server
+            port (int): UDP port of the StatsD server
+            prefix (str): Prefix of the name of every metric
+            maxPacketSize (int): Maximum size in bytes of a datagram
+        """
+        self.__address = (host, port)
+        self.__prefix = prefix
+        self.__maxPacketSize = maxPacketSize
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def __call__(self, metrics):
+        """Send the specified ``metrics``.
+
+        Args:
+            metrics: Iterable of ``(name, labels, value)`` tuples
+        """
+        packet = []
+        size = 0
+        for name, labels, value in metrics:
+            parts = [self.__prefix + name]
+            parts.extend(str(labels[key]) for key in sorted(labels or ()))
+            line = "{0}:{1}|g".format(
+                ".".join(re.sub(r"[^a-zA-Z0-9_.\-]", "_", part)
+                         for part in parts),
+                _formatValue(value))
+            if packet and size + len(line) + 1 > self.__maxPacketSize:
+                self.__send(packet)
+                packet = []
+                size = 0
+            packet.append(line)
+            size += len(line) + 1
+        if packet:
+            self.__send(packet)
+
+    def close(self):
+        """Close the socket of this exporter."""
+        self.__socket.close()
+
+    def __send(self, lines):
+        """Send the specified 'lines' in one datagram."""
+        try:
+            self.__socket.sendto("\n".join(lines).encode("utf-8"),
+                                 self.__address)
+        except (IOError, OSError):
+            pass
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
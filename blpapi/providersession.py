@@ -71,6 +71,7 @@ from .exception import _ExceptionUtil
 from . import internals
 from .internals import CorrelationId
 from .sessionoptions import SessionOptions
+from .schema import _clearTypeIndexes
 from .topic import Topic
 from . import utils
 from .utils import get_handle
@@ -303,7 +304,15 @@ class ProviderSession(AbstractSession):
             session = sessionRef()
             if session is not None:
                 event = Event(eventHandle, session)
-                session.__handler(event, session)
+                metrics = session.metrics()
+                if metrics is None:
+                    session.__handler(event, session)
+                else:
+                    start = metrics.clock()
+                    try:
+                        session.__handler(event, session)
+                    finally:
+                        metrics.recordDispatch(event.eventType(), start)
         except:
             print("Exception in event handler:", file=sys.stderr)
             traceback.print_exc(file=sys.stderr)
@@ -386,6 +395,7 @@ class ProviderSession(AbstractSession):
                 self.__handle,
                 self.__handlerProxy)
             self.__handle = None
+            _clearTypeIndexes()
 
     def start(self):
         """Start this :class:`Session` in synchronous mode.
@@ -497,13 +507,19 @@ class ProviderSession(AbstractSession):
         If :meth:`nextEvent()` returns due to a timeout it will return an event
         of type :attr:`~Event.TIMEOUT`.
         """
+        metrics = self.metrics()
+        if metrics is not None:
+            start = metrics.clock()
         retCode, event = internals.blpapi_ProviderSession_nextEvent(
             self.__handle,
             timeout)
 
         _ExceptionUtil.raiseOnError(retCode)
 
-        return Event(event, self)
+        event = Event(event, self)
+        if metrics is not None:
+            metrics.recordNextEvent(event.eventType(), start)
+        return event
 
     def tryNextEvent(self):
         """
@@ -732,10 +748,17 @@ class ProviderSession(AbstractSession):
         Args:
             event (Event): Event to publish
         """
-        _ExceptionUtil.raiseOnError(
-            internals.blpapi_ProviderSession_publish(
-                self.__handle,
-                get_handle(event)))
+        metrics = self.metrics()
+        if metrics is not None:
+            start = metrics.clock()
+        try:
+            _ExceptionUtil.raiseOnError(
+                internals.blpapi_ProviderSession_publish(
+                    self.__handle,
+                    get_handle(event)))
+        finally:
+            if metrics is not None:
+                metrics.recordPublish(start)
 
     def sendResponse(self, event, isPartialResponse=False):
         """Send the response event for previously received request.
@@ -0,0 +1,387 @@
+# referencedatacache.py
+
+"""Provide a memoizing layer for 'ReferenceDataRequest's.
+
+This file defines a class 'ReferenceDataCache' which keeps field values
+received from the '//blp/refdata' service, keyed by security, field and
+overrides, expires them after a per-field time-to-live and coalesces
+concurrent lookups of the same values into a single request.
+
+Usage
+-----
+The following snippet shows how to share a 'ReferenceDataCache' between the
+components of an application using a started 'Session'.
+
+    cache = blpapi.ReferenceDataCache(session,
+                                      ttl=3600,
+                                      fieldTtls={"PX_LAST": 5})
+    data = cache.get(["IBM US Equity", "MSFT US Equity"],
+                     ["CRNCY", "TICKER", "PX_POS_MULT"])
+    currency = data["IBM US Equity"]["CRNCY"]
+
+A second call for the same values, from any thread, is answered from the
+cache until the values expire; a call made while the values are being
+requested waits for that request instead of sending its own.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+
+from .event import Event, EventQueue
+from .internals import CorrelationId
+
+# pylint: disable=useless-object-inheritance,too-many-arguments,too-many-locals
+# pylint: disable=too-many-instance-attributes
+
+SECURITY_DATA = "securityData"
+SECURITY = "security"
+SECURITY_ERROR = "securityError"
+FIELD_DATA = "fieldData"
+FIELD_EXCEPTIONS = "fieldExceptions"
+FIELD_ID = "fieldId"
+RESPONSE_ERROR = "responseError"
+CATEGORY = "category"
+MESSAGE = "message"
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+def _normalizeOverrides(overrides):
+    """Return a hashable, order independent form of the specified
+    'overrides', which is either a mapping or a sequence of (fieldId, value)
+    pairs."""
+    if not overrides:
+        return ()
+    if hasattr(overrides, "items"):
+        overrides = overrides.items()
+    return tuple(sorted((str(fieldId), str(value))
+                        for fieldId, value in overrides))
+
+
+def _toPython(element):
+    """Return the value of the specified 'element' as plain Python objects,
+    so that it does not keep the message it belongs to alive."""
+    if element.isArray():
+        return [_toPython(value) if hasattr(value, "isArray") else value
+                for value in element.values()]
+    if element.isComplexType():
+        return dict((str(sub.name()), _toPython(sub))
+                    for sub in element.elements())
+    if element.isNull():
+        return None
+    return element.getValue()
+
+
+class _Flight(object):
+    """A request in flight, shared by all the lookups waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.values = {}
+        self.error = None
+
+
+class ReferenceDataCache(object):
+    """Memoizing, coalescing front-end for ``ReferenceDataRequest``\ s.
+
+    Values are cached per ``(security, field, overrides)``, where
+    ``overrides`` is normalized so that the same overrides supplied in a
+    different order share an entry. Each entry expires after the time-to-live
+    configured for its field in ``fieldTtls``, or after ``ttl`` seconds for
+    fields not listed there. At most ``maxEntries`` entries are kept; the
+    least recently used entries are evicted first. The cache is bounded by
+    this number of entries, not by the memory they use: an entry of a bulk
+    field holds all of its rows, so ``maxEntries`` should be lowered for
+    caches of bulk fields.
+
+    A lookup for values that are already being requested (by another thread
+    or by a concurrent call) does not send a new request, but waits for the
+    request in flight. Values that are missing are requested with one
+    ``ReferenceDataRequest`` per distinct set of missing fields, all sent
+    concurrently on a private :class:`EventQueue`.
+
+    Fields reported in ``fieldExceptions`` and securities reported in
+    ``securityError`` are returned as ``None`` and are not cached. Fields
+    that are valid but have no value for a security are cached as ``None``.
+
+    :class:`ReferenceDataCache` objects are thread-safe.
+    """
+
+    def __init__(self,
+                 session,
+                 ttl=60.0,
+                 fieldTtls=None,
+                 maxEntries=100000,
+                 serviceName="//blp/refdata",
+                 timeout=0):
+        """Create a :class:`ReferenceDataCache`.
+
+        Args:
+            session (Session): Started session used to send the requests
+            ttl (float): Default time-to-live of the cached values, in
+                seconds
+            fieldTtls (dict): Mapping of field names to the time-to-live of
+                their values, in seconds
+            maxEntries (int): Maximum number of cached values, whatever
+                their size
+            serviceName (str): Name of the service that handles
+                ``ReferenceDataRequest``\ s
+            timeout (int): Maximum time in milliseconds to wait between two
+                events of a request. ``0`` (the default) means no timeout
+        """
+        if maxEntries < 1:
+            raise ValueError("maxEntries must be positive")
+        self.__session = session
+        self.__ttl = ttl
+        self.__fieldTtls = dict(fieldTtls or {})
+        self.__maxEntries = maxEntries
+        self.__serviceName = serviceName
+        self.__timeout = timeout
+        self.__lock = threading.Lock()
+        # key -> (expiry, value), in least recently used first order
+        self.__entries = collections.OrderedDict()
+        self.__inFlight = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__coalesced = 0
+        self.__evictions = 0
+
+    def get(self, securities, fields, overrides=None):
+        """Return the values of the ``fields`` for the ``securities``.
+
+        Args:
+            securities ([str]): Securities to look up
+            fields ([str]): Fields to look up
+            overrides (dict or [(str, str)]): Field overrides to apply
+
+        Returns:
+            dict: Mapping of each security to a mapping of each field to its
+            value.
+
+        Raises:
+            RuntimeError: If a request needed to answer the lookup fails or
+                times out
+
+        Values are converted to Python objects: bulk fields are returned as
+        lists of dicts. Duplicate ``securities`` and ``fields`` are ignored.
+        """
+        overrides = _normalizeOverrides(overrides)
+        # Duplicates are looked up, and requested, once.
+        securities = list(collections.OrderedDict.fromkeys(securities))
+        fields = list(collections.OrderedDict.fromkeys(fields))
+        keys = [(security, field, overrides)
+                for security in securities for field in fields]
+
+        result = dict((security, {}) for security in securities)
+        owned = []
+        waiting = {}
+        now = _clock()
+        with self.__lock:
+            for key in keys:
+                entry = self.__entries.pop(key, None)
+                if entry is not None and entry[0] > now:
+                    self.__entries[key] = entry
+                    self.__hits += 1
+                    result[key[0]][key[1]] = entry[1]
+                    continue
+                flight = self.__inFlight.get(key)
+                if flight is not None:
+                    self.__coalesced += 1
+                    waiting[key] = flight
+                    continue
+                self.__misses += 1
+                owned.append(key)
+
+            flight = None
+            if owned:
+                flight = _Flight()
+                for key in owned:
+                    self.__inFlight[key] = flight
+
+        if flight is not None:
+            try:
+                flight.values = self.__request(owned, overrides)
+            except Exception as error:  # pylint: disable=broad-except
+                flight.error = error
+            except BaseException:
+                # The waiting lookups fail instead of returning 'None's.
+                flight.error = RuntimeError("the request was interrupted")
+                raise
+            finally:
+                self.__complete(owned, flight)
+            if flight.error is not None:
+                raise flight.error  # pylint: disable=raising-bad-type
+            waiting.update((key, flight) for key in owned)
+
+        for key, keyFlight in waiting.items():
+            keyFlight.done.wait()
+            if keyFlight.error is not None:
+                raise RuntimeError(
+                    "ReferenceDataRequest failed: %s" % keyFlight.error)
+            result[key[0]][key[1]] = keyFlight.values.get(key)
+        return result
+
+    def invalidate(self, security=None, field=None):
+        """Remove the cached values for the specified ``security`` and
+        ``field``. If either is ``None``, it matches any security or field
+        respectively."""
+        with self.__lock:
+            for key in list(self.__entries):
+                if (security is None or key[0] == security) and \
+                        (field is None or key[1] == field):
+                    del self.__entries[key]
+
+    def clear(self):
+        """Remove all the cached values."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Counters of this cache: ``entries``, ``hits``, ``misses``
+            (values requested), ``coalesced`` (values obtained from a request
+            sent for another lookup) and ``evictions``.
+        """
+        with self.__lock:
+            return {
+                "entries": len(self.__entries),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "coalesced": self.__coalesced,
+                "evictions": self.__evictions,
+            }
+
+    def __complete(self, keys, flight):
+        """Store the values of the specified completed 'flight' and wake up
+        the lookups waiting for it."""
+        now = _clock()
+        try:
+            with self.__lock:
+                for key in keys:
+                    self.__inFlight.pop(key, None)
+                if flight.error is not None:
+                    return
+                for key in keys:
+                    if key not in flight.values:
+                        continue
+                    ttl = self.__fieldTtls.get(key[1], self.__ttl)
+                    self.__entries.pop(key, None)
+                    self.__entries[key] = (now + ttl, flight.values[key])
+                while len(self.__entries) > self.__maxEntries:
+                    self.__entries.popitem(last=False)
+                    self.__evictions += 1
+        finally:
+            flight.done.set()
+
+    def __request(self, keys, overrides):
+        """Request the values for the specified 'keys' and return a dict of
+        the cacheable ones."""
+        fieldsBySecurity = collections.OrderedDict()
+        for security, field, _ in keys:
+            fieldsBySecurity.setdefault(security, []).append(field)
+        securitiesByFields = collections.OrderedDict()
+        for security, fields in fieldsBySecurity.items():
+            securitiesByFields.setdefault(tuple(fields), []).append(security)
+
+        if not self.__session.openService(self.__serviceName):
+            raise RuntimeError("Failed to open " + self.__serviceName)
+        service = self.__session.getService(self.__serviceName)
+
+        eventQueue = EventQueue()
+        inFlight = set()
+        values = {}
+        try:
+            for fields, securities in securitiesByFields.items():
+                request = service.createRequest("ReferenceDataRequest")
+                for security in securities:
+                    request.append("securities", security)
+                for field in fields:
+                    request.append("fields", field)
+                if overrides:
+                    overridesElement = request.getElement("overrides")
+                    for fieldId, value in overrides:
+                        override = overridesElement.appendElement()
+                        override.setElement(FIELD_ID, fieldId)
+                        override.setElement("value", value)
+                correlationId = CorrelationId()
+                self.__session.sendRequest(request,
+                                           correlationId=correlationId,
+                                           eventQueue=eventQueue)
+                inFlight.add(correlationId)
+                for security in securities:
+                    for field in fields:
+                        values[(security, field, overrides)] = None
+
+            while inFlight:
+                event = eventQueue.nextEvent(self.__timeout)
+                evType = event.eventType()
+                if evType == Event.TIMEOUT:
+                    raise RuntimeError("ReferenceDataRequest timed out")
+                for msg in event:
+                    cids = msg.correlationIds()
+                    if not cids or cids[0] not in inFlight:
+                        continue
+                    if evType == Event.REQUEST_STATUS:
+                        raise RuntimeError(
+                            "ReferenceDataRequest failed: %s" % msg)
+                    if msg.hasElement(RESPONSE_ERROR):
+                        error = msg.getElement(RESPONSE_ERROR)
+                        raise RuntimeError(
+                            "ReferenceDataRequest failed: %s (%s)" % (
+                                error.getElementAsString(CATEGORY),
+                                error.getElementAsString(MESSAGE)))
+                    self.__processMessage(msg, overrides, values)
+                    if evType == Event.RESPONSE:
+                        inFlight.discard(cids[0])
+        finally:
+            for correlationId in inFlight:
+                self.__session.cancel(correlationId)
+            eventQueue.purge()
+        return values
+
+    @staticmethod
+    def __processMessage(msg, overrides, values):
+        """Update the specified 'values' from the specified response 'msg'.
+        Values that must not be cached are removed from 'values'."""
+        securityDataArray = msg.getElement(SECURITY_DATA)
+        for securityData in securityDataArray.values():
+            security = securityData.getElementAsString(SECURITY)
+            if securityData.hasElement(SECURITY_ERROR):
+                for key in [key for key in values if key[0] == security]:
+                    del values[key]
+                continue
+            if securityData.hasElement(FIELD_EXCEPTIONS):
+                for fieldException in \
+                        securityData.getElement(FIELD_EXCEPTIONS).values():
+                    field = fieldException.getElementAsString(FIELD_ID)
+                    values.pop((security, field, overrides), None)
+            fieldData = securityData.getElement(FIELD_DATA)
+            for field in fieldData.elements():
+                key = (security, str(field.name()), overrides)
+                if key in values:
+                    values[key] = _toPython(field)
+
+__copyright__ = """
+Copyright 2019. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,503 @@
+# requesttracer.py
+
+"""Provide tracing of the lifecycle of requests.
+
+This file defines a class 'RequestTracer' which records, for each request
+sent through it, timestamped spans keyed by the correlation id of the
+request: the submission of the request, the wait for its first response, the
+reception of its partial responses and final response, and the processing
+of each response event by the application.  Completed traces are kept in
+memory and can be exported in the OpenTelemetry (OTLP) JSON format.
+
+Usage
+-----
+The following snippet shows how an application traces its requests and
+finds out whether the slow ones wait for the server or for its own
+processing.
+
+    tracer = blpapi.RequestTracer()
+
+    def processEvent(event, session):
+        with tracer.processing(event):
+            for msg in event:
+                ...
+
+    tracer.sendRequest(session, request)
+    ...
+    for trace in tracer.traces():
+        if trace.duration() > 1.0:
+            print(trace.summary())
+    with open("traces.json", "w") as output:
+        output.write(tracer.toJSON())
+
+A trace is complete when its final 'RESPONSE', or a 'REQUEST_STATUS', has
+been processed.  The library does not timestamp the reception of response
+data, so the 'wait' span covers the network, the server and the queueing in
+the library.
+"""
+
+from __future__ import absolute_import
+
+import binascii
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+from .event import Event
+from .internals import CorrelationId
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+_RESPONSE_EVENT_TYPES = frozenset((Event.PARTIAL_RESPONSE,
+                                   Event.RESPONSE,
+                                   Event.REQUEST_STATUS))
+
+_EVENT_TYPE_NAMES = dict((value, name)
+                         for name, value in vars(Event).items()
+                         if name.isupper() and isinstance(value, int))
+
+
+def _newId(size):
+    """Return a random OpenTelemetry id of the specified 'size' bytes, as a
+    hexadecimal string."""
+    return binascii.hexlify(os.urandom(size)).decode("ascii")
+
+
+def _nanos(timestamp):
+    """Return the specified 'timestamp', in seconds since the epoch, as an
+    integer number of nanoseconds."""
+    return int(timestamp * 1e9)
+
+
+def _attributes(values):
+    """Return the specified 'values' dict as a list of OTLP attributes."""
+    result = []
+    for key, value in sorted(values.items()):
+        if isinstance(value, bool):
+            value = {"boolValue": value}
+        elif isinstance(value, int):
+            value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            value = {"doubleValue": value}
+        else:
+            value = {"stringValue": str(value)}
+        result.append({"key": key, "value": value})
+    return result
+
+
+class RequestTrace(object):
+    """The recorded lifecycle of one request.
+
+    Times are in seconds since the epoch. The phases of a trace are:
+
+    - ``submit``: from the call to ``sendRequest()`` to its return;
+    - ``wait``: from the end of ``submit`` to the delivery of the first
+      response event;
+    - ``receive``: from the delivery of the first response event to the
+      delivery of the last one;
+    - ``process``: the time spent by the application processing each
+      response event, if the events are passed to
+      :meth:`RequestTracer.processing()`.
+    """
+
+    def __init__(self, correlationId, name, attributes):
+        self.correlationId = correlationId
+        """CorrelationId: Correlation id of the request"""
+        self.name = name
+        """str: Name of the request, by default its operation"""
+        self.attributes = dict(attributes or ())
+        """dict: Attributes of the request"""
+        self.traceId = _newId(16)
+        """str: OpenTelemetry trace id"""
+        self.submitStart = time.time()
+        """float: Time of the call to ``sendRequest()``"""
+        self.submitEnd = None
+        """float: Time ``sendRequest()`` returned"""
+        self.responses = []
+        """list: ``(time, eventType, messages, elements)`` of each response
+        event delivered"""
+        self.processing = []
+        """list: ``(start, end)`` of the processing of each response
+        event"""
+        self.end = None
+        """float: Time the trace completed"""
+        self.error = None
+        """str: Type of the ``REQUEST_STATUS`` message which terminated the
+        request, if any"""
+
+    def firstResponse(self):
+        """Return the time the first response event was delivered, or
+        ``None``."""
+        return self.responses[0][0] if self.responses else None
+
+    def lastResponse(self):
+        """Return the time the last response event was delivered, or
+        ``None``."""
+        return self.responses[-1][0] if self.responses else None
+
+    def duration(self):
+        """Return the number of seconds from the call to ``sendRequest()`` to
+        the completion of the trace, or to now if it is not complete."""
+        return (self.end or time.time()) - self.submitStart
+
+    def summary(self):
+        """Return a ``dict`` of the number of seconds spent in each phase,
+        with the total ``duration`` and the number of ``messages`` and
+        top-level ``elements`` received."""
+        submitEnd = self.submitEnd or self.submitStart
+        first = self.firstResponse()
+        last = self.lastResponse()
+        return {
+            "name": self.name,
+            "duration": self.duration(),
+            "submit": submitEnd - self.submitStart,
+            "wait": (first - submitEnd) if first is not None else None,
+            "receive": (last - first) if first is not None else None,
+            "process": sum(end - start for start, end in self.processing),
+            "partialResponses": sum(
+                1 for response in self.responses
+                if response[1] == Event.PARTIAL_RESPONSE),
+            "messages": sum(response[2] for response in self.responses),
+            "elements": sum(response[3] for response in self.responses),
+            "error": self.error,
+        }
+
+    def toOTLP(self):
+        """Return the spans of this trace as a list of OTLP JSON span
+        objects: a root span named after the request, with a child span per
+        phase, and an event per response on the ``receive`` span."""
+        rootId = _newId(8)
+        end = self.end or time.time()
+        submitEnd = self.submitEnd or end
+        first = self.firstResponse()
+        last = self.lastResponse()
+
+        def span(name, start, stop, parent=rootId, spanId=None,
+                 attributes=None, events=None):
+            result = {
+                "traceId": self.traceId,
+                "spanId": spanId or _newId(8),
+                "name": name,
+                "kind": 3,  # SPAN_KIND_CLIENT
+                "startTimeUnixNano": str(_nanos(start)),
+                "endTimeUnixNano": str(_nanos(stop)),
+                "attributes": _attributes(attributes or {}),
+            }
+            if parent:
+                result["parentSpanId"] = parent
+            if events:
+                result["events"] = events
+            return result
+
+        rootAttributes = dict(self.attributes)
+        rootAttributes["blpapi.correlation_id"] = str(self.correlationId)
+        summary = self.summary()
+        rootAttributes["blpapi.messages"] = summary["messages"]
+        rootAttributes["blpapi.elements"] = summary["elements"]
+        root = span(self.name, self.submitStart, end, parent=None,
+                    spanId=rootId, attributes=rootAttributes)
+        if self.error is not None:
+            root["status"] = {"code": 2, "message": self.error}
+        spans = [root, span("submit", self.submitStart, submitEnd)]
+        if first is not None:
+            spans.append(span("wait", submitEnd, first))
+            events = [{
+                "timeUnixNano": str(_nanos(at)),
+                "name": _EVENT_TYPE_NAMES.get(eventType, str(eventType)),
+                "attributes": _attributes({"blpapi.messages": messages,
+                                           "blpapi.elements": elements}),
+            } for at, eventType, messages, elements in self.responses]
+            spans.append(span("receive", first, last, events=events))
+        for start, stop in self.processing:
+            spans.append(span("process", start, stop))
+        return spans
+
+
+class RequestTracer(object):
+    """Record the lifecycle of requests, keyed by correlation id.
+
+    Requests are traced from :meth:`sendRequest()`, or from :meth:`begin()`
+    and :meth:`submitted()` for requests sent otherwise. Their response
+    events must be passed to :meth:`processEvent()` or
+    :meth:`processing()`. Events of other types, and responses to requests
+    which are not traced, are ignored.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self, maxTraces=1000, onComplete=None):
+        """Create a :class:`RequestTracer` with no traces.
+
+        Args:
+            maxTraces (int): Number of most recent completed traces kept
+            onComplete: Callable called with each :class:`RequestTrace` when
+                it completes
+        """
+        self.__lock = threading.Lock()
+        self.__active = {}
+        self.__completed = collections.deque(maxlen=maxTraces)
+        self.__onComplete = onComplete
+
+        # The responses delivered while 'sendRequest()' calls are in progress
+        # which match no active trace, as they may be the first responses to
+        # one of these requests, whose correlation id is not known until
+        # 'Session.sendRequest()' returns.
+        self.__submitting = 0
+        self.__early = []
+
+    def sendRequest(self, session, request, identity=None,
+                    correlationId=None, eventQueue=None, requestLabel="",
+                    attributes=None):
+        """Send the specified ``request`` through the specified ``session``,
+        with the other arguments of :meth:`Session.sendRequest()`, and trace
+        it.
+
+        Args:
+            attributes (dict): Additional attributes of the trace
+
+        Returns:
+            CorrelationId: The correlation id of the request.
+
+        If ``correlationId`` is ``None`` or unset, the trace is keyed by the
+        correlation id generated by the session. Responses delivered before
+        ``Session.sendRequest()`` returns are recorded once it returns; the
+        time spent processing them is not recorded.
+        """
+        # pylint: disable=too-many-arguments
+        attributes = dict(attributes or ())
+        if requestLabel:
+            attributes["blpapi.request_label"] = requestLabel
+        trace = RequestTrace(correlationId,
+                             str(request.asElement().name()),
+                             attributes)
+        with self.__lock:
+            self.__submitting += 1
+        try:
+            correlationId = session.sendRequest(request,
+                                                identity,
+                                                correlationId,
+                                                eventQueue,
+                                                requestLabel)
+        except:
+            with self.__lock:
+                self.__endSubmission()
+            raise
+        now = time.time()
+        trace.correlationId = correlationId
+        trace.submitEnd = now
+        with self.__lock:
+            self.__active[correlationId] = trace
+            early = [response for response in self.__early
+                     if response[0] == correlationId]
+            if early:
+                self.__early = [response for response in self.__early
+                                if response[0] != correlationId]
+                trace.submitEnd = min(now, early[0][1])
+                for response in early:
+                    self.__record(trace, *response[1:])
+            self.__endSubmission()
+        self.__complete([trace])
+        return correlationId
+
+    def begin(self, correlationId, name, attributes=None):
+        """Start tracing the request with the specified ``correlationId``,
+        about to be sent, with the specified ``name`` and ``attributes``.
+
+        Returns:
+            RequestTrace: The new trace.
+
+        Raises:
+            ValueError: If ``correlationId`` is unset, as the id generated
+                by the session when the request is sent is not known yet;
+                use :meth:`sendRequest()` for such requests.
+        """
+        if correlationId.type() == CorrelationId.UNSET_TYPE:
+            raise ValueError("the correlation id of a traced request must "
+                             "be set before the request is sent")
+        trace = RequestTrace(correlationId, name, attributes)
+        with self.__lock:
+            self.__active[correlationId] = trace
+        return trace
+
+    def submitted(self, correlationId):
+        """Record that the request with the specified ``correlationId`` has
+        been sent."""
+        now = time.time()
+        with self.__lock:
+            trace = self.__active.get(correlationId)
+            if trace is not None:
+                trace.submitEnd = now
+
+    def processEvent(self, event):
+        """Record the delivery of the specified ``event``, and complete the
+        traces of the requests it terminates.
+
+        Args:
+            event (Event): Event received by the session
+        """
+        traces = self.__deliver(event)
+        self.__complete(traces)
+
+    @contextlib.contextmanager
+    def processing(self, event):
+        """Return a context manager recording the delivery of the specified
+        ``event`` on entry, and the time spent processing it on exit; the
+        traces of the requests terminated by ``event`` complete on exit.
+
+        Args:
+            event (Event): Event received by the session
+        """
+        traces = self.__deliver(event)
+        start = time.time()
+        try:
+            yield
+        finally:
+            if traces:
+                end = time.time()
+                with self.__lock:
+                    for trace in traces:
+                        trace.processing.append((start, end))
+                self.__complete(traces)
+
+    def active(self):
+        """
+        Returns:
+            [RequestTrace]: The traces which are not complete.
+        """
+        with self.__lock:
+            return list(self.__active.values())
+
+    def traces(self):
+        """
+        Returns:
+            [RequestTrace]: The most recent completed traces, oldest first.
+        """
+        with self.__lock:
+            return list(self.__completed)
+
+    def clear(self):
+        """Discard the completed traces."""
+        with self.__lock:
+            self.__completed.clear()
+
+    def toOTLP(self, serviceName="blpapi"):
+        """
+        Args:
+            serviceName (str): Value of the ``service.name`` resource
+                attribute
+
+        Returns:
+            dict: The spans of the completed traces as an OTLP JSON
+            ``ExportTraceServiceRequest``.
+        """
+        spans = []
+        for trace in self.traces():
+            spans.extend(trace.toOTLP())
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": _attributes({"service.name": serviceName}),
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "blpapi.requesttracer"},
+                    "spans": spans,
+                }],
+            }],
+        }
+
+    def toJSON(self, serviceName="blpapi"):
+        """Return :meth:`toOTLP()` serialized as a JSON string."""
+        return json.dumps(self.toOTLP(serviceName), separators=(",", ":"))
+
+    def __deliver(self, event):
+        """Record the delivery of the specified 'event' and return the list
+        of the traces it concerns; the traces terminated by 'event' are
+        removed from the active traces and marked as ended."""
+        eventType = event.eventType()
+        if eventType not in _RESPONSE_EVENT_TYPES:
+            return []
+        now = time.time()
+        isFailure = eventType == Event.REQUEST_STATUS
+        counts = collections.OrderedDict()
+        for msg in event:
+            elements = msg.numElements()
+            for correlationId in msg.correlationIds():
+                count = counts.get(correlationId)
+                if count is None:
+                    count = counts[correlationId] = [0, 0, None]
+                count[0] += 1
+                count[1] += elements
+                if isFailure:
+                    count[2] = str(msg.messageType())
+        traces = []
+        with self.__lock:
+            for correlationId, (messages, elements, error) in counts.items():
+                trace = self.__active.get(correlationId)
+                if trace is None:
+                    if self.__submitting:
+                        self.__early.append((correlationId, now, eventType,
+                                             messages, elements, error))
+                    continue
+                self.__record(trace, now, eventType, messages, elements,
+                              error)
+                traces.append(trace)
+        return traces
+
+    def __record(self, trace, now, eventType, messages, elements, error):
+        """Record a response event delivered at the specified 'now' time to
+        the specified active 'trace', and end the trace if the event
+        terminates the request. The lock must be held."""
+        # pylint: disable=too-many-arguments
+        trace.responses.append((now, eventType, messages, elements))
+        if eventType != Event.PARTIAL_RESPONSE:
+            del self.__active[trace.correlationId]
+            trace.error = error
+            trace.end = now
+
+    def __endSubmission(self):
+        """Record the end of a 'sendRequest()' call, and discard the early
+        responses, which belong to untraced requests, if it was the last
+        one in progress. The lock must be held."""
+        self.__submitting -= 1
+        if not self.__submitting:
+            self.__early = []
+
+    def __complete(self, traces):
+        """Keep the specified 'traces' which are ended, and pass them to the
+        'onComplete' callback."""
+        completed = [trace for trace in traces if trace.end is not None]
+        if not completed:
+            return
+        with self.__lock:
+            for trace in completed:
+                if trace.processing:
+                    trace.end = max(trace.end, trace.processing[-1][1])
+            self.__completed.extend(completed)
+        if self.__onComplete is not None:
+            for trace in completed:
+                self.__onComplete(trace)
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
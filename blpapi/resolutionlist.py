@@ -5,6 +5,8 @@
 This component implements a list of topics that require resolution.
 """
 
+import array
+
 from .element import Element
 from .exception import _ExceptionUtil
 from .message import Message
@@ -17,6 +19,49 @@ from .compat import with_metaclass
 
 # pylint: disable=useless-object-inheritance
 
+
+def _addTopics(handle, topics, correlationIds, addTopic, addMessage):
+    """Add each of the specified 'topics' to the list with the specified
+    'handle', with the corresponding 'correlationIds', or new ones if
+    'correlationIds' is 'None', using the specified 'addTopic' or
+    'addMessage' function, and return the number of topics added.  All the
+    arguments are checked before the first topic is added."""
+    topics = list(topics)
+    if correlationIds is None:
+        correlationIds = [CorrelationId() for _ in topics]
+    else:
+        correlationIds = list(correlationIds)
+    if len(correlationIds) != len(topics):
+        raise ValueError("correlationIds and topics differ in length")
+    for correlationId in correlationIds:
+        if not isinstance(correlationId, CorrelationId):
+            raise TypeError(
+                "correlationId should be an instance of 'CorrelationId'")
+    raiseOnError = _ExceptionUtil.raiseOnError
+    for topic, correlationId in zip(topics, correlationIds):
+        if isinstance(topic, Message):
+            raiseOnError(addMessage(handle,
+                                    get_handle(topic),
+                                    get_handle(correlationId)))
+        else:
+            raiseOnError(addTopic(handle, topic, get_handle(correlationId)))
+    return len(topics)
+
+
+def _column(handle, size, valueAt):
+    """Return the list of the values returned by the specified 'valueAt'
+    function for each entry of the list with the specified 'handle', whose
+    number of entries is returned by the specified 'size' function."""
+    raiseOnError = _ExceptionUtil.raiseOnError
+    values = []
+    append = values.append
+    for index in range(size(handle)):
+        errorCode, value = valueAt(handle, index)
+        raiseOnError(errorCode)
+        append(value)
+    return values
+
+
 @with_metaclass(utils.MetaClassForClassesWithEnums)
 class ResolutionList(object):
     """Contains a list of topics that require resolution.
@@ -125,6 +170,55 @@ class ResolutionList(object):
             topicOrMessage,
             get_handle(correlationId))
 
+    @classmethod
+    def fromTopics(cls, topics, correlationIds=None):
+        """Create a :class:`ResolutionList` holding the specified ``topics``.
+
+        Args:
+            topics ([str or Message]): Topics, or messages holding the topics,
+                to add
+            correlationIds ([CorrelationId]): CorrelationIds to associate
+                with ``topics``, or ``None``
+
+        Returns:
+            ResolutionList: A new list, as populated by :meth:`addMany()`.
+        """
+        resolutionList = cls()
+        resolutionList.addMany(topics, correlationIds)
+        return resolutionList
+
+    def addMany(self, topics, correlationIds=None):
+        """Add each of the specified ``topics`` to this list.
+
+        Args:
+            topics ([str or Message]): Topics, or messages holding the topics,
+                to add
+            correlationIds ([CorrelationId]): CorrelationIds to associate
+                with ``topics``, in the same order, or ``None``
+
+        Returns:
+            int: The number of topics added.
+
+        Raises:
+            TypeError: If an element of ``correlationIds`` is not an instance
+                of :class:`CorrelationId`.
+            ValueError: If ``correlationIds`` and ``topics`` do not have the
+                same length.
+            Exception: If a topic cannot be added.
+
+        Equivalent to calling :meth:`add()` for each topic and checking the
+        result, without a method call per topic.  ``correlationIds`` are all
+        checked before the first topic is added, so a ``TypeError`` or
+        ``ValueError`` leaves this list unchanged; a topic which cannot be
+        added leaves the topics before it in this list.  After a successful
+        call the status of each added entry is ``UNRESOLVED_TOPIC``.
+        """
+        return _addTopics(self.__handle,
+                          topics,
+                          correlationIds,
+                          internals.blpapi_ResolutionList_add,
+                          internals.blpapi_ResolutionList_addFromMessage)
+
     def addAttribute(self, attribute):
         """Add the specified ``attribute`` to the list of attributes.
 
@@ -336,6 +430,35 @@ class ResolutionList(object):
         _ExceptionUtil.raiseOnError(errorCode)
         return Message(message, sessions=self.__sessions)
 
+    def correlationIds(self):
+        """
+        Returns:
+            [CorrelationId]: Correlation ids of all the entries, in order.
+        """
+        return _column(self.__handle,
+                       internals.blpapi_ResolutionList_size,
+                       internals.blpapi_ResolutionList_correlationIdAt)
+
+    def topicStrings(self):
+        """
+        Returns:
+            [str]: Full topic strings of all the entries, in order.
+        """
+        return _column(self.__handle,
+                       internals.blpapi_ResolutionList_size,
+                       internals.blpapi_ResolutionList_topicStringAt)
+
+    def statuses(self):
+        """
+        Returns:
+            array.array: Statuses of all the entries, in order, as an
+            ``array.array`` of ``int`` (see :meth:`statusAt()`).
+        """
+        statuses = _column(self.__handle,
+                           internals.blpapi_ResolutionList_size,
+                           internals.blpapi_ResolutionList_statusAt)
+        return array.array('i', statuses)
+
     def size(self):
         """
         Returns:
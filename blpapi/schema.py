@@ -19,11 +19,11 @@ permitted to be associated with that identifier.
 """
 
 from .exception import NotFoundException, IndexOutOfRangeException
-from .name import Name, getNamePair
-from .constant import ConstantList
+from .name import Name
+from .constant import ConstantList, _clearConstantTables
 from . import utils
 from . import internals
-from .compat import with_metaclass
+from .compat import with_metaclass, conv2str, isstr, tolong
 
 # pylint: disable=useless-object-inheritance,protected-access,too-few-public-methods
 
@@ -197,6 +197,10 @@ class SchemaElementDefinition(object):
             level,
             spacesPerLevel)
 
+    def _handle(self):
+        """Return the internal implementation."""
+        return self.__handle
+
     def _sessions(self):
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
@@ -328,12 +332,7 @@ class SchemaTypeDefinition(object):
         Raises:
             Exception: If ``name`` is neither a :class:`Name` nor a string.
         """
-
-        name = getNamePair(name)
-        return bool(internals.blpapi_SchemaTypeDefinition_hasElementDefinition(
-            self.__handle,
-            name[0],
-            name[1]))
+        return _typeIndex(self.__handle).find(name, False) is not None
 
     def getElementDefinition(self, nameOrIndex):
         """
@@ -349,28 +348,37 @@ class SchemaTypeDefinition(object):
             IndexOutOfRangeException: If ``nameOrIndex`` is an integer and
                 ``nameOrIndex >= numElementDefinitions()``
         """
-
+        index = _typeIndex(self.__handle)
         if not isinstance(nameOrIndex, int):
-            name = nameOrIndex
-            names = getNamePair(name)
-            res = internals.blpapi_SchemaTypeDefinition_getElementDefinition(
-                self.__handle,
-                names[0],
-                names[1])
-            if res is None:
+            position = index.find(nameOrIndex, False)
+            if position is None:
                 errMessage =\
                     "Name '{0!s}' not a sub-element of element '{1!s}'.".\
-                    format(name, self.name())
+                    format(nameOrIndex, self.name())
                 raise NotFoundException(errMessage, 0)
-            return SchemaElementDefinition(res, self.__sessions)
+            return SchemaElementDefinition(index.handles[position],
+                                           self.__sessions)
         position = nameOrIndex
-        res = internals.blpapi_SchemaTypeDefinition_getElementDefinitionAt(
-            self.__handle,
-            position)
-        if res is None:
+        if not 0 <= position < len(index.handles):
             errMessage = "Index '{0}' out of bounds.".format(position)
             raise IndexOutOfRangeException(errMessage, 0)
-        return SchemaElementDefinition(res, self.__sessions)
+        return SchemaElementDefinition(index.handles[position],
+                                       self.__sessions)
+
+    def indexOf(self, name):
+        """
+        Args:
+            name (Name or str): Name or alternate name of an element
+
+        Returns:
+            int: Position of the element definition whose name or one of
+            whose alternate names is ``name``, or ``None`` if there is no such
+            element definition.
+
+        Raises:
+            TypeError: If ``name`` is neither a :class:`Name` nor a string.
+        """
+        return _typeIndex(self.__handle).find(name, True)
 
     def elementDefinitions(self):
         """
@@ -414,10 +422,90 @@ class SchemaTypeDefinition(object):
             level,
             spacesPerLevel)
 
+    def _handle(self):
+        """Return the internal implementation."""
+        return self.__handle
+
     def _sessions(self):
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
+
+class _TypeIndex(object):
+    """Lookup tables from the names and alternate names of the element
+    definitions of a type to their positions. For internal use."""
+
+    __slots__ = ("handles", "names", "nameHandles", "alternateNames",
+                 "alternateNameHandles")
+
+    def __init__(self, typeHandle):
+        count = internals.blpapi_SchemaTypeDefinition_numElementDefinitions(
+            typeHandle)
+        self.handles = tuple(
+            internals.blpapi_SchemaTypeDefinition_getElementDefinitionAt(
+                typeHandle, position)
+            for position in range(count))
+        self.names = {}
+        self.nameHandles = {}
+        self.alternateNames = {}
+        self.alternateNameHandles = {}
+        for position, handle in enumerate(self.handles):
+            nameHandle = internals.blpapi_SchemaElementDefinition_name(handle)
+            self.nameHandles[tolong(nameHandle)] = position
+            self.names[internals.blpapi_Name_string(nameHandle)] = position
+            for i in range(
+                    internals.blpapi_SchemaElementDefinition_numAlternateNames(
+                        handle)):
+                nameHandle = \
+                    internals.blpapi_SchemaElementDefinition_getAlternateName(
+                        handle, i)
+                self.alternateNameHandles.setdefault(tolong(nameHandle),
+                                                     position)
+                self.alternateNames.setdefault(
+                    internals.blpapi_Name_string(nameHandle), position)
+
+    def find(self, name, includeAlternateNames):
+        """Return the position of the element definition with the specified
+        'name' (or alternate name, if 'includeAlternateNames'), or 'None'."""
+        if isinstance(name, Name):
+            key = tolong(name._handle())
+            position = self.nameHandles.get(key)
+            if position is None and includeAlternateNames:
+                position = self.alternateNameHandles.get(key)
+            return position
+        if isstr(name):
+            key = conv2str(name)
+            position = self.names.get(key)
+            if position is None and includeAlternateNames:
+                position = self.alternateNames.get(key)
+            return position
+        raise TypeError(
+            "name should be an instance of a string or blpapi.Name")
+
+
+# Type definition handle -> _TypeIndex. Type definitions are owned by the
+# services of a session, so the indexes are dropped whenever a session is
+# destroyed, as a handle may then be reused for another type.
+_TYPE_INDEXES = {}
+
+
+def _typeIndex(typeHandle):
+    """Return the '_TypeIndex' of the type with the specified 'typeHandle',
+    building it on first use. For internal use."""
+    key = tolong(typeHandle)
+    index = _TYPE_INDEXES.get(key)
+    if index is None:
+        index = _TypeIndex(typeHandle)
+        _TYPE_INDEXES[key] = index
+    return index
+
+
+def _clearTypeIndexes():
+    """Drop all the cached '_TypeIndex'es and '_ConstantTable's. For
+    internal use."""
+    _TYPE_INDEXES.clear()
+    _clearConstantTables()
+
 __copyright__ = """
 Copyright 2012. Bloomberg Finance L.P.
 
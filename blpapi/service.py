@@ -8,6 +8,7 @@ provider service (can generate API data) or a consumer service.
 
 """
 
+from .compiledschema import _SchemaCompiler
 from .event import Event
 from .name import getNamePair
 from .request import Request
@@ -411,6 +412,26 @@ class Service(object):
         _ExceptionUtil.raiseOnError(errCode)
         return Request(request, self.__sessions)
 
+    def compileSchema(self):
+        """Copy the whole schema of this :class:`Service` into Python objects.
+
+        Returns:
+            CompiledSchema: Immutable copy of the operations and event
+            definitions of this :class:`Service`, including the names,
+            datatypes, number of values, enumerations and alternate names of
+            all the elements.
+
+        The returned :class:`CompiledSchema` does not refer to this
+        :class:`Service`: it can be queried without calling into the C
+        library, pickled, and saved to and loaded from a JSON file with
+        :meth:`CompiledSchema.save()` and :meth:`CompiledSchema.load()`.
+
+        Note:
+            This walks every node of the schema and is preferably called once
+            per service.
+        """
+        return _SchemaCompiler().compileService(self)
+
     def _handle(self):
         """Return the internal implementation."""
         return self.__handle
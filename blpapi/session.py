@@ -20,6 +20,7 @@ from . import internals
 from .internals import CorrelationId
 from .sessionoptions import SessionOptions
 from .requesttemplate import RequestTemplate
+from .schema import _clearTypeIndexes
 from .utils import get_handle
 
 # pylint: disable=too-many-arguments,protected-access,bare-except
@@ -104,7 +105,15 @@ class Session(AbstractSession):
             session = sessionRef()
             if session is not None:
                 event = Event(eventHandle, session)
-                session.__handler(event, session)
+                metrics = session.metrics()
+                if metrics is None:
+                    session.__handler(event, session)
+                else:
+                    start = metrics.clock()
+                    try:
+                        session.__handler(event, session)
+                    finally:
+                        metrics.recordDispatch(event.eventType(), start)
         except:
             print("Exception in event handler:", file=sys.stderr)
             traceback.print_exc(file=sys.stderr)
@@ -177,6 +186,7 @@ class Session(AbstractSession):
         if self.__handle:
             internals.Session_destroyHelper(self.__handle, self.__handlerProxy)
             self.__handle = None
+            _clearTypeIndexes()
 
     def start(self):
         """Start this :class:`Session` in synchronous mode.
@@ -264,12 +274,18 @@ class Session(AbstractSession):
         If :meth:`nextEvent()` returns due to a timeout it will return an event
         of type :attr:`~Event.TIMEOUT`.
         """
+        metrics = self.metrics()
+        if metrics is not None:
+            start = metrics.clock()
         retCode, event = internals.blpapi_Session_nextEvent(self.__handle,
                                                             timeout)
 
         _ExceptionUtil.raiseOnError(retCode)
 
-        return Event(event, self)
+        event = Event(event, self)
+        if metrics is not None:
+            metrics.recordNextEvent(event.eventType(), start)
+        return event
 
     def tryNextEvent(self):
         """
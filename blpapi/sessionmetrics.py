@@ -0,0 +1,307 @@
+# sessionmetrics.py
+
+"""Provide runtime metrics of a session.
+
+This file defines a class 'SessionMetrics' which counts the events delivered
+by a session, by event type, and records in histograms the time taken by the
+event handler, the time spent waiting in 'nextEvent' and the time taken by
+'publish'.  It also defines the class 'Histogram' used for these times.
+
+Usage
+-----
+Metrics are disabled by default.  The following snippet shows how an
+application enables them on a session and exports them every minute.
+
+    session = blpapi.Session(options, processEvent)
+    metrics = session.enableMetrics(name="marketdata")
+    ...
+    exporter = blpapi.PrometheusTextfileExporter(
+        "/var/lib/node_exporter/session.prom")
+    while running:
+        time.sleep(60)
+        metrics.export(exporter)
+
+'session.metrics().snapshot()' returns the same data as a 'dict', for
+example to log it.
+
+When metrics are enabled, each dispatched event costs two clock reads and
+one uncontended lock acquisition; when they are disabled, one call of
+'metrics()', which returns 'None'.  An event whose handler raises is
+recorded too.
+"""
+
+from __future__ import absolute_import
+
+import bisect
+import threading
+import time
+
+from .event import Event
+
+# pylint: disable=useless-object-inheritance
+
+_clock = getattr(time, "perf_counter", time.time)
+
+
+class Histogram(object):
+    """A histogram of durations, in seconds, with fixed buckets.
+
+    The default upper bounds of the buckets are the powers of two from one
+    microsecond to about 17 seconds, with a last bucket for longer durations.
+    Recording a duration is a binary search and an increment.
+
+    This class is not thread safe; :class:`SessionMetrics` serializes the
+    calls to :meth:`record()`.
+    """
+
+    BOUNDS = tuple(1e-6 * (1 << i) for i in range(25))
+    """Default upper bounds of the buckets, in seconds"""
+
+    def __init__(self, bounds=BOUNDS):
+        """Create an empty :class:`Histogram`.
+
+        Args:
+            bounds ([float]): Increasing upper bounds of the buckets
+        """
+        self.__bounds = tuple(bounds)
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__max = 0.0
+
+    def record(self, value):
+        """Add the specified ``value`` to this histogram."""
+        self.__counts[bisect.bisect_left(self.__bounds, value)] += 1
+        self.__count += 1
+        self.__sum += value
+        if value > self.__max:
+            self.__max = value
+
+    def count(self):
+        """Return the number of recorded values."""
+        return self.__count
+
+    def sum(self):
+        """Return the sum of the recorded values."""
+        return self.__sum
+
+    def max(self):
+        """Return the largest recorded value, or ``0`` if there is none."""
+        return self.__max
+
+    def buckets(self):
+        """
+        Returns:
+            [(float, int)]: The upper bound of each bucket, ``inf`` for the
+            last one, with the number of recorded values not above it.
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.__bounds + (float("inf"),),
+                                self.__counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q):
+        """
+        Args:
+            q (float): Quantile, between ``0`` and ``1``
+
+        Returns:
+            float: The upper bound of the bucket holding the ``q`` quantile
+            of the recorded values, capped by the largest value, or ``0`` if
+            there is none.
+        """
+        if not self.__count:
+            return 0.0
+        rank = q * self.__count
+        for bound, total in self.buckets():
+            if total >= rank:
+                return min(bound, self.__max)
+        return self.__max
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: The ``count``, ``sum``, ``max``, ``p50``, ``p99`` and
+            ``p999`` of the recorded values.
+        """
+        return {
+            "count": self.__count,
+            "sum": self.__sum,
+            "max": self.__max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "p999": self.quantile(0.999),
+        }
+
+
+class SessionMetrics(object):
+    """Counters and histograms of the activity of a session.
+
+    An instance is created by :meth:`AbstractSession.enableMetrics()` and
+    updated by the session:
+
+    - for each event passed to the event handler, the count of its type and
+      the ``handler`` histogram of the time taken by the handler;
+    - for each event other than :attr:`Event.TIMEOUT` returned by
+      ``nextEvent()`` of the session, or of an :class:`EventQueue` used with
+      the session, the count of its type and the ``nextEvent`` histogram of
+      the time spent waiting for it;
+    - for each call to :meth:`ProviderSession.publish()`, including a call
+      which raises, the ``publish`` histogram of its duration.
+
+    The library does not expose the depth of the queues of a session; the
+    time spent waiting in ``nextEvent()`` and the ``handler`` time relative
+    to the elapsed time show whether the application keeps up.
+
+    All the methods of this class are thread safe.
+    """
+
+    EVENT_TYPE_NAMES = dict((value, name)
+                            for name, value in vars(Event).items()
+                            if name.isupper() and isinstance(value, int))
+    """Name of each event type"""
+
+    def __init__(self, name=""):
+        """Create a :class:`SessionMetrics` with no recorded activity.
+
+        Args:
+            name (str): Name of the session, exported as the ``session``
+                label of every metric if not empty
+        """
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all the counters and histograms."""
+        with self.__lock:
+            self.__start = _clock()
+            self.__events = {}
+            self.__histograms = {
+                "handler": Histogram(),
+                "nextEvent": Histogram(),
+                "publish": Histogram(),
+            }
+
+    @staticmethod
+    def clock():
+        """Return the current time, in seconds, of the clock used to measure
+        durations, for the ``start`` arguments of the ``record*``
+        methods."""
+        return _clock()
+
+    def recordDispatch(self, eventType, start):
+        """Record an event of the specified ``eventType`` whose handler was
+        called at the specified ``start`` time and has just returned or
+        raised."""
+        elapsed = _clock() - start
+        with self.__lock:
+            self.__events[eventType] = self.__events.get(eventType, 0) + 1
+            self.__histograms["handler"].record(elapsed)
+
+    def recordNextEvent(self, eventType, start):
+        """Record an event of the specified ``eventType`` just returned by a
+        ``nextEvent()`` call made at the specified ``start`` time.  An
+        :attr:`Event.TIMEOUT` event is not recorded."""
+        if eventType == Event.TIMEOUT:
+            return
+        elapsed = _clock() - start
+        with self.__lock:
+            self.__events[eventType] = self.__events.get(eventType, 0) + 1
+            self.__histograms["nextEvent"].record(elapsed)
+
+    def recordPublish(self, start):
+        """Record a ``publish()`` call made at the specified ``start`` time
+        which has just returned or raised."""
+        elapsed = _clock() - start
+        with self.__lock:
+            self.__histograms["publish"].record(elapsed)
+
+    def events(self):
+        """
+        Returns:
+            dict: The number of events of each type delivered, keyed by the
+            name of the type.
+        """
+        names = self.EVENT_TYPE_NAMES
+        with self.__lock:
+            return dict((names.get(eventType, str(eventType)), count)
+                        for eventType, count in self.__events.items())
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: The ``elapsed`` number of seconds since the metrics were
+            enabled or reset, the ``events`` counts by type name, the
+            ``eventsPerSecond`` over ``elapsed``, and the
+            :meth:`Histogram.snapshot()` of each histogram keyed by its name.
+        """
+        events = self.events()
+        with self.__lock:
+            elapsed = _clock() - self.__start
+            result = dict((name, histogram.snapshot())
+                          for name, histogram in self.__histograms.items())
+        result["elapsed"] = elapsed
+        result["events"] = events
+        result["eventsPerSecond"] = \
+            sum(events.values()) / elapsed if elapsed > 0 else 0.0
+        return result
+
+    def metrics(self):
+        """
+        Returns:
+            [(str, dict, number)]: The metrics, as passed to an exporter such
+            as :class:`PrometheusTextfileExporter`: ``session_events`` with a
+            ``type`` label, and for each histogram the
+            ``session_<name>_seconds`` buckets with an ``le`` label, sum and
+            count.
+        """
+        labels = {"session": self.__name} if self.__name else {}
+        result = []
+        for typeName, count in sorted(self.events().items()):
+            eventLabels = dict(labels, type=typeName)
+            result.append(("session_events", eventLabels, count))
+        with self.__lock:
+            histograms = sorted(self.__histograms.items())
+            histograms = [(name, histogram.buckets(), histogram.sum(),
+                           histogram.count())
+                          for name, histogram in histograms]
+        for name, buckets, total, count in histograms:
+            metric = "session_{0}_seconds".format(name)
+            for bound, cumulative in buckets:
+                bucketLabels = dict(labels, le=repr(bound)
+                                    if bound != float("inf") else "+Inf")
+                result.append((metric + "_bucket", bucketLabels, cumulative))
+            result.append((metric + "_sum", labels, total))
+            result.append((metric + "_count", labels, count))
+        return result
+
+    def export(self, exporter):
+        """Pass the :meth:`metrics()` to the specified ``exporter``, a
+        callable taking an iterable of ``(name, labels, value)`` tuples."""
+        exporter(self.metrics())
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -91,6 +91,31 @@ from .utils import get_handle
 
 # pylint: disable=useless-object-inheritance
 
+
+def _joinFields(fields):
+    """Return the specified 'fields' as a comma separated string."""
+    if fields is None:
+        return None
+    if isstr(fields):
+        return conv2str(fields)
+    return ",".join(fields)
+
+
+def _joinOptions(options):
+    """Return the specified 'options' as an ampersand separated string."""
+    if options is None:
+        return None
+    if isstr(options):
+        return conv2str(options)
+    if isinstance(options, (list, tuple)):
+        return "&".join(options)
+    if isinstance(options, dict):
+        return "&".join([key if val is None
+                         else "{0}={1}".format(key, val)
+                         for key, val in options.items()])
+    return options
+
+
 class SubscriptionList(object):
     """A list of subscriptions.
 
@@ -175,28 +200,67 @@ class SubscriptionList(object):
         if topic is None:
             topic = ""
 
-        if fields is not None:
-            if isstr(fields):
-                fields = conv2str(fields)
-            else:
-                fields = ",".join(fields)
-
-        if options is not None:
-            if isstr(options):
-                options = conv2str(options)
-            elif isinstance(options, (list, tuple)):
-                options = "&".join(options)
-            elif isinstance(options, dict):
-                options = "&".join([key if val is None
-                                    else "{0}={1}".format(key, val)
-                                    for key, val in options.items()])
-
         return internals.blpapi_SubscriptionList_addHelper(
             self.__handle,
             topic,
             get_handle(correlationId),
-            fields,
-            options)
+            _joinFields(fields),
+            _joinOptions(options))
+
+    def addMany(self, topics, fields=None, options=None, correlationIds=None):
+        """Add each of the specified ``topics`` to this
+        :class:`SubscriptionList`, with the same ``fields`` and ``options``.
+
+        Args:
+            topics ([str]): The topics to subscribe to
+            fields (str or [str]): List of fields to subscribe to
+            options (str or [str] or dict): List of options
+            correlationIds ([CorrelationId]): Correlation ids to associate
+                with ``topics``, in the same order, or ``None``
+
+        Returns:
+            int: The number of topics added.
+
+        Raises:
+            TypeError: If an element of ``correlationIds`` is not an instance
+                of :class:`CorrelationId`.
+            ValueError: If ``correlationIds`` and ``topics`` do not have the
+                same length.
+            Exception: If a topic cannot be added.
+
+        Equivalent to calling :meth:`add()` for each topic, except that
+        ``fields`` and ``options`` are formatted once for the whole batch. If
+        ``correlationIds`` is ``None`` every subscription gets an internally
+        generated correlation id.  ``correlationIds`` are all checked before
+        the first topic is added, so a ``TypeError`` or ``ValueError`` leaves
+        this list unchanged.
+        """
+        topics = list(topics)
+        if correlationIds is None:
+            correlationIds = [CorrelationId() for _ in topics]
+        else:
+            correlationIds = list(correlationIds)
+            if len(correlationIds) != len(topics):
+                raise ValueError(
+                    "correlationIds and topics differ in length")
+            for correlationId in correlationIds:
+                if not isinstance(correlationId, CorrelationId):
+                    raise TypeError("correlationId should be an instance of "
+                                    "'CorrelationId'")
+
+        fields = _joinFields(fields)
+        options = _joinOptions(options)
+
+        handle = self.__handle
+        addHelper = internals.blpapi_SubscriptionList_addHelper
+        raiseOnError = _ExceptionUtil.raiseOnError
+        for topic, correlationId in zip(topics, correlationIds):
+            raiseOnError(addHelper(handle,
+                                   "" if topic is None else topic,
+                                   get_handle(correlationId),
+                                   fields,
+                                   options))
+        return len(topics)
 
     def append(self, other):
         """Append a copy of the specified :class:`SubscriptionList` to this
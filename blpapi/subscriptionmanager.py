@@ -0,0 +1,372 @@
+# subscriptionmanager.py
+
+"""Provide declarative management of the subscriptions of a 'Session'.
+
+This file defines a class 'SubscriptionManager' which keeps track of the
+subscriptions made through it and, given the set of subscriptions the
+application wants, issues only the 'subscribe', 'unsubscribe' and
+'resubscribe' calls needed to get there.
+
+Usage
+-----
+The following snippet shows how an application tracking a universe of
+securities keeps its subscriptions in line with it.
+
+    manager = blpapi.SubscriptionManager(session)
+    manager.update({"IBM US Equity": ["BID", "ASK"],
+                    "MSFT US Equity": ["BID", "ASK"]})
+    ...
+    changes = manager.update({"IBM US Equity": ["BID", "ASK", "LAST_PRICE"],
+                              "AAPL US Equity": ["BID", "ASK"]})
+
+The second call resubscribes to "IBM US Equity", unsubscribes from "MSFT US
+Equity" and subscribes to "AAPL US Equity"; subscriptions whose fields and
+options are unchanged are not touched.  Each operation is sent as one
+'SubscriptionList', and each subscription keeps the same 'CorrelationId' for
+its whole life.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import itertools
+import threading
+
+from .compat import isstr
+from .internals import CorrelationId
+from .subscriptionlist import SubscriptionList
+
+# pylint: disable=useless-object-inheritance
+
+SubscriptionChanges = collections.namedtuple(
+    "SubscriptionChanges", ["subscribed", "unsubscribed", "resubscribed"])
+SubscriptionChanges.__doc__ = """The topics affected by an update of a
+:class:`SubscriptionManager`, as three lists: ``subscribed``,
+``unsubscribed`` and ``resubscribed``."""
+
+
+def _normalizeFields(fields):
+    """Return the specified 'fields' as a sorted tuple without duplicates."""
+    if not fields:
+        return ()
+    if isstr(fields):
+        fields = fields.split(",")
+    return tuple(sorted(set(field.strip() for field in fields)))
+
+
+def _normalizeOptions(options):
+    """Return the specified 'options' as a sorted tuple of 'key=value'
+    strings."""
+    if not options:
+        return ()
+    if isstr(options):
+        options = options.split("&")
+    elif isinstance(options, dict):
+        options = [key if value is None else "{0}={1}".format(key, value)
+                   for key, value in options.items()]
+    return tuple(sorted(options))
+
+
+def _normalize(subscriptions):
+    """Return a dict mapping each topic of the specified 'subscriptions' to
+    its normalized '(fields, options)' pair."""
+    if hasattr(subscriptions, "items"):
+        subscriptions = subscriptions.items()
+    desired = {}
+    for entry in subscriptions:
+        if isstr(entry):
+            topic, fields, options = entry, None, None
+        else:
+            entry = tuple(entry)
+            topic = entry[0]
+            fields = entry[1] if len(entry) > 1 else None
+            options = entry[2] if len(entry) > 2 else None
+        desired[topic] = (_normalizeFields(fields), _normalizeOptions(options))
+    return desired
+
+
+class SubscriptionManager(object):
+    """Keep the subscriptions of a :class:`Session` equal to a desired set.
+
+    The desired set of subscriptions is passed to :meth:`update()` as a
+    mapping from topic to fields, or as an iterable of topics or of
+    ``(topic, fields[, options])`` tuples.  Two subscriptions to the same
+    topic are identical if they have the same fields, in any order, and the
+    same options.
+
+    Each subscription made by this object is identified by an integer
+    :class:`CorrelationId` allocated by this object, which is kept when the
+    subscription is resubscribed.  Applications sharing the session should
+    not use integer correlation ids in the same range for other purposes.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self, session, identity=None, requestLabel="",
+                 firstCorrelationId=1):
+        """Create a :class:`SubscriptionManager` for the specified
+        ``session``, with no subscriptions.
+
+        Args:
+            session (Session): Session to subscribe with
+            identity (Identity): Identity used for authorization of the
+                subscriptions
+            requestLabel (str): Label passed to the session with each
+                operation
+            firstCorrelationId (int): Value of the first correlation id
+                allocated to a subscription
+        """
+        self.__session = session
+        self.__identity = identity
+        self.__requestLabel = requestLabel
+        self.__nextId = itertools.count(firstCorrelationId)
+        self.__lock = threading.RLock()
+        self.__current = {}
+        self.__correlationIds = {}
+        self.__topics = {}
+
+    def diff(self, subscriptions):
+        """
+        Args:
+            subscriptions: Desired subscriptions (see
+                :class:`SubscriptionManager`)
+
+        Returns:
+            SubscriptionChanges: The changes :meth:`update()` would make for
+            the specified ``subscriptions``, without making them.
+        """
+        return self.__diff(_normalize(subscriptions))
+
+    def update(self, subscriptions, resubscriptionId=None):
+        """Subscribe, unsubscribe and resubscribe as needed for the
+        subscriptions of the session to be the specified ``subscriptions``.
+
+        Args:
+            subscriptions: Desired subscriptions (see
+                :class:`SubscriptionManager`)
+            resubscriptionId (int): Id passed to
+                :meth:`~Session.resubscribe()`
+
+        Returns:
+            SubscriptionChanges: The changes made.
+
+        Raises:
+            Exception: If one of the session calls fails. The changes made
+                by the preceding calls are kept.
+
+        The unsubscriptions are made first, then the resubscriptions and
+        the subscriptions, each with a single call to the session.
+        """
+        desired = _normalize(subscriptions)
+        with self.__lock:
+            return self.__apply(self.__diff(desired),
+                                desired,
+                                resubscriptionId)
+
+    def add(self, topic, fields=None, options=None):
+        """Add the subscription to the specified ``topic`` to the desired
+        subscriptions, replacing any existing one.
+
+        Args:
+            topic (str): Topic to subscribe to
+            fields (str or [str]): Fields to subscribe to
+            options (str or [str] or dict): Options of the subscription
+
+        Returns:
+            SubscriptionChanges: The changes made.
+        """
+        desired = _normalize([(topic, fields, options)])
+        with self.__lock:
+            existing = self.__current.get(topic)
+            changes = SubscriptionChanges(
+                [topic] if existing is None else [],
+                [],
+                [topic] if existing not in (None, desired[topic]) else [])
+            return self.__apply(changes, desired)
+
+    def remove(self, topics):
+        """Remove the subscriptions to the specified ``topics`` from the
+        desired subscriptions.
+
+        Args:
+            topics (str or [str]): Topics to unsubscribe from
+
+        Returns:
+            SubscriptionChanges: The changes made.
+        """
+        if isstr(topics):
+            topics = (topics,)
+        with self.__lock:
+            changes = SubscriptionChanges(
+                [],
+                [topic for topic in set(topics) if topic in self.__current],
+                [])
+            return self.__apply(changes, {})
+
+    def clear(self):
+        """Unsubscribe from all the subscriptions made by this object.
+
+        Returns:
+            SubscriptionChanges: The changes made.
+        """
+        return self.update(())
+
+    def forget(self, correlationId):
+        """Stop tracking the subscription identified by the specified
+        ``correlationId`` without unsubscribing.
+
+        Args:
+            correlationId (CorrelationId): Correlation id of the subscription
+
+        Returns:
+            str: The topic of the subscription, or ``None`` if
+            ``correlationId`` does not identify a subscription made by this
+            object.
+
+        Call this method when a subscription fails or is terminated, so that
+        the next :meth:`update()` listing its topic subscribes again.
+        """
+        with self.__lock:
+            topic = self.__topics.pop(correlationId, None)
+            if topic is not None:
+                del self.__current[topic]
+                del self.__correlationIds[topic]
+            return topic
+
+    def correlationId(self, topic):
+        """
+        Args:
+            topic (str): Topic of the subscription
+
+        Returns:
+            CorrelationId: The correlation id of the subscription to
+            ``topic``, or ``None`` if there is none.
+        """
+        with self.__lock:
+            return self.__correlationIds.get(topic)
+
+    def topic(self, correlationId):
+        """
+        Args:
+            correlationId (CorrelationId): Correlation id of the subscription
+
+        Returns:
+            str: The topic of the subscription identified by
+            ``correlationId``, or ``None`` if there is none.
+        """
+        with self.__lock:
+            return self.__topics.get(correlationId)
+
+    def subscriptions(self):
+        """
+        Returns:
+            dict: The current subscriptions, as a mapping from topic to a
+            ``(fields, options)`` pair of tuples.
+        """
+        with self.__lock:
+            return dict(self.__current)
+
+    def __len__(self):
+        """Return the number of current subscriptions."""
+        with self.__lock:
+            return len(self.__current)
+
+    def __contains__(self, topic):
+        """Return ``True`` if there is a current subscription to the
+        specified ``topic``."""
+        with self.__lock:
+            return topic in self.__current
+
+    def __diff(self, desired):
+        """Return the changes needed to go from the current subscriptions to
+        the specified 'desired' ones."""
+        with self.__lock:
+            current = self.__current
+            unsubscribed = [topic for topic in current if topic not in desired]
+            subscribed = []
+            resubscribed = []
+            for topic, parameters in desired.items():
+                existing = current.get(topic)
+                if existing is None:
+                    subscribed.append(topic)
+                elif existing != parameters:
+                    resubscribed.append(topic)
+        return SubscriptionChanges(subscribed, unsubscribed, resubscribed)
+
+    def __apply(self, changes, desired, resubscriptionId=None):
+        """Make the specified 'changes', using the parameters in the
+        specified 'desired', and return 'changes'."""
+        self.__unsubscribe(changes.unsubscribed)
+        self.__subscribe(changes.resubscribed, desired, resubscriptionId)
+        self.__subscribe(changes.subscribed, desired)
+        return changes
+
+    def __unsubscribe(self, topics):
+        """Unsubscribe from the specified 'topics' with a single call."""
+        if not topics:
+            return
+        subscriptionList = SubscriptionList()
+        subscriptionList.addMany([""] * len(topics),
+                                 correlationIds=[self.__correlationIds[topic]
+                                                 for topic in topics])
+        self.__session.unsubscribe(subscriptionList)
+        for topic in topics:
+            del self.__current[topic]
+            del self.__topics[self.__correlationIds.pop(topic)]
+
+    def __subscribe(self, topics, desired, resubscriptionId=None):
+        """Subscribe to the specified 'topics' with the parameters in the
+        specified 'desired', with a single call.  Topics with a current
+        subscription are resubscribed, with the specified
+        'resubscriptionId'."""
+        if not topics:
+            return
+        resubscribe = topics[0] in self.__current
+        groups = collections.defaultdict(list)
+        for topic in topics:
+            groups[desired[topic]].append(topic)
+        correlationIds = {}
+        subscriptionList = SubscriptionList()
+        for (fields, options), group in groups.items():
+            for topic in group:
+                correlationIds[topic] = self.__correlationIds[topic] \
+                    if resubscribe else CorrelationId(next(self.__nextId))
+            subscriptionList.addMany(
+                group,
+                fields or None,
+                list(options) or None,
+                [correlationIds[topic] for topic in group])
+        if resubscribe:
+            self.__session.resubscribe(subscriptionList,
+                                       self.__requestLabel,
+                                       resubscriptionId)
+        else:
+            self.__session.subscribe(subscriptionList,
+                                     self.__identity,
+                                     self.__requestLabel)
+        for topic, correlationId in correlationIds.items():
+            self.__current[topic] = desired[topic]
+            self.__correlationIds[topic] = correlationId
+            self.__topics[correlationId] = topic
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
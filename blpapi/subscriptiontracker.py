@@ -0,0 +1,344 @@
+# subscriptiontracker.py
+
+"""Provide a table of the states of the subscriptions of a 'Session'.
+
+This file defines a class 'SubscriptionTracker' which consumes the
+'SUBSCRIPTION_STATUS' and 'SUBSCRIPTION_DATA' events of a 'Session' and keeps,
+for each subscription, its state, the time of its last status or data
+message, the number of data messages received and the reason of its last
+failure or termination.
+
+Usage
+-----
+The following snippet shows how an application hands its events to a
+'SubscriptionTracker' and finds the subscriptions which stopped ticking.
+
+    tracker = blpapi.SubscriptionTracker()
+
+    def processEvent(event, session):
+        tracker.processEvent(event)
+        ...
+
+    for correlationId in tracker.stale(60):
+        print("no update for a minute:", tracker.topic(correlationId))
+
+The per subscription values are stored in arrays indexed by a slot number
+allocated to each correlation id, the number of subscriptions in each state
+is maintained as messages arrive, and the subscriptions are kept ordered by
+the time of their last message, so that neither 'counts' nor 'stale' scans
+the whole table.
+"""
+
+from __future__ import absolute_import
+
+import array
+import collections
+import threading
+import time
+
+from .event import Event
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+REASON = "reason"
+DESCRIPTION = "description"
+SUBSCRIPTION_STARTED = "SubscriptionStarted"
+SUBSCRIPTION_FAILURE = "SubscriptionFailure"
+SUBSCRIPTION_TERMINATED = "SubscriptionTerminated"
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+class SubscriptionTracker(object):
+    """The states of a set of subscriptions, indexed by correlation id.
+
+    A subscription is tracked from the first call to :meth:`track()` or the
+    first message carrying its correlation id, until :meth:`remove()` is
+    called for it.  Its state is one of :attr:`PENDING`, :attr:`STARTED`,
+    :attr:`FAILED` and :attr:`TERMINATED`.
+
+    Times are measured with a monotonic clock, in seconds, and are only
+    meaningful relative to each other and to :meth:`now()`.
+
+    All the methods of this class are thread safe.
+    """
+
+    PENDING = 0
+    """Subscription requested, no status received yet"""
+    STARTED = 1
+    """``SubscriptionStarted`` received"""
+    FAILED = 2
+    """``SubscriptionFailure`` received"""
+    TERMINATED = 3
+    """``SubscriptionTerminated`` received"""
+
+    _STATES = {
+        SUBSCRIPTION_STARTED: STARTED,
+        SUBSCRIPTION_FAILURE: FAILED,
+        SUBSCRIPTION_TERMINATED: TERMINATED,
+    }
+
+    def __init__(self):
+        """Create a :class:`SubscriptionTracker` tracking no
+        subscriptions."""
+        self.__lock = threading.Lock()
+        self.__slots = {}
+        self.__correlationIds = []
+        self.__free = []
+        self.__states = array.array('b')
+        self.__lastUpdates = array.array('d')
+        self.__updateCounts = array.array('L')
+        self.__reasons = {}
+        self.__topics = {}
+        self.__counts = [0] * 4
+        self.__byLastUpdate = collections.OrderedDict()
+
+    @staticmethod
+    def now():
+        """Return the current time of the clock used by this class."""
+        return _clock()
+
+    def track(self, correlationId, topic=None):
+        """Start tracking the subscription identified by the specified
+        ``correlationId``, as :attr:`PENDING`.
+
+        Args:
+            correlationId (CorrelationId): Correlation id of the subscription
+            topic (str): Topic of the subscription, reported by
+                :meth:`topic()`
+
+        Tracking a subscription which is already tracked resets it.
+        """
+        now = _clock()
+        with self.__lock:
+            self.__remove(correlationId)
+            self.__slot(correlationId, now)
+            if topic is not None:
+                self.__topics[correlationId] = topic
+
+    def processEvent(self, event):
+        """Update the tracked subscriptions from the specified ``event``.
+
+        Args:
+            event (Event): Event received by the session
+
+        Events other than :attr:`~Event.SUBSCRIPTION_STATUS` and
+        :attr:`~Event.SUBSCRIPTION_DATA` are ignored.  Status messages change
+        the state of the subscriptions, data messages increment their update
+        count; both set their last update time.
+        """
+        eventType = event.eventType()
+        if eventType == Event.SUBSCRIPTION_DATA:
+            now = _clock()
+            with self.__lock:
+                for msg in event:
+                    for correlationId in msg.correlationIds():
+                        slot = self.__slot(correlationId, now)
+                        self.__updateCounts[slot] += 1
+        elif eventType == Event.SUBSCRIPTION_STATUS:
+            now = _clock()
+            for msg in event:
+                state = self._STATES.get(str(msg.messageType()))
+                reason = None
+                if state in (self.FAILED, self.TERMINATED) \
+                        and msg.hasElement(REASON):
+                    reason = msg.getElement(REASON)
+                    reason = reason.getElementAsString(DESCRIPTION) \
+                        if reason.hasElement(DESCRIPTION) else str(reason)
+                with self.__lock:
+                    for correlationId in msg.correlationIds():
+                        slot = self.__slot(correlationId, now)
+                        if state is not None:
+                            self.__setState(slot, state)
+                        if reason is not None:
+                            self.__reasons[correlationId] = reason
+                        elif state == self.STARTED:
+                            self.__reasons.pop(correlationId, None)
+
+    def remove(self, correlationId):
+        """Stop tracking the subscription identified by the specified
+        ``correlationId``.
+
+        Returns:
+            bool: ``True`` if the subscription was tracked.
+        """
+        with self.__lock:
+            return self.__remove(correlationId)
+
+    def state(self, correlationId):
+        """
+        Returns:
+            int: The state of the subscription identified by
+            ``correlationId``, or ``None`` if it is not tracked.
+        """
+        with self.__lock:
+            slot = self.__slots.get(correlationId)
+            return None if slot is None else self.__states[slot]
+
+    def lastUpdateTime(self, correlationId):
+        """
+        Returns:
+            float: The time of the last message of the subscription
+            identified by ``correlationId``, or of the start of its tracking,
+            or ``None`` if it is not tracked.
+        """
+        with self.__lock:
+            slot = self.__slots.get(correlationId)
+            return None if slot is None else self.__lastUpdates[slot]
+
+    def updateCount(self, correlationId):
+        """
+        Returns:
+            int: The number of data messages received for the subscription
+            identified by ``correlationId``, or ``None`` if it is not
+            tracked.
+        """
+        with self.__lock:
+            slot = self.__slots.get(correlationId)
+            return None if slot is None else self.__updateCounts[slot]
+
+    def failureReason(self, correlationId):
+        """
+        Returns:
+            str: The description of the reason of the last failure or
+            termination of the subscription identified by ``correlationId``,
+            or ``None``.
+        """
+        with self.__lock:
+            return self.__reasons.get(correlationId)
+
+    def topic(self, correlationId):
+        """
+        Returns:
+            str: The topic passed to :meth:`track()` for the subscription
+            identified by ``correlationId``, or ``None``.
+        """
+        with self.__lock:
+            return self.__topics.get(correlationId)
+
+    def counts(self):
+        """
+        Returns:
+            dict: The number of tracked subscriptions in each state, keyed
+            by state.
+        """
+        with self.__lock:
+            return dict(enumerate(self.__counts))
+
+    def inState(self, state):
+        """
+        Returns:
+            [CorrelationId]: The correlation ids of the subscriptions in the
+            specified ``state``.
+        """
+        with self.__lock:
+            states = self.__states
+            return [correlationId
+                    for correlationId, slot in self.__slots.items()
+                    if states[slot] == state]
+
+    def stale(self, maxAge, states=(STARTED,), now=None):
+        """
+        Args:
+            maxAge (float): Number of seconds
+            states ([int]): States of the subscriptions to consider
+            now (float): Current time, as returned by :meth:`now()`, or
+                ``None`` to read the clock
+
+        Returns:
+            [CorrelationId]: The correlation ids of the subscriptions in one
+            of the specified ``states`` whose last message is older than
+            ``maxAge`` seconds, oldest first.
+
+        Only the subscriptions older than ``maxAge`` are visited.
+        """
+        cutoff = (_clock() if now is None else now) - maxAge
+        with self.__lock:
+            lastUpdates = self.__lastUpdates
+            subscriptionStates = self.__states
+            correlationIds = self.__correlationIds
+            result = []
+            for slot in self.__byLastUpdate:
+                if lastUpdates[slot] >= cutoff:
+                    break
+                if subscriptionStates[slot] in states:
+                    result.append(correlationIds[slot])
+            return result
+
+    def __len__(self):
+        """Return the number of tracked subscriptions."""
+        with self.__lock:
+            return len(self.__slots)
+
+    def __contains__(self, correlationId):
+        """Return ``True`` if the subscription identified by the specified
+        ``correlationId`` is tracked."""
+        with self.__lock:
+            return correlationId in self.__slots
+
+    def __slot(self, correlationId, now):
+        """Return the slot of the specified 'correlationId', allocating a
+        'PENDING' one if it is not tracked, and set its last update time to
+        the specified 'now'."""
+        slot = self.__slots.get(correlationId)
+        if slot is None:
+            if self.__free:
+                slot = self.__free.pop()
+                self.__correlationIds[slot] = correlationId
+                self.__states[slot] = self.PENDING
+                self.__updateCounts[slot] = 0
+            else:
+                slot = len(self.__correlationIds)
+                self.__correlationIds.append(correlationId)
+                self.__states.append(self.PENDING)
+                self.__lastUpdates.append(now)
+                self.__updateCounts.append(0)
+            self.__slots[correlationId] = slot
+            self.__counts[self.PENDING] += 1
+        else:
+            del self.__byLastUpdate[slot]
+        self.__lastUpdates[slot] = now
+        self.__byLastUpdate[slot] = None
+        return slot
+
+    def __setState(self, slot, state):
+        """Set the state of the specified 'slot' to the specified 'state'."""
+        self.__counts[self.__states[slot]] -= 1
+        self.__counts[state] += 1
+        self.__states[slot] = state
+
+    def __remove(self, correlationId):
+        """Release the slot of the specified 'correlationId' and return
+        'True' if it was tracked."""
+        slot = self.__slots.pop(correlationId, None)
+        if slot is None:
+            return False
+        self.__counts[self.__states[slot]] -= 1
+        del self.__byLastUpdate[slot]
+        self.__correlationIds[slot] = None
+        self.__reasons.pop(correlationId, None)
+        self.__topics.pop(correlationId, None)
+        self.__free.append(slot)
+        return True
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -6,8 +6,9 @@ This module doesn't ment to be used directly."""
 
 import sqlite3
 from collections import defaultdict
-from threading import Lock
+from threading import Lock, current_thread, local
 import inspect
+import time
 import blpapi.internals as internals
 
 
@@ -249,6 +250,157 @@ def getCodeCoverage():
         "blpapipy": blpapipy_coverage.getTotalCoverage(),
     }
 
+_clock = getattr(time, "perf_counter", time.time)
+
+class CallProfiler(object):
+    """Aggregate the number of calls, cumulative time and self time of every
+    function wrapped by 'wrap', which has the signature expected by
+    'hackInternalsModule'.  The self time of a call excludes the time spent
+    in the wrapped functions it calls, so that the self time of a
+    'blpapi_*' function is the cost of the SWIG crossing and of the library,
+    and the self time of a method of a 'blpapi' class is the Python
+    overhead around them.  Each thread accumulates its calls in thread-local
+    counters, merged into the totals under a lock every 'flushEvery' calls,
+    so that no call takes a lock or performs I/O in the common case.  The
+    counters of the threads which have exited are merged, and released, by
+    the next 'flush' or 'report'."""
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, flushEvery=4096):
+        self.__flushEvery = flushEvery
+        self.__lock = Lock()
+        self.__totals = {}
+        # '(thread, stats)' of each thread which has recorded a call
+        self.__threadStats = []
+        self.__local = local()
+
+    def wrap(self, method_name, test_name, obj, clsname=None):
+        """Return a function calling 'obj' and recording the call; the
+        specified 'test_name' is ignored."""
+        # pylint: disable=unused-argument
+        name = method_name if clsname is None \
+            else "{0}.{1}".format(clsname, method_name)
+        threadState = self.__threadState
+        flushEvery = self.__flushEvery
+
+        def newcall(*args, **kwargs):
+            state = threadState()
+            stack = state[1]
+            stack.append(0.0)
+            start = _clock()
+            try:
+                return obj(*args, **kwargs)
+            finally:
+                elapsed = _clock() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                stats = state[0]
+                entry = stats.get(name)
+                if entry is None:
+                    entry = stats[name] = [0, 0.0, 0.0]
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] += elapsed - children
+                state[2] += 1
+                if state[2] >= flushEvery and not stack:
+                    self.flush()
+        return newcall
+
+    def flush(self):
+        """Merge the counters of the calling thread into the totals."""
+        state = self.__threadState()
+        stats = state[0]
+        with self.__lock:
+            self.__merge(self.__totals, stats)
+            stats.clear()
+            self.__collectExitedThreads()
+        state[2] = 0
+
+    def report(self, top=None, sortBy="self"):
+        """Return a list of '(name, calls, cumulative, self)' tuples, times
+        in seconds, of the 'top' functions, or of all functions if 'top' is
+        'None', by decreasing 'sortBy', which is one of 'self', 'cumulative'
+        and 'calls'.  The counters of the other threads not flushed yet are
+        included."""
+        index = {"calls": 1, "cumulative": 2, "self": 3}[sortBy]
+        with self.__lock:
+            self.__collectExitedThreads()
+            totals = dict((name, list(entry))
+                          for name, entry in self.__totals.items())
+            for _, stats in self.__threadStats:
+                self.__merge(totals, stats.copy())
+        rows = sorted(((name,) + tuple(entry)
+                       for name, entry in totals.items()),
+                      key=lambda row: row[index], reverse=True)
+        return rows if top is None else rows[:top]
+
+    def formatReport(self, top=20, sortBy="self"):
+        """Return the 'report' of the specified 'top' functions as a table,
+        with times in milliseconds."""
+        lines = ["{0:>10} {1:>12} {2:>12} {3:>9}  {4}".format(
+            "calls", "cumul (ms)", "self (ms)", "self/call", "function")]
+        for name, calls, cumulative, selfTime in self.report(top, sortBy):
+            lines.append(
+                "{0:>10} {1:>12.3f} {2:>12.3f} {3:>7.2f}us  {4}".format(
+                    calls, cumulative * 1e3, selfTime * 1e3,
+                    selfTime * 1e6 / calls if calls else 0.0, name))
+        return "\n".join(lines)
+
+    def reset(self):
+        """Discard all the counters.  This is best-effort while other threads
+        make wrapped calls: their counters are cleared without stopping
+        them, so a call completing concurrently, or in progress, may still
+        be counted after 'reset' returns."""
+        with self.__lock:
+            self.__totals.clear()
+            for _, stats in self.__threadStats:
+                stats.clear()
+
+    def __threadState(self):
+        """Return the '[stats, stack, pending]' state of the calling
+        thread."""
+        try:
+            return self.__local.state
+        except AttributeError:
+            state = self.__local.state = [{}, [], 0]
+            with self.__lock:
+                self.__threadStats.append((current_thread(), state[0]))
+            return state
+
+    def __collectExitedThreads(self):
+        """Merge the counters of the threads which have exited into the
+        totals and stop tracking them.  The lock must be held."""
+        alive = []
+        for thread, stats in self.__threadStats:
+            if thread.is_alive():
+                alive.append((thread, stats))
+            else:
+                self.__merge(self.__totals, stats)
+        self.__threadStats = alive
+
+    @staticmethod
+    def __merge(totals, stats):
+        """Add the specified 'stats' to the specified 'totals'."""
+        for name, (calls, cumulative, selfTime) in stats.items():
+            entry = totals.get(name)
+            if entry is None:
+                totals[name] = [calls, cumulative, selfTime]
+            else:
+                entry[0] += calls
+                entry[1] += cumulative
+                entry[2] += selfTime
+
+def profileInternalsModule(profiler=None):
+    """Wrap all API calls and blpapi class methods, like
+    'hackInternalsModule', to record them in the specified 'profiler', or in
+    a new 'CallProfiler' if 'profiler' is 'None', and return it."""
+    if profiler is None:
+        profiler = CallProfiler()
+    hackInternalsModule("profile", wrap=profiler.wrap)
+    return profiler
+
 # Init everything on module load
 print("Initializing testtools, database name %s" % __DBNAME)
 init()
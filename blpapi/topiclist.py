@@ -5,9 +5,11 @@
 This component implements a list of topics which require topic creation.
 """
 
+import array
+
 from .exception import _ExceptionUtil
 from .message import Message
-from .resolutionlist import ResolutionList
+from .resolutionlist import ResolutionList, _addTopics, _column
 from . import internals
 from . import utils
 from .utils import get_handle
@@ -107,6 +109,55 @@ class TopicList(object):
             topicOrMessage,
             get_handle(correlationId))
 
+    @classmethod
+    def fromTopics(cls, topics, correlationIds=None):
+        """Create a :class:`TopicList` holding the specified ``topics``.
+
+        Args:
+            topics ([str or Message]): Topics, or messages holding the topics,
+                to add
+            correlationIds ([CorrelationId]): CorrelationIds to associate
+                with ``topics``, or ``None``
+
+        Returns:
+            TopicList: A new list, as populated by :meth:`addMany()`.
+        """
+        topicList = cls()
+        topicList.addMany(topics, correlationIds)
+        return topicList
+
+    def addMany(self, topics, correlationIds=None):
+        """Add each of the specified ``topics`` to this list.
+
+        Args:
+            topics ([str or Message]): Topics, or messages holding the topics,
+                to add
+            correlationIds ([CorrelationId]): CorrelationIds to associate
+                with ``topics``, in the same order, or ``None``
+
+        Returns:
+            int: The number of topics added.
+
+        Raises:
+            TypeError: If an element of ``correlationIds`` is not an instance
+                of :class:`CorrelationId`.
+            ValueError: If ``correlationIds`` and ``topics`` do not have the
+                same length.
+            Exception: If a topic cannot be added.
+
+        Equivalent to calling :meth:`add()` for each topic and checking the
+        result, without a method call per topic.  ``correlationIds`` are all
+        checked before the first topic is added, so a ``TypeError`` or
+        ``ValueError`` leaves this list unchanged; a topic which cannot be
+        added leaves the topics before it in this list.  After a successful
+        call the status of each added entry is ``NOT_CREATED``.
+        """
+        return _addTopics(self.__handle,
+                          topics,
+                          correlationIds,
+                          internals.blpapi_TopicList_add,
+                          internals.blpapi_TopicList_addFromMessage)
+
     def correlationIdAt(self, index):
         """
         Args:
@@ -246,6 +297,35 @@ class TopicList(object):
         _ExceptionUtil.raiseOnError(errorCode)
         return Message(message, sessions=self.__sessions)
 
+    def correlationIds(self):
+        """
+        Returns:
+            [CorrelationId]: Correlation ids of all the entries, in order.
+        """
+        return _column(self.__handle,
+                       internals.blpapi_TopicList_size,
+                       internals.blpapi_TopicList_correlationIdAt)
+
+    def topicStrings(self):
+        """
+        Returns:
+            [str]: Full topic strings of all the entries, in order.
+        """
+        return _column(self.__handle,
+                       internals.blpapi_TopicList_size,
+                       internals.blpapi_TopicList_topicStringAt)
+
+    def statuses(self):
+        """
+        Returns:
+            array.array: Statuses of all the entries, in order, as an
+            ``array.array`` of ``int`` (see :meth:`statusAt()`).
+        """
+        statuses = _column(self.__handle,
+                           internals.blpapi_TopicList_size,
+                           internals.blpapi_TopicList_statusAt)
+        return array.array('i', statuses)
+
     def size(self):
         """Return the number of entries in this :class:`TopicList`."""
         return internals.blpapi_TopicList_size(self.__handle)
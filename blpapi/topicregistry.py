@@ -0,0 +1,328 @@
+# topicregistry.py
+
+"""Provide a provider side cache of created topics.
+
+This file defines a class 'TopicRegistry' which keeps the 'Topic' objects
+created by a 'ProviderSession', keyed by topic string and by correlation id,
+and which coalesces the topic creations triggered by bursts of
+'TopicSubscribed' messages into batched 'createTopicsAsync' calls.
+
+Usage
+-----
+The following snippet shows how a publisher hands its 'TOPIC_STATUS' events
+to a 'TopicRegistry' and looks up the topics to publish on.
+
+    registry = blpapi.TopicRegistry(session, window=0.05)
+
+    def processEvent(event, session):
+        if event.eventType() == blpapi.Event.TOPIC_STATUS:
+            registry.processEvent(event)
+
+    ...
+    topic = registry.topic("//blp/mktdata/IBM US Equity")
+    if topic is not None:
+        eventFormatter.appendMessage("MarketData", topic)
+
+Every 'TopicSubscribed' message for a topic which is neither created nor
+being created adds the topic to a pending 'TopicList', which is passed to
+'createTopicsAsync' once 'window' seconds have elapsed since the first topic
+was added to it, or as soon as it holds 'maxBatchSize' topics.  'TopicCreated'
+messages, whichever call created the topic, populate the cache without
+further lookups; 'TopicDeleted' messages evict from it.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from .event import Event
+from .providersession import ProviderSession
+from .topiclist import TopicList
+
+# pylint: disable=useless-object-inheritance,too-many-arguments
+# pylint: disable=too-many-instance-attributes
+
+TOPIC = "topic"
+TOPIC_SUBSCRIBED = "TopicSubscribed"
+TOPIC_CREATED = "TopicCreated"
+TOPIC_CREATE_FAILED = "TopicCreateFailed"
+TOPIC_DELETED = "TopicDeleted"
+
+
+class TopicRegistry(object):
+    """A cache of the topics created by a :class:`ProviderSession`.
+
+    Topics are cached by topic string and by each correlation id they were
+    created with, so that publishing on a topic does not require a
+    :meth:`~ProviderSession.getTopic()` call per message.  Topic creations
+    requested by ``TopicSubscribed`` messages are batched into a single
+    :meth:`~ProviderSession.createTopicsAsync()` call per ``window``.
+
+    All the methods of this class are thread safe.
+    """
+
+    def __init__(self,
+                 session,
+                 window=0.01,
+                 maxBatchSize=1000,
+                 resolveMode=ProviderSession.DONT_REGISTER_SERVICES,
+                 identity=None):
+        """Create a :class:`TopicRegistry` for the specified ``session``.
+
+        Args:
+            session (ProviderSession): Session creating the topics
+            window (float): Number of seconds to wait, after the first topic
+                creation is requested, for further requests to batch with it.
+                If ``0``, the topics are created at the end of each call to
+                :meth:`processEvent()`.
+            maxBatchSize (int): Number of pending topics which causes the
+                topics to be created without waiting for ``window`` to
+                elapse
+            resolveMode (int): Mode passed to
+                :meth:`~ProviderSession.createTopicsAsync()`
+            identity (Identity): Identity passed to
+                :meth:`~ProviderSession.createTopicsAsync()`
+
+        Raises:
+            ValueError: If ``window`` is negative or ``maxBatchSize`` is not
+                positive.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if maxBatchSize < 1:
+            raise ValueError("maxBatchSize must be positive")
+        self.__session = session
+        self.__window = window
+        self.__maxBatchSize = maxBatchSize
+        self.__resolveMode = resolveMode
+        self.__identity = identity
+        self.__lock = threading.Lock()
+        self.__topics = {}
+        self.__topicsByCorrelationId = {}
+        self.__correlationIdsByTopic = {}
+        self.__requested = set()
+        self.__pending = None
+        self.__pendingCount = 0
+        self.__timer = None
+
+    def processEvent(self, event):
+        """Update this registry from the specified ``event``.
+
+        Args:
+            event (Event): Event received by the session
+
+        Events other than :attr:`~Event.TOPIC_STATUS` are ignored.
+        ``TopicSubscribed`` messages for unknown topics request their
+        creation, ``TopicCreated`` messages add the created topic to the
+        cache, ``TopicCreateFailed`` messages allow the creation to be
+        requested again and ``TopicDeleted`` messages remove the topic from
+        the cache.
+        """
+        if event.eventType() != Event.TOPIC_STATUS:
+            return
+        flush = False
+        for msg in event:
+            messageType = msg.messageType()
+            if messageType == TOPIC_SUBSCRIBED:
+                flush = self.__request(msg.getElementAsString(TOPIC), msg) \
+                    or flush
+            elif messageType == TOPIC_CREATED:
+                self.__created(msg)
+            elif messageType == TOPIC_CREATE_FAILED:
+                with self.__lock:
+                    self.__requested.discard(msg.getElementAsString(TOPIC))
+            elif messageType == TOPIC_DELETED:
+                self.__deleted(msg.getElementAsString(TOPIC))
+        if flush or self.__window == 0:
+            self.flush()
+
+    def requestTopics(self, topics):
+        """Request the creation of the specified ``topics``.
+
+        Args:
+            topics ([str]): Topic strings of the topics to create
+
+        Topics which are already created, or being created, are skipped. The
+        others are created with the next batch.
+        """
+        flush = False
+        for topic in topics:
+            flush = self.__request(topic, topic) or flush
+        if flush or self.__window == 0:
+            self.flush()
+
+    def flush(self):
+        """Create the pending topics now.
+
+        Returns:
+            int: The number of topics passed to
+            :meth:`~ProviderSession.createTopicsAsync()`.
+
+        If :meth:`~ProviderSession.createTopicsAsync()` fails, the creation
+        of the pending topics can be requested again and the exception is
+        propagated.
+        """
+        with self.__lock:
+            topicList, count = self.__pending, self.__pendingCount
+            self.__pending = None
+            self.__pendingCount = 0
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+        if topicList is None:
+            return 0
+        try:
+            self.__session.createTopicsAsync(topicList,
+                                             self.__resolveMode,
+                                             self.__identity)
+        except Exception:
+            with self.__lock:
+                self.__requested.difference_update(topicList.topicStrings())
+            raise
+        return count
+
+    def topic(self, topicOrMessage):
+        """
+        Args:
+            topicOrMessage (str or Message): Topic string, or
+                ``TOPIC_STATUS`` message, of the topic to look up
+
+        Returns:
+            Topic: The created topic, or ``None`` if it is not in this
+            registry.
+
+        A message whose topic is not in this registry is looked up with
+        :meth:`~ProviderSession.getTopic()`, and the topic is added to the
+        registry if it is valid.
+        """
+        if not hasattr(topicOrMessage, "messageType"):
+            with self.__lock:
+                return self.__topics.get(topicOrMessage)
+        topicString = topicOrMessage.getElementAsString(TOPIC)
+        with self.__lock:
+            topic = self.__topics.get(topicString)
+        if topic is None:
+            topic = self.__session.getTopic(topicOrMessage)
+            if not topic.isValid():
+                return None
+            with self.__lock:
+                topic = self.__topics.setdefault(topicString, topic)
+        return topic
+
+    def topicByCorrelationId(self, correlationId):
+        """
+        Args:
+            correlationId (CorrelationId): Correlation id the topic was
+                created with
+
+        Returns:
+            Topic: The created topic, or ``None`` if no topic in this
+            registry was created with ``correlationId``.
+        """
+        with self.__lock:
+            return self.__topicsByCorrelationId.get(correlationId)
+
+    def remove(self, topicString):
+        """Remove the topic with the specified ``topicString`` from this
+        registry, without deleting the topic.
+
+        Args:
+            topicString (str): Topic string of the topic to remove
+
+        Returns:
+            bool: ``True`` if the topic was in this registry.
+        """
+        return self.__deleted(topicString)
+
+    def close(self):
+        """Cancel the creation of the pending topics."""
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if self.__pending is not None:
+                self.__requested.difference_update(
+                    self.__pending.topicStrings())
+            self.__pending = None
+            self.__pendingCount = 0
+
+    def __len__(self):
+        """Return the number of topics in this registry."""
+        with self.__lock:
+            return len(self.__topics)
+
+    def __contains__(self, topicString):
+        """Return ``True`` if the topic with the specified ``topicString`` is
+        in this registry."""
+        with self.__lock:
+            return topicString in self.__topics
+
+    def __request(self, topicString, topicOrMessage):
+        """Add the topic with the specified 'topicString' to the pending
+        batch, unless it is created or being created. Return 'True' if the
+        batch is full."""
+        with self.__lock:
+            if topicString in self.__topics \
+                    or topicString in self.__requested:
+                return False
+            if self.__pending is None:
+                self.__pending = TopicList()
+                if self.__window > 0:
+                    self.__timer = threading.Timer(self.__window,
+                                                   self.__expire)
+                    self.__timer.daemon = True
+                    self.__timer.start()
+            self.__pending.add(topicOrMessage)
+            self.__pendingCount += 1
+            self.__requested.add(topicString)
+            return self.__pendingCount >= self.__maxBatchSize
+
+    def __expire(self):
+        """Create the pending topics once the batching window has elapsed.
+        Failures are reported by the timer thread."""
+        self.flush()
+
+    def __created(self, message):
+        """Add the topic created by the specified 'message' to the cache."""
+        topicString = message.getElementAsString(TOPIC)
+        topic = self.__session.getTopic(message)
+        correlationIds = message.correlationIds()
+        with self.__lock:
+            self.__requested.discard(topicString)
+            self.__topics[topicString] = topic
+            known = self.__correlationIdsByTopic.setdefault(topicString, [])
+            for correlationId in correlationIds:
+                self.__topicsByCorrelationId[correlationId] = topic
+                known.append(correlationId)
+
+    def __deleted(self, topicString):
+        """Remove the topic with the specified 'topicString' from the cache
+        and return 'True' if it was there."""
+        with self.__lock:
+            self.__requested.discard(topicString)
+            for correlationId in self.__correlationIdsByTopic.pop(topicString,
+                                                                  ()):
+                self.__topicsByCorrelationId.pop(correlationId, None)
+            return self.__topics.pop(topicString, None) is not None
+
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -181,12 +181,19 @@ else:
 blpapiLibraryPath = blpapiLibVar or blpapiLibraryPath
 blpapiIncludes = blpapiIncludesVar or os.path.join(blpapiRoot, 'include')
 
+# Release the GIL around the calls which cannot block too, as in earlier
+# releases, to compare both policies with benchmarks/bench_gil.py.
+defineMacros = []
+if os.environ.get('BLPAPI_RELEASE_GIL_IN_ACCESSORS'):
+    defineMacros.append(('BLPAPI_RELEASE_GIL_IN_ACCESSORS', None))
+
 blpapi_wrap = Extension(
     'blpapi._internals',
     sources=['blpapi/internals_wrap.c'],
     include_dirs=[blpapiIncludes],
     library_dirs=[blpapiLibraryPath],
     libraries=[blpapiLibraryName],
+    define_macros=defineMacros,
     extra_link_args=extraLinkArgs
 )
 
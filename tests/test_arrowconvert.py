@@ -0,0 +1,350 @@
+# test_arrowconvert.py
+
+"""Test the conversion of responses to Arrow record batches and tables with
+fake elements."""
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import blpapi
+    from blpapi import DataType, Event
+    # pylint: disable=protected-access
+    from blpapi.arrowconvert import _Column, elementToRecordBatch
+except ImportError:
+    blpapi = None
+
+_COMPLEX_TYPES = () if blpapi is None else (DataType.SEQUENCE,
+                                            DataType.CHOICE)
+
+
+class _TypeDefinition(object):
+    def __init__(self, datatype, elementDefinitions=()):
+        self.__datatype = datatype
+        self.__elementDefinitions = elementDefinitions
+
+    def datatype(self):
+        return self.__datatype
+
+    def isComplexType(self):
+        return self.__datatype in _COMPLEX_TYPES
+
+    def elementDefinitions(self):
+        return iter(self.__elementDefinitions)
+
+
+class _ElementDefinition(object):
+    def __init__(self, name, typeDefinition, maxValues=1):
+        self.__name = name
+        self.__typeDefinition = typeDefinition
+        self.__maxValues = maxValues
+
+    def name(self):
+        return self.__name
+
+    def typeDefinition(self):
+        return self.__typeDefinition
+
+    def maxValues(self):
+        return self.__maxValues
+
+
+class _Element(object):
+    """An element with either a simple 'value', 'None' for a null value,
+    'children' for a sequence, or 'values' for an array of sequences."""
+
+    def __init__(self, name, datatype, value=None, children=(), values=None,
+                 definition=None):
+        # pylint: disable=too-many-arguments
+        self.__name = name
+        self.__datatype = datatype
+        self.__value = value
+        self.__children = list(children)
+        self.__values = values
+        self.__definition = definition
+
+    def name(self):
+        return self.__name
+
+    def datatype(self):
+        return self.__datatype
+
+    def isArray(self):
+        return self.__values is not None
+
+    def isNull(self):
+        return self.__value is None and not self.__children \
+            and self.__values is None
+
+    def numValues(self):
+        return len(self.__values)
+
+    def getValueAsElement(self, index):
+        return self.__values[index]
+
+    def elements(self):
+        return iter(self.__children)
+
+    def hasElement(self, name, excludeNullElements=False):
+        # pylint: disable=unused-argument
+        return any(child.name() == name for child in self.__children)
+
+    def getElement(self, name):
+        for child in self.__children:
+            if child.name() == name:
+                return child
+        raise blpapi.NotFoundException(name, 0)
+
+    def elementDefinition(self):
+        return self.__definition
+
+    def getValueAsFloat(self):
+        return float(self.__value)
+
+    def getValueAsInteger(self):
+        return int(self.__value)
+
+    def getValueAsString(self):
+        return str(self.__value)
+
+    def getValueAsBool(self):
+        return bool(self.__value)
+
+    def getValueAsDatetime(self):
+        return self.__value
+
+
+class _Message(object):
+    def __init__(self, element):
+        self.__element = element
+
+    def asElement(self):
+        return self.__element
+
+
+class _Event(object):
+    def __init__(self, eventType, messages):
+        self.__eventType = eventType
+        self.__messages = messages
+
+    def eventType(self):
+        return self.__eventType
+
+    def __iter__(self):
+        return iter(self.__messages)
+
+
+def _rows(name, rows, elementDefinitions):
+    """Return an array element of the specified 'name' holding one sequence
+    per dict of the specified 'rows', whose values are '(datatype, value)'
+    pairs, described by the specified 'elementDefinitions'."""
+    definition = _ElementDefinition(
+        name,
+        _TypeDefinition(DataType.SEQUENCE, elementDefinitions),
+        -1)
+    return _Element(
+        name,
+        DataType.SEQUENCE,
+        values=[_Element(name,
+                         DataType.SEQUENCE,
+                         children=[_Element(field, datatype, value)
+                                   for field, (datatype, value)
+                                   in sorted(row.items())])
+                for row in rows],
+        definition=definition)
+
+
+def _barResponse(bars):
+    """Return an 'IntradayBarResponse' holding the specified 'bars'."""
+    definitions = [
+        _ElementDefinition("time", _TypeDefinition(DataType.DATETIME)),
+        _ElementDefinition("open", _TypeDefinition(DataType.FLOAT64)),
+    ]
+    return _Element(
+        "IntradayBarResponse",
+        DataType.SEQUENCE,
+        children=[_Element("barData",
+                           DataType.SEQUENCE,
+                           children=[_rows("barTickData",
+                                           bars,
+                                           definitions)])])
+
+
+def _bar(minute, **fields):
+    """Return a bar starting at the specified 'minute', with the specified
+    '(datatype, value)' 'fields'."""
+    bar = {"time": (DataType.DATETIME,
+                    datetime.datetime(2019, 8, 11, 13, minute)),
+           "open": (DataType.FLOAT64, 100.0 + minute)}
+    bar.update(fields)
+    return bar
+
+
+@unittest.skipIf(blpapi is None or pyarrow is None,
+                 "the blpapi extension or pyarrow is not available")
+class TestColumn(unittest.TestCase):
+
+    def test_finish_with_nulls(self):
+        column = _Column("open", pyarrow.float64())
+        column.append(1, _Element("open", DataType.FLOAT64, 1.5))
+        column.append(3, _Element("open", DataType.FLOAT64, 3.5))
+        result = column.finish(5)
+        self.assertEqual(result.null_count, 3)
+        self.assertEqual(result.to_pylist(), [None, 1.5, None, 3.5, None])
+
+    def test_finish_with_nulls_across_bytes(self):
+        column = _Column("volume", pyarrow.int64())
+        for row in (1, 8, 9, 15, 16):
+            column.append(row, _Element("volume", DataType.INT64, row))
+        result = column.finish(18)
+        result.validate(full=True)
+        self.assertEqual(result.to_pylist(),
+                         [row if row in (1, 8, 9, 15, 16) else None
+                          for row in range(18)])
+
+    def test_finish_without_nulls(self):
+        column = _Column("numEvents", pyarrow.int32())
+        for row in range(3):
+            column.append(row, _Element("numEvents", DataType.INT32, row))
+        result = column.finish(3)
+        self.assertEqual(result.null_count, 0)
+        self.assertEqual(result.to_pylist(), [0, 1, 2])
+
+    def test_finish_string_with_nulls(self):
+        column = _Column("name", pyarrow.string())
+        column.append(1, _Element("name", DataType.STRING, "IBM"))
+        self.assertEqual(column.finish(3).to_pylist(), [None, "IBM", None])
+
+
+@unittest.skipIf(blpapi is None or pyarrow is None,
+                 "the blpapi extension or pyarrow is not available")
+class TestElementToRecordBatch(unittest.TestCase):
+
+    def test_bars(self):
+        batch = elementToRecordBatch(_barResponse([
+            _bar(30, volume=(DataType.INT64, 10)),
+            _bar(31),
+            _bar(32, volume=(DataType.INT64, 30)),
+        ]))
+        self.assertEqual(batch.schema.names, ["time", "open", "volume"])
+        self.assertEqual(batch.column(1).to_pylist(), [130.0, 131.0, 132.0])
+        self.assertEqual(batch.column(2).to_pylist(), [10, None, 30])
+        self.assertEqual(batch.column(0)[0].as_py().replace(tzinfo=None),
+                         datetime.datetime(2019, 8, 11, 13, 30))
+
+    def test_historical_data_key_columns(self):
+        definitions = [
+            _ElementDefinition("date", _TypeDefinition(DataType.DATE)),
+        ]
+        rows = [
+            {"date": (DataType.DATE, datetime.date(2020, 1, 2)),
+             "PX_LAST": (DataType.FLOAT64, 1.5)},
+            {"date": (DataType.DATE, datetime.date(2020, 1, 3))},
+        ]
+        response = _Element(
+            "HistoricalDataResponse",
+            DataType.SEQUENCE,
+            children=[_Element(
+                "securityData",
+                DataType.SEQUENCE,
+                children=[
+                    _Element("security", DataType.STRING, "IBM US Equity"),
+                    _rows("fieldData", rows, definitions),
+                ])])
+        batch = elementToRecordBatch(response)
+        self.assertEqual(batch.schema.names, ["security", "date", "PX_LAST"])
+        self.assertEqual(batch.to_pydict(), {
+            "security": ["IBM US Equity", "IBM US Equity"],
+            "date": [datetime.date(2020, 1, 2), datetime.date(2020, 1, 3)],
+            "PX_LAST": [1.5, None],
+        })
+
+    def test_schema_hint(self):
+        schema = pyarrow.schema([("open", pyarrow.float32()),
+                                 ("missing", pyarrow.string())])
+        batch = elementToRecordBatch(_barResponse([_bar(30)]), schema)
+        self.assertTrue(batch.schema.equals(schema))
+        self.assertEqual(batch.to_pydict(),
+                         {"open": [130.0], "missing": [None]})
+
+
+@unittest.skipIf(blpapi is None or pyarrow is None,
+                 "the blpapi extension or pyarrow is not available")
+class TestArrowTableBuilder(unittest.TestCase):
+
+    def test_mismatched_schemas(self):
+        builder = blpapi.ArrowTableBuilder()
+        # The first message has no 'extra' column and an integer 'volume',
+        # the second one an 'extra' column and a floating point 'volume'.
+        first = _Message(_barResponse([_bar(30, volume=(DataType.INT64,
+                                                        10))]))
+        second = _Message(_barResponse([
+            _bar(31, volume=(DataType.FLOAT64, 20.0),
+                 extra=(DataType.STRING, "x")),
+            _bar(32),
+        ]))
+        added = builder.appendEvent(_Event(Event.PARTIAL_RESPONSE, [first]))
+        added += builder.appendEvent(_Event(Event.RESPONSE, [second]))
+        self.assertEqual(added, 3)
+        self.assertEqual(builder.numRows(), 3)
+
+        table = builder.table()
+        self.assertEqual(table.schema.names,
+                         ["time", "open", "volume", "extra"])
+        self.assertTrue(table.schema.field("volume").type.equals(
+            pyarrow.int64()))
+        self.assertEqual(table.column("volume").num_chunks, 2)
+        self.assertEqual(table.column("volume").to_pylist(), [10, 20, None])
+        self.assertEqual(table.column("extra").to_pylist(),
+                         [None, "x", None])
+
+    def test_other_events_are_ignored(self):
+        builder = blpapi.ArrowTableBuilder()
+        message = _Message(_barResponse([_bar(30)]))
+        self.assertEqual(
+            builder.appendEvent(_Event(Event.SESSION_STATUS, [message])), 0)
+        self.assertEqual(builder.numRows(), 0)
+
+    def test_empty_table_has_the_schema_hint(self):
+        schema = pyarrow.schema([("open", pyarrow.float64())])
+        table = blpapi.ArrowTableBuilder(schema).table()
+        self.assertEqual(table.num_rows, 0)
+        self.assertTrue(table.schema.equals(schema))
+
+    def test_clear(self):
+        builder = blpapi.ArrowTableBuilder()
+        builder.append(_Message(_barResponse([_bar(30)])))
+        builder.clear()
+        self.assertEqual(builder.table().num_rows, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,273 @@
+# test_compiledschema.py
+
+"""Test the saving, loading and pickling of 'CompiledSchema' objects built
+from a fake service."""
+
+from __future__ import absolute_import
+
+import datetime
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+try:
+    import blpapi
+    from blpapi import DataType
+    from blpapi.datetime import FixedOffset
+    # pylint: disable=protected-access
+    from blpapi.compiledschema import _SchemaCompiler
+except ImportError:
+    blpapi = None
+
+
+class _Constant(object):
+    def __init__(self, name, value):
+        self.__name = name
+        self.__value = value
+
+    def name(self):
+        return self.__name
+
+    def getValue(self):
+        return self.__value
+
+
+class _TypeDefinition(object):
+    handles = iter(range(1, 1000))
+
+    def __init__(self, name, datatype, elements=(), enumeration=None):
+        self.__handle = next(self.handles)
+        self.__name = name
+        self.__datatype = datatype
+        self.elements = list(elements)
+        self.__enumeration = enumeration
+
+    def _handle(self):
+        return self.__handle
+
+    def name(self):
+        return self.__name
+
+    def description(self):
+        return "type " + self.__name
+
+    def status(self):
+        return 0
+
+    def datatype(self):
+        return self.__datatype
+
+    def isComplexType(self):
+        return self.__datatype in (DataType.SEQUENCE, DataType.CHOICE)
+
+    def isEnumerationType(self):
+        return self.__enumeration is not None
+
+    def elementDefinitions(self):
+        return iter(self.elements)
+
+    def enumeration(self):
+        if self.__enumeration is None:
+            return None
+        return [_Constant(name, value) for name, value in self.__enumeration]
+
+
+class _ElementDefinition(object):
+    def __init__(self, name, typeDefinition, maxValues=1,
+                 alternateNames=()):
+        self.__name = name
+        self.__typeDefinition = typeDefinition
+        self.__maxValues = maxValues
+        self.__alternateNames = alternateNames
+
+    def name(self):
+        return self.__name
+
+    def description(self):
+        return u"element \u00e9 " + self.__name
+
+    def status(self):
+        return 0
+
+    def minValues(self):
+        return 0
+
+    def maxValues(self):
+        return self.__maxValues
+
+    def alternateNames(self):
+        return self.__alternateNames
+
+    def typeDefinition(self):
+        return self.__typeDefinition
+
+
+class _Operation(object):
+    def __init__(self, name, request, responses):
+        self.__name = name
+        self.__request = request
+        self.__responses = responses
+
+    def name(self):
+        return self.__name
+
+    def description(self):
+        return "operation " + self.__name
+
+    def requestDefinition(self):
+        return self.__request
+
+    def responseDefinitions(self):
+        return iter(self.__responses)
+
+
+class _Service(object):
+    def __init__(self, operations, events):
+        self.__operations = operations
+        self.__events = events
+
+    def name(self):
+        return "//blp/test"
+
+    def description(self):
+        return "test service"
+
+    def operations(self):
+        return iter(self.__operations)
+
+    def eventDefinitions(self):
+        return iter(self.__events)
+
+
+def _service():
+    """Return a service with a shared type, a recursive type and
+    enumerations of each kind of value."""
+    security = _TypeDefinition("String", DataType.STRING)
+    side = _TypeDefinition("Side", DataType.ENUMERATION,
+                           enumeration=[("BID", 1), ("ASK", 2)])
+    dates = _TypeDefinition(
+        "Dates", DataType.ENUMERATION,
+        enumeration=[
+            ("EPOCH", datetime.date(1970, 1, 1)),
+            ("OPEN", datetime.time(9, 30, tzinfo=FixedOffset(-300))),
+            ("CLOSE", datetime.datetime(2019, 8, 11, 16, 0, 0, 5)),
+            ("NAME", "close"),
+            ("RATIO", 1.5),
+        ])
+    node = _TypeDefinition("Node", DataType.SEQUENCE)
+    node.elements = [_ElementDefinition("value", security),
+                     _ElementDefinition("children", node, -1)]
+    request = _TypeDefinition("Request", DataType.SEQUENCE, [
+        _ElementDefinition("securities", security, -1, ("tickers",)),
+        _ElementDefinition("side", side),
+        _ElementDefinition("date", dates),
+        _ElementDefinition("tree", node),
+    ])
+    response = _TypeDefinition("Response", DataType.SEQUENCE, [
+        _ElementDefinition("security", security),
+    ])
+    return _Service(
+        [_Operation("Request",
+                    _ElementDefinition("Request", request),
+                    [_ElementDefinition("Response", response)]),
+         _Operation("Ping", None, [])],
+        [_ElementDefinition("Event", response)])
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestCompiledSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "test.schema")
+        self.schema = _SchemaCompiler().compileService(_service())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertSameSchema(self, schema):
+        """Assert that the specified 'schema' is a copy of the compiled
+        schema."""
+        self.assertIsInstance(schema, blpapi.CompiledSchema)
+        self.assertEqual(schema.name(), "//blp/test")
+        self.assertEqual(schema.numOperations(), 2)
+        self.assertIsNone(schema.getOperation("Ping").requestDefinition())
+        self.assertEqual(schema.getEventDefinition("Event").name(), "Event")
+
+        request = schema.getOperation("Request").requestDefinition()
+        requestType = request.typeDefinition()
+        self.assertEqual(requestType.indexOf("tickers"), 0)
+        securities = requestType.getElementDefinition("securities")
+        self.assertEqual(securities.maxValues(), -1)
+        self.assertEqual(securities.alternateNames(), ("tickers",))
+        self.assertEqual(securities.description(),
+                         u"element \u00e9 securities")
+
+        # Shared and recursive types are single objects.
+        response = schema.getOperation("Request").getResponseDefinitionAt(0)
+        self.assertIs(
+            response.typeDefinition().getElementDefinition(0)
+            .typeDefinition(),
+            securities.typeDefinition())
+        tree = requestType.getElementDefinition("tree").typeDefinition()
+        self.assertIs(
+            tree.getElementDefinition("children").typeDefinition(), tree)
+
+        expected = self.schema.getOperation("Request").requestDefinition() \
+            .typeDefinition()
+        for name in ("side", "date"):
+            self.assertEqual(
+                requestType.getElementDefinition(name).typeDefinition()
+                .enumeration(),
+                expected.getElementDefinition(name).typeDefinition()
+                .enumeration())
+        self.assertTrue(requestType.getElementDefinition("side")
+                        .typeDefinition().isEnumerationType())
+        self.assertIsNone(tree.enumeration())
+
+    def test_compile(self):
+        self.assertSameSchema(self.schema)
+
+    def test_save_and_load(self):
+        self.schema.save(self.path)
+        self.assertSameSchema(blpapi.CompiledSchema.load(self.path))
+
+    def test_pickle(self):
+        self.assertSameSchema(pickle.loads(pickle.dumps(self.schema)))
+
+    def test_load_of_another_file(self):
+        with open(self.path, "wb") as stream:
+            pickle.dump(self.schema, stream)
+        with self.assertRaises(ValueError):
+            blpapi.CompiledSchema.load(self.path)
+        with open(self.path, "wb") as stream:
+            stream.write(b'{"format": "other"}')
+        with self.assertRaises(ValueError):
+            blpapi.CompiledSchema.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,99 @@
+# test_correlationregistry.py
+
+"""Test the routing of messages by the 'CorrelationRegistry' class."""
+
+from __future__ import absolute_import
+
+import unittest
+
+try:
+    import blpapi
+    from blpapi import CorrelationId
+except ImportError:
+    blpapi = None
+
+
+class _Message(object):
+    """A message with correlation ids of the specified '(type, classId,
+    value)'s."""
+
+    def __init__(self, *values):
+        self.__values = values
+
+    def correlationIdValues(self):
+        return self.__values
+
+
+def _values(correlationId):
+    """Return the '(type, classId, value)' of the specified
+    'correlationId'."""
+    return (correlationId.type(),
+            correlationId.classId(),
+            correlationId.value())
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestCorrelationRegistry(unittest.TestCase):
+
+    def test_route(self):
+        registry = blpapi.CorrelationRegistry(base=10, classId=3)
+        first = registry.register("first")
+        second = registry.register("second")
+        self.assertEqual(
+            registry.route(_Message(_values(second), _values(first))),
+            ["second", "first"])
+        self.assertEqual(registry.get(first), "first")
+
+    def test_route_skips_other_class_ids(self):
+        registry = blpapi.CorrelationRegistry(classId=3)
+        correlationId = registry.register("object")
+        other = CorrelationId(correlationId.value(), 4)
+        self.assertEqual(registry.route(_Message(_values(other))), [])
+        self.assertIsNone(registry.get(other))
+
+    def test_route_skips_autogenerated_ids(self):
+        # An auto-generated correlation id can have the value of a
+        # registered one.
+        registry = blpapi.CorrelationRegistry()
+        correlationId = registry.register("object")
+        autogen = (CorrelationId.AUTOGEN_TYPE, 0, correlationId.value())
+        self.assertEqual(registry.route(_Message(autogen)), [])
+
+    def test_route_skips_pointer_ids(self):
+        registry = blpapi.CorrelationRegistry()
+        registry.register("object")
+        pointer = CorrelationId(object())
+        self.assertEqual(registry.route(_Message(_values(pointer))), [])
+
+    def test_unregister(self):
+        registry = blpapi.CorrelationRegistry()
+        correlationId = registry.register("object")
+        self.assertEqual(registry.unregister(correlationId), "object")
+        self.assertEqual(registry.route(_Message(_values(correlationId))),
+                         [])
+        self.assertEqual(len(registry), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,172 @@
+# test_entitlementfanout.py
+
+"""Test the 'EntitlementFanout' class with fake identities."""
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+try:
+    import blpapi
+    from blpapi import Event
+except ImportError:
+    blpapi = None
+
+SERVICE = "//blp/mktdata"
+
+
+class _Identity(object):
+    """An identity entitled to the specified 'eids', and authorized for
+    'SERVICE' if 'authorized'."""
+
+    def __init__(self, eids, authorized=True):
+        self.eids = set(eids)
+        self.authorized = authorized
+        self.checks = 0
+
+    def isAuthorized(self, service):
+        return self.authorized and service == SERVICE
+
+    def getFailedEntitlements(self, service, eids):
+        # pylint: disable=unused-argument
+        self.checks += 1
+        failed = [eid for eid in eids if eid not in self.eids]
+        return not failed, failed
+
+    def hasEntitlements(self, service, eids):
+        # pylint: disable=unused-argument
+        return all(eid in self.eids for eid in eids)
+
+
+class _HookedList(list):
+    """A list calling the specified 'hook' before each indexing."""
+
+    def __init__(self, values, hook):
+        list.__init__(self, values)
+        self.__hook = hook
+
+    def __getitem__(self, index):
+        self.__hook()
+        return list.__getitem__(self, index)
+
+
+class _Message(object):
+    def __init__(self, correlationId):
+        self.__correlationId = correlationId
+
+    def correlationIds(self):
+        return [self.__correlationId]
+
+
+class _Event(object):
+    def __init__(self, eventType, messages):
+        self.__eventType = eventType
+        self.__messages = messages
+
+    def eventType(self):
+        return self.__eventType
+
+    def __iter__(self):
+        return iter(self.__messages)
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestEntitlementFanout(unittest.TestCase):
+
+    def test_subscribers(self):
+        fanout = blpapi.EntitlementFanout(SERVICE)
+        fanout.addSubscriber("a", _Identity([1, 2]))
+        fanout.addSubscriber("b", _Identity([2, 3]))
+        fanout.addSubscriber("c", _Identity([1, 2, 3], authorized=False))
+        self.assertEqual(fanout.subscribers([2]), ["a", "b"])
+        self.assertEqual(fanout.subscribers([1, 2]), ["a"])
+        self.assertEqual(fanout.subscribers([1, 3]), [])
+        self.assertEqual(fanout.subscribers([]), ["a", "b"])
+        self.assertEqual(fanout.entitledMask([3]), 2)
+        self.assertEqual(len(fanout), 3)
+
+    def test_eids_are_checked_once(self):
+        fanout = blpapi.EntitlementFanout(SERVICE)
+        identity = _Identity([1])
+        fanout.addSubscriber("a", identity)
+        for _ in range(3):
+            self.assertEqual(fanout.subscribers([1, 2]), [])
+            self.assertEqual(fanout.subscribers([1]), ["a"])
+        self.assertEqual(identity.checks, 1)
+
+    def test_reused_bit_is_not_entitled(self):
+        fanout = blpapi.EntitlementFanout(SERVICE)
+        fanout.addSubscriber("a", _Identity([1]))
+        self.assertEqual(fanout.subscribers([1]), ["a"])
+        self.assertTrue(fanout.removeSubscriber("a"))
+        self.assertFalse(fanout.removeSubscriber("a"))
+        fanout.addSubscriber("b", _Identity([2]))
+        self.assertEqual(fanout.subscribers([1]), [])
+        self.assertEqual(fanout.subscribers([2]), ["b"])
+        self.assertNotIn("a", fanout)
+
+    def test_authorization_status(self):
+        fanout = blpapi.EntitlementFanout(SERVICE)
+        identity = _Identity([1])
+        fanout.addSubscriber("a", identity, correlationId=7)
+        self.assertEqual(fanout.subscribers([1]), ["a"])
+        identity.eids = set()
+        fanout.processEvent(_Event(Event.SUBSCRIPTION_DATA, [_Message(7)]))
+        self.assertEqual(fanout.subscribers([1]), ["a"])
+        fanout.processEvent(_Event(Event.AUTHORIZATION_STATUS,
+                                   [_Message(7)]))
+        self.assertEqual(fanout.subscribers([1]), [])
+
+    def test_concurrent_removal(self):
+        # A subscriber is removed, and its bit given to a subscriber which
+        # is not entitled, while the bits of the entitled subscribers are
+        # mapped to subscribers: the result must be the subscribers before,
+        # or after, the change.
+        fanout = blpapi.EntitlementFanout(SERVICE)
+        fanout.addSubscriber("a", _Identity([1]))
+        self.assertEqual(fanout.subscribers([1]), ["a"])
+
+        def change():
+            fanout.removeSubscriber("a")
+            fanout.addSubscriber("b", _Identity([]))
+
+        thread = threading.Thread(target=change)
+
+        def hook():
+            if not thread.ident:
+                thread.start()
+                thread.join(0.2)
+
+        # pylint: disable=protected-access
+        attribute = "_EntitlementFanout__subscribers"
+        setattr(fanout, attribute,
+                _HookedList(getattr(fanout, attribute), hook))
+        self.assertEqual(fanout.subscribers([1]), ["a"])
+        thread.join()
+        self.assertEqual(fanout.subscribers([1]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
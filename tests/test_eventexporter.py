@@ -0,0 +1,127 @@
+# test_eventexporter.py
+
+"""Test the 'EventExporter' class with fake events."""
+
+from __future__ import absolute_import
+
+import io
+import json
+import struct
+import unittest
+
+try:
+    import blpapi
+    from blpapi import CorrelationId, Event
+except ImportError:
+    blpapi = None
+
+
+class _Message(object):
+    def __init__(self, correlationIds, data=b'{"lastPrice":1.5}'):
+        self.__correlationIds = correlationIds
+        self.__data = data
+
+    def correlationIdValues(self):
+        return self.__correlationIds
+
+    def messageType(self):
+        return "MarketDataEvents"
+
+    def topicName(self):
+        return "IBM US Equity"
+
+    def toJSON(self, datetimeFormat, includeNulls):
+        # pylint: disable=unused-argument
+        return self.__data
+
+
+class _Event(object):
+    def __init__(self, messages):
+        self.__messages = messages
+
+    def eventType(self):
+        return Event.SUBSCRIPTION_DATA
+
+    def __iter__(self):
+        return iter(self.__messages)
+
+
+class _FailingOutput(object):
+    def write(self, data):
+        raise ValueError("write to a closed file")
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestEventExporter(unittest.TestCase):
+
+    def event(self):
+        return _Event([_Message(((CorrelationId.INT_TYPE, 0, 7),
+                                 (CorrelationId.AUTOGEN_TYPE, 0, 8),
+                                 (CorrelationId.POINTER_TYPE, 0, "obj")))])
+
+    def test_ndjson(self):
+        output = io.BytesIO()
+        exporter = blpapi.EventExporter(output)
+        self.assertTrue(exporter.exportEvent(self.event()))
+        exporter.close()
+        lines = output.getvalue().split(b"\n")
+        self.assertEqual(lines[1:], [b""])
+        record = json.loads(lines[0].decode("utf-8"))
+        self.assertEqual(record, {"eventType": "SUBSCRIPTION_DATA",
+                                  "messageType": "MarketDataEvents",
+                                  "topic": "IBM US Equity",
+                                  "correlationIds": [7, 8, "obj"],
+                                  "data": {"lastPrice": 1.5}})
+        self.assertEqual(exporter.stats()["messages"], 1)
+
+    def test_binary(self):
+        output = io.BytesIO()
+        exporter = blpapi.EventExporter(output, format="binary")
+        exporter.exportEvent(self.event())
+        exporter.exportEvent(self.event())
+        exporter.close()
+        data = output.getvalue()
+        records = []
+        while data:
+            length = struct.unpack(">I", data[:4])[0]
+            records.append(json.loads(data[4:4 + length].decode("utf-8")))
+            data = data[4 + length:]
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0], records[1])
+
+    def test_text_output_is_rejected(self):
+        with self.assertRaises(TypeError):
+            blpapi.EventExporter(io.StringIO())
+
+    def test_write_failure_is_raised(self):
+        exporter = blpapi.EventExporter(_FailingOutput())
+        exporter.exportEvent(self.event())
+        self.assertFalse(exporter.flush(5))
+        with self.assertRaises(IOError):
+            exporter.exportEvent(self.event())
+        exporter.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
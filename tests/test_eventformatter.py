@@ -0,0 +1,124 @@
+# test_eventformatter.py
+
+"""Test the 'PublishPlan' class and the columns of
+'EventFormatter.appendMessagesFromColumns' with fake setters."""
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import blpapi
+    from blpapi import EventFormatter, PublishPlan
+except ImportError:
+    blpapi = None
+
+
+class _Formatter(object):
+    """A fake 'EventFormatter' whose handle is a dict of the set values."""
+
+    def __init__(self):
+        self.values = {}
+
+    def _handle(self):
+        return self.values
+
+
+def _set(handle, name, nameHandle, value):
+    # pylint: disable=unused-argument
+    handle[nameHandle] = value
+    return 0
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestPublishPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.plan = PublishPlan(("BID", "ASK"),
+                                (),
+                                ((_set, "bid", None), (_set, "ask", float)))
+
+    def test_fill_sequence(self):
+        formatter = _Formatter()
+        self.plan.fill(formatter, (1.5, 2))
+        self.assertEqual(formatter.values, {"bid": 1.5, "ask": 2.0})
+        with self.assertRaises(ValueError):
+            self.plan.fill(_Formatter(), (1.5,))
+
+    def test_fill_mapping(self):
+        formatter = _Formatter()
+        self.plan.fill(formatter, {"ASK": 2})
+        self.assertEqual(formatter.values, {"ask": 2.0})
+
+    def test_fill_unknown_field(self):
+        formatter = _Formatter()
+        with self.assertRaises(ValueError) as context:
+            self.plan.fill(formatter, {"BID": 1.5, "LAST": 2})
+        self.assertIn("LAST", str(context.exception))
+        self.assertEqual(formatter.values, {})
+
+
+@unittest.skipIf(blpapi is None or numpy is None,
+                 "the blpapi extension is not built, or numpy is missing")
+class TestColumns(unittest.TestCase):
+
+    @staticmethod
+    def columnValues(column):
+        """Return the values, mask and traits of the specified 'column'."""
+        # pylint: disable=protected-access
+        return EventFormatter._EventFormatter__columnValues(column)
+
+    def test_datetime64(self):
+        column = numpy.array(["2020-01-02T03:04:05.123456789", "NaT"],
+                             dtype="datetime64[ns]")
+        values, mask, traits = self.columnValues(column)
+        self.assertEqual(values,
+                         [datetime.datetime(2020, 1, 2, 3, 4, 5, 123456),
+                          None])
+        self.assertIsNone(mask)
+        self.assertIsNotNone(traits)
+
+    def test_datetime64_days(self):
+        column = numpy.array(["2020-01-02"], dtype="datetime64[D]")
+        values, _, _ = self.columnValues(column)
+        self.assertEqual(values, [datetime.date(2020, 1, 2)])
+
+    def test_masked_datetime64(self):
+        column = numpy.ma.masked_array(
+            numpy.array(["2020-01-02T03:04:05", "2020-01-03T03:04:05"],
+                        dtype="datetime64[ns]"),
+            mask=[False, True])
+        values, mask, _ = self.columnValues(column)
+        self.assertEqual(values[0], datetime.datetime(2020, 1, 2, 3, 4, 5))
+        self.assertEqual(mask, [False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
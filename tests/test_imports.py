@@ -0,0 +1,99 @@
+# test_imports.py
+
+"""Check that every public name and submodule of the 'blpapi' package can be
+the first one accessed by a new interpreter."""
+
+from __future__ import absolute_import
+
+import subprocess
+import sys
+import unittest
+
+try:
+    import blpapi
+except ImportError:
+    blpapi = None
+
+
+def _run(code):
+    """Run the specified 'code' in a new interpreter and return its exit
+    status and output."""
+    process = subprocess.Popen([sys.executable, "-c", code],
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT)
+    output = process.communicate()[0]
+    return process.returncode, output.decode("utf-8", "replace")
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestImports(unittest.TestCase):
+    """Import smoke tests, each in a new interpreter as the modules which
+    are already imported hide import cycles."""
+
+    def assertRuns(self, code):
+        """Assert that the specified 'code' runs successfully."""
+        status, output = _run(code)
+        self.assertEqual(status, 0, "{0!r} failed:\n{1}".format(code, output))
+
+    def test_public_names_first_access(self):
+        for name in blpapi.__all__:
+            self.assertRuns("import blpapi; blpapi.{0}".format(name))
+
+    def test_public_names_from_import(self):
+        for name in blpapi.__all__:
+            self.assertRuns("from blpapi import {0}".format(name))
+
+    def test_submodules_first_import(self):
+        # pylint: disable=protected-access
+        for module in sorted(blpapi._SUBMODULES):
+            self.assertRuns("import blpapi.{0}".format(module))
+            self.assertRuns("import blpapi; blpapi.{0}".format(module))
+
+    def test_star_import(self):
+        self.assertRuns("from blpapi import *; Event; Session; Message")
+
+    def test_unknown_attribute(self):
+        self.assertRuns(
+            "import sys, blpapi\n"
+            "before = set(sys.modules)\n"
+            "assert not hasattr(blpapi, 'NoSuchClass')\n"
+            "assert not hasattr(blpapi, 'nosuchmodule')\n"
+            "assert set(sys.modules) == before\n")
+
+    def test_import_error_is_propagated(self):
+        # A submodule which fails to import raises 'ImportError', not
+        # 'AttributeError'.
+        self.assertRuns(
+            "import sys, blpapi\n"
+            "sys.modules['blpapi.testtools'] = None\n"
+            "try:\n"
+            "    blpapi.testtools\n"
+            "except ImportError:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise AssertionError('no ImportError')\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
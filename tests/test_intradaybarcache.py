@@ -0,0 +1,110 @@
+# test_intradaybarcache.py
+
+"""Test the storage and the request windows of the 'IntradayBarCache'
+class."""
+
+from __future__ import absolute_import
+
+import array
+import io
+import unittest
+
+try:
+    import blpapi
+    # pylint: disable=protected-access
+    from blpapi import intradaybarcache
+except ImportError:
+    blpapi = None
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestBarSeries(unittest.TestCase):
+
+    def test_round_trip(self):
+        # pylint: disable=protected-access
+        series = intradaybarcache._BarSeries()
+        columns = blpapi.IntradayBarCache.COLUMNS
+        rows = [(60.0 * index,) + tuple(float(index * 10 + column)
+                                        for column in range(1, len(columns)))
+                for index in range(5)]
+        series.replace(0, 300, rows)
+        series.addCovered(0, 300)
+        series.addCovered(600, 900)
+
+        stream = io.BytesIO()
+        series.write(stream)
+        stream.seek(0)
+        loaded = intradaybarcache._BarSeries.read(stream)
+        self.assertEqual(loaded.covered, [(0, 300), (600, 900)])
+        for column in columns:
+            self.assertEqual(loaded.columns[column], series.columns[column])
+            self.assertIsInstance(loaded.columns[column], array.array)
+
+    def test_other_formats_are_rejected(self):
+        # pylint: disable=protected-access
+        for data in (b"\x80\x04\x95", b"BLPAPI-BARS 1\n"
+                     b'{"covered": [], "bars": 2}\n' + b"\0" * 8):
+            with self.assertRaises(ValueError):
+                intradaybarcache._BarSeries.read(io.BytesIO(data))
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestWindows(unittest.TestCase):
+
+    def test_align_range(self):
+        # pylint: disable=protected-access
+        self.assertEqual(intradaybarcache._alignRange(330, 3570, 5),
+                         (300, 3600))
+        self.assertEqual(intradaybarcache._alignRange(300, 3600, 5),
+                         (300, 3600))
+
+    def test_windows_are_aligned_to_the_interval(self):
+        # pylint: disable=protected-access
+        day = 86400
+        start, end = intradaybarcache._alignRange(3600, 2 * day + 7200, 7)
+        windows = intradaybarcache._splitRanges([(start, end)], day, 7)
+        self.assertEqual(windows[0][0], start)
+        self.assertEqual(windows[-1][1], end)
+        for (_, end), (start, _) in zip(windows, windows[1:]):
+            self.assertEqual(end, start)
+        for start, end in windows:
+            self.assertEqual(start % 420, 0)
+            self.assertEqual(end % 420, 0)
+            self.assertLessEqual(end - start, day)
+
+    def test_span_shorter_than_interval(self):
+        # pylint: disable=protected-access
+        self.assertEqual(
+            intradaybarcache._splitRanges([(0, 7200)], 60, 60),
+            [(0, 3600), (3600, 7200)])
+
+    def test_overlapping_ranges(self):
+        # pylint: disable=protected-access
+        self.assertEqual(
+            intradaybarcache._splitRanges([(0, 600), (300, 900)], 3600, 5),
+            [(0, 600), (600, 900)])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,91 @@
+# test_metricexporter.py
+
+"""Test the 'PrometheusTextfileExporter' and 'StatsdExporter' classes."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+
+try:
+    import blpapi
+    from blpapi import PrometheusTextfileExporter, StatsdExporter
+except ImportError:
+    blpapi = None
+
+METRICS = [("live", {}, True),
+           ("count", {"class": "Message"}, 12),
+           ("seconds", {}, 0.5),
+           ("max", {}, float("inf"))]
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestPrometheusTextfileExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "test.prom")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_values(self):
+        PrometheusTextfileExporter(self.path, prefix="test_")(METRICS)
+        with open(self.path) as stream:
+            lines = stream.read().splitlines()
+        self.assertEqual(lines, ["# TYPE test_live gauge",
+                                 "test_live 1",
+                                 "# TYPE test_count gauge",
+                                 'test_count{class="Message"} 12',
+                                 "# TYPE test_seconds gauge",
+                                 "test_seconds 0.5",
+                                 "# TYPE test_max gauge",
+                                 "test_max +Inf"])
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestStatsdExporter(unittest.TestCase):
+
+    def test_values(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        exporter = StatsdExporter("127.0.0.1", server.getsockname()[1],
+                                  prefix="test.")
+        try:
+            exporter(METRICS[:3])
+            packet = server.recv(65536).decode("ascii")
+        finally:
+            exporter.close()
+            server.close()
+        self.assertEqual(packet.splitlines(), ["test.live:1|g",
+                                               "test.count.Message:12|g",
+                                               "test.seconds:0.5|g"])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
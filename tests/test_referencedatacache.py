@@ -0,0 +1,114 @@
+# test_referencedatacache.py
+
+"""Test the 'ReferenceDataCache' class with a fake session."""
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+try:
+    import blpapi
+except ImportError:
+    blpapi = None
+
+
+class _Session(object):
+    """A session whose 'openService()' raises the specified 'error', or
+    fails if 'error' is 'None'."""
+
+    def __init__(self, error=None):
+        self.error = error
+
+    def openService(self, serviceName):
+        # pylint: disable=unused-argument
+        if self.error is not None:
+            raise self.error  # pylint: disable=raising-bad-type
+        return False
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestReferenceDataCache(unittest.TestCase):
+
+    def get(self, cache):
+        """Return the result, or the exception, of a lookup made by
+        'cache' in another thread, failing if it does not complete."""
+        outcome = []
+
+        def lookup():
+            try:
+                outcome.append(cache.get(["IBM US Equity"], ["PX_LAST"]))
+            except BaseException as error:  # pylint: disable=broad-except
+                outcome.append(error)
+
+        thread = threading.Thread(target=lookup)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "the lookup did not complete")
+        return outcome[0]
+
+    def test_failed_request(self):
+        cache = blpapi.ReferenceDataCache(_Session())
+        self.assertIsInstance(self.get(cache), RuntimeError)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_duplicate_securities_and_fields(self):
+        cache = blpapi.ReferenceDataCache(_Session())
+        outcome = []
+
+        def lookup():
+            try:
+                cache.get(["IBM US Equity", "IBM US Equity"],
+                          ["PX_LAST", "CRNCY", "PX_LAST"])
+            except BaseException as error:  # pylint: disable=broad-except
+                outcome.append(error)
+
+        thread = threading.Thread(target=lookup)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "the lookup did not complete")
+        self.assertIsInstance(outcome[0], RuntimeError)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+        # No key is left in flight.
+        self.assertIsInstance(self.get(cache), RuntimeError)
+        self.assertEqual(cache.stats()["coalesced"], 0)
+
+    def test_interrupted_request(self):
+        session = _Session(KeyboardInterrupt())
+        cache = blpapi.ReferenceDataCache(session)
+        self.assertIsInstance(self.get(cache), KeyboardInterrupt)
+
+        # The interrupted request is no longer in flight, so the next
+        # lookup sends its own instead of waiting forever.
+        session.error = None
+        self.assertIsInstance(self.get(cache), RuntimeError)
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(cache.stats()["coalesced"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,185 @@
+# test_requesttracer.py
+
+"""Test the 'RequestTracer' class with fake sessions and events."""
+
+from __future__ import absolute_import
+
+import itertools
+import unittest
+
+try:
+    import blpapi
+    from blpapi import CorrelationId, Event
+except ImportError:
+    blpapi = None
+
+
+class _Element(object):
+    def __init__(self, name):
+        self.__name = name
+
+    def name(self):
+        return self.__name
+
+
+class _Request(object):
+    def asElement(self):
+        return _Element("HistoricalDataRequest")
+
+
+class _Message(object):
+    def __init__(self, correlationId, messageType="HistoricalDataResponse"):
+        self.__correlationId = correlationId
+        self.__messageType = messageType
+
+    def numElements(self):
+        return 1
+
+    def correlationIds(self):
+        return [self.__correlationId]
+
+    def messageType(self):
+        return self.__messageType
+
+
+class _Event(object):
+    def __init__(self, eventType, messages):
+        self.__eventType = eventType
+        self.__messages = messages
+
+    def eventType(self):
+        return self.__eventType
+
+    def __iter__(self):
+        return iter(self.__messages)
+
+
+class _Session(object):
+    """A session which, like 'Session.sendRequest()', generates the
+    correlation id of a request sent without a set one and returns it, and
+    can deliver responses before 'sendRequest()' returns."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, deliverEarly=None):
+        self.deliverEarly = deliverEarly
+
+    def sendRequest(self, request, identity=None, correlationId=None,
+                    eventQueue=None, requestLabel=""):
+        # pylint: disable=unused-argument,too-many-arguments
+        if correlationId is None \
+                or correlationId.type() == CorrelationId.UNSET_TYPE:
+            correlationId = CorrelationId(next(self._ids) + 1000000)
+        if self.deliverEarly is not None:
+            self.deliverEarly(correlationId)
+        return correlationId
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestRequestTracer(unittest.TestCase):
+
+    def test_autogenerated_correlation_id(self):
+        tracer = blpapi.RequestTracer()
+        correlationId = tracer.sendRequest(_Session(), _Request())
+        self.assertEqual([trace.correlationId for trace in tracer.active()],
+                         [correlationId])
+        self.assertIsNotNone(tracer.active()[0].submitEnd)
+
+        tracer.processEvent(_Event(Event.PARTIAL_RESPONSE,
+                                   [_Message(correlationId)]))
+        tracer.processEvent(_Event(Event.RESPONSE,
+                                   [_Message(correlationId)]))
+        self.assertEqual(tracer.active(), [])
+        traces = tracer.traces()
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(traces[0].correlationId, correlationId)
+        summary = traces[0].summary()
+        self.assertEqual(summary["partialResponses"], 1)
+        self.assertEqual(summary["messages"], 2)
+        self.assertEqual(summary["name"], "HistoricalDataRequest")
+
+    def test_unset_correlation_id(self):
+        tracer = blpapi.RequestTracer()
+        correlationId = tracer.sendRequest(_Session(), _Request(),
+                                           correlationId=CorrelationId())
+        self.assertNotEqual(correlationId.type(), CorrelationId.UNSET_TYPE)
+        tracer.processEvent(_Event(Event.RESPONSE,
+                                   [_Message(correlationId)]))
+        self.assertEqual(tracer.active(), [])
+        self.assertEqual(len(tracer.traces()), 1)
+
+    def test_response_before_send_returns(self):
+        completed = []
+        tracer = blpapi.RequestTracer(onComplete=completed.append)
+
+        def deliverEarly(correlationId):
+            tracer.processEvent(_Event(Event.PARTIAL_RESPONSE,
+                                       [_Message(correlationId)]))
+            tracer.processEvent(_Event(Event.RESPONSE,
+                                       [_Message(correlationId)]))
+
+        correlationId = tracer.sendRequest(_Session(deliverEarly),
+                                           _Request())
+        self.assertEqual(tracer.active(), [])
+        self.assertEqual(len(completed), 1)
+        trace = completed[0]
+        self.assertEqual(trace.correlationId, correlationId)
+        self.assertEqual(len(trace.responses), 2)
+        self.assertLessEqual(trace.submitEnd, trace.firstResponse())
+
+    def test_untraced_responses_are_discarded(self):
+        tracer = blpapi.RequestTracer()
+        other = CorrelationId(42)
+
+        def deliverEarly(correlationId):
+            # pylint: disable=unused-argument
+            tracer.processEvent(_Event(Event.RESPONSE, [_Message(other)]))
+
+        tracer.sendRequest(_Session(deliverEarly), _Request())
+        tracer.begin(other, "other")
+        self.assertEqual(len(tracer.active()), 2)
+        tracer.processEvent(_Event(Event.REQUEST_STATUS,
+                                   [_Message(other, "RequestFailure")]))
+        self.assertEqual(len(tracer.active()), 1)
+        self.assertEqual(tracer.traces()[0].error, "RequestFailure")
+        self.assertEqual(len(tracer.traces()[0].responses), 1)
+
+    def test_failed_send(self):
+        class FailingSession(object):
+            def sendRequest(self, *args):
+                raise blpapi.InvalidStateException("not started", 0)
+
+        tracer = blpapi.RequestTracer()
+        with self.assertRaises(blpapi.InvalidStateException):
+            tracer.sendRequest(FailingSession(), _Request())
+        self.assertEqual(tracer.active(), [])
+
+    def test_begin_requires_set_correlation_id(self):
+        tracer = blpapi.RequestTracer()
+        with self.assertRaises(ValueError):
+            tracer.begin(CorrelationId(), "request")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,170 @@
+# test_sessionmetrics.py
+
+"""Test the 'Histogram' and 'SessionMetrics' classes, and the recording of
+dispatched events by the sessions."""
+
+from __future__ import absolute_import
+
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    mock = None
+
+try:
+    import blpapi
+    from blpapi import Event, SessionMetrics
+    from blpapi.sessionmetrics import Histogram
+except ImportError:
+    blpapi = None
+
+
+class _Event(object):
+    def __init__(self, handle, session):
+        # pylint: disable=unused-argument
+        self.__eventType = handle
+
+    def eventType(self):
+        return self.__eventType
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestHistogram(unittest.TestCase):
+
+    def test_empty(self):
+        histogram = Histogram()
+        self.assertEqual(histogram.count(), 0)
+        self.assertEqual(histogram.quantile(0.5), 0.0)
+        self.assertEqual(histogram.snapshot()["max"], 0.0)
+
+    def test_quantiles(self):
+        histogram = Histogram(bounds=(1, 2, 4))
+        for value in (0.5, 1.5, 1.5, 3, 10):
+            histogram.record(value)
+        self.assertEqual(histogram.count(), 5)
+        self.assertEqual(histogram.sum(), 16.5)
+        self.assertEqual(histogram.buckets(),
+                         [(1, 1), (2, 3), (4, 4), (float("inf"), 5)])
+        self.assertEqual(histogram.quantile(0.5), 2)
+        self.assertEqual(histogram.quantile(1), 10)
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestSessionMetrics(unittest.TestCase):
+
+    def test_snapshot(self):
+        metrics = SessionMetrics("test")
+        metrics.recordDispatch(Event.SUBSCRIPTION_DATA, metrics.clock())
+        metrics.recordNextEvent(Event.RESPONSE, metrics.clock())
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["events"],
+                         {"SUBSCRIPTION_DATA": 1, "RESPONSE": 1})
+        self.assertEqual(snapshot["handler"]["count"], 1)
+        self.assertEqual(snapshot["nextEvent"]["count"], 1)
+        self.assertEqual(snapshot["publish"]["count"], 0)
+
+        metrics.reset()
+        self.assertEqual(metrics.events(), {})
+
+    def test_timeout_is_not_recorded(self):
+        metrics = SessionMetrics()
+        metrics.recordNextEvent(Event.TIMEOUT, metrics.clock() - 1)
+        self.assertEqual(metrics.events(), {})
+        self.assertEqual(metrics.snapshot()["nextEvent"]["count"], 0)
+
+    def test_metrics(self):
+        metrics = SessionMetrics("test")
+        metrics.recordPublish(metrics.clock())
+        values = dict(((name, tuple(sorted(labels.items()))), value)
+                      for name, labels, value in metrics.metrics())
+        self.assertEqual(
+            values[("session_publish_seconds_count",
+                    (("session", "test"),))],
+            1)
+        self.assertEqual(
+            values[("session_publish_seconds_bucket",
+                    (("le", "+Inf"), ("session", "test")))],
+            1)
+
+
+@unittest.skipIf(blpapi is None or mock is None,
+                 "the blpapi extension is not built, or mock is missing")
+class TestDispatchMetrics(unittest.TestCase):
+    """The event handler of a session is called by the dispatch function of
+    its class, which is called here with a fake session."""
+
+    def dispatch(self, sessionClass, handler):
+        """Dispatch a 'SUBSCRIPTION_DATA' event to the specified 'handler'
+        of a fake session of the specified 'sessionClass', and return the
+        metrics of the session and whether the process would have
+        exited."""
+        metrics = SessionMetrics()
+        name = sessionClass.__name__
+        session = mock.Mock(spec=["metrics"])
+        session.metrics.return_value = metrics
+        setattr(session, "_{0}__handler".format(name), handler)
+        dispatch = getattr(sessionClass, "_{0}__dispatchEvent".format(name))
+        module = sessionClass.__module__
+        with mock.patch(module + ".Event", _Event), \
+                mock.patch(module + ".os._exit") as exit_, \
+                mock.patch(module + ".traceback.print_exc"):
+            dispatch(lambda: session, Event.SUBSCRIPTION_DATA)
+        return metrics, exit_.called
+
+    def test_dispatch(self):
+        for sessionClass in (blpapi.Session, blpapi.ProviderSession):
+            metrics, exited = self.dispatch(sessionClass,
+                                            lambda event, session: None)
+            self.assertFalse(exited)
+            self.assertEqual(metrics.events(), {"SUBSCRIPTION_DATA": 1})
+            self.assertEqual(metrics.snapshot()["handler"]["count"], 1)
+
+    def test_dispatch_of_a_raising_handler(self):
+        def handler(event, session):
+            raise ValueError("handler failed")
+
+        for sessionClass in (blpapi.Session, blpapi.ProviderSession):
+            metrics, exited = self.dispatch(sessionClass, handler)
+            self.assertTrue(exited)
+            self.assertEqual(metrics.events(), {"SUBSCRIPTION_DATA": 1})
+            self.assertEqual(metrics.snapshot()["handler"]["count"], 1)
+
+    def test_publish_which_raises(self):
+        metrics = SessionMetrics()
+        session = mock.Mock(spec=["metrics"])
+        session.metrics.return_value = metrics
+        session._ProviderSession__handle = None
+        module = blpapi.ProviderSession.__module__
+        with mock.patch(module + ".internals"), \
+                mock.patch(module + ".get_handle"), \
+                mock.patch(module + "._ExceptionUtil.raiseOnError",
+                           side_effect=ValueError("publish failed")):
+            with self.assertRaises(ValueError):
+                blpapi.ProviderSession.publish(session, None)
+        self.assertEqual(metrics.snapshot()["publish"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,109 @@
+# test_topiclist.py
+
+"""Test the bulk construction and the whole-list queries of the 'TopicList'
+and 'ResolutionList' classes, and the bulk construction of the
+'SubscriptionList' class."""
+
+from __future__ import absolute_import
+
+import unittest
+
+try:
+    import blpapi
+    from blpapi import CorrelationId
+except ImportError:
+    blpapi = None
+
+TOPICS = ["//blp/mktdata/ticker/IBM US Equity",
+          "//blp/mktdata/ticker/MSFT US Equity"]
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestAddMany(unittest.TestCase):
+    """Tests run on both list classes."""
+
+    @staticmethod
+    def lists():
+        """Return each list class with the status of a new entry."""
+        return ((blpapi.TopicList, blpapi.TopicList.NOT_CREATED),
+                (blpapi.ResolutionList, blpapi.ResolutionList.UNRESOLVED))
+
+    def test_from_topics(self):
+        for listClass, initialStatus in self.lists():
+            correlationIds = [CorrelationId(1), CorrelationId(2)]
+            topicList = listClass.fromTopics(TOPICS, correlationIds)
+            self.assertEqual(topicList.size(), 2)
+            self.assertEqual(topicList.correlationIds(), correlationIds)
+            self.assertEqual(len(topicList.topicStrings()), 2)
+            self.assertEqual(list(topicList.statuses()),
+                             [initialStatus] * 2)
+
+    def test_invalid_correlation_id_adds_nothing(self):
+        for listClass, _ in self.lists():
+            topicList = listClass()
+            with self.assertRaises(TypeError):
+                topicList.addMany(TOPICS, [CorrelationId(1), 2])
+            self.assertEqual(topicList.size(), 0)
+
+    def test_length_mismatch_adds_nothing(self):
+        for listClass, _ in self.lists():
+            topicList = listClass()
+            with self.assertRaises(ValueError):
+                topicList.addMany(TOPICS, [CorrelationId(1)])
+            self.assertEqual(topicList.size(), 0)
+
+    def test_generated_correlation_ids(self):
+        for listClass, _ in self.lists():
+            topicList = listClass()
+            self.assertEqual(topicList.addMany(iter(TOPICS)), 2)
+            self.assertEqual(len(set(topicList.correlationIds())), 2)
+
+
+@unittest.skipIf(blpapi is None, "the blpapi extension is not built")
+class TestSubscriptionListAddMany(unittest.TestCase):
+
+    def test_add_many(self):
+        subscriptions = blpapi.SubscriptionList()
+        correlationIds = [CorrelationId(1), CorrelationId(2)]
+        self.assertEqual(
+            subscriptions.addMany(TOPICS, "LAST_PRICE", None, correlationIds),
+            2)
+        self.assertEqual(subscriptions.size(), 2)
+        self.assertEqual(subscriptions.correlationIdAt(1), correlationIds[1])
+
+    def test_invalid_correlation_id_adds_nothing(self):
+        subscriptions = blpapi.SubscriptionList()
+        with self.assertRaises(TypeError):
+            subscriptions.addMany(TOPICS, correlationIds=[CorrelationId(1), 2])
+        self.assertEqual(subscriptions.size(), 0)
+
+    def test_length_mismatch_adds_nothing(self):
+        subscriptions = blpapi.SubscriptionList()
+        with self.assertRaises(ValueError):
+            subscriptions.addMany(TOPICS, correlationIds=[CorrelationId(1)])
+        self.assertEqual(subscriptions.size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2012. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""